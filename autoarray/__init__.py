@@ -12,6 +12,8 @@ from .dataset.interferometer import SettingsInterferometer
 from .dataset.interferometer import SimulatorInterferometer
 from .fit.fit import FitImaging
 from .fit.fit import FitInterferometer
+from .fit.fit import FitImagingScalar
+from .fit.fit import FitInterferometerScalar
 from .instruments import acs
 from .instruments import euclid
 from .inversion import pixelizations as pix
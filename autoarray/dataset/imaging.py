@@ -29,6 +29,7 @@ class SettingsImaging(abstract_dataset.AbstractSettingsDataset):
         signal_to_noise_limit=None,
         signal_to_noise_limit_radii=None,
         use_normalized_psf=True,
+        convolver_cache_path=None,
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, PSF), a mask, grid, convolver \
@@ -63,6 +64,10 @@ class SettingsImaging(abstract_dataset.AbstractSettingsDataset):
         psf_shape_2d : (int, int)
             The shape of the PSF used for convolving model image generated using analytic light profiles. A smaller \
             shape will trim the PSF relative to the input image PSF, giving a faster analysis run-time.
+        convolver_cache_path : str or None
+            If input, the frames of the `Convolver` are stored in this directory and loaded from it whenever a
+            `Convolver` is created for the same mask and PSF, for example by every process of a parallel search (see
+            `Convolver.frames_via_cache_from`).
         """
 
         super().__init__(
@@ -78,6 +83,7 @@ class SettingsImaging(abstract_dataset.AbstractSettingsDataset):
         )
 
         self.use_normalized_psf = use_normalized_psf
+        self.convolver_cache_path = convolver_cache_path
 
 
 class Imaging(abstract_dataset.AbstractDataset):
@@ -143,7 +149,11 @@ class Imaging(abstract_dataset.AbstractDataset):
 
         if setup_convolver and psf is not None:
 
-            self.convolver = convolver.Convolver(mask=self.mask, kernel=self.psf)
+            self.convolver = convolver.Convolver(
+                mask=self.mask,
+                kernel=self.psf,
+                cache_path=self.settings.convolver_cache_path,
+            )
             self.blurring_grid = self.grid.blurring_grid_from_kernel_shape(
                 kernel_shape_native=self.psf.shape_native
             )
@@ -1,6 +1,9 @@
+import hashlib
 import logging
 import numpy as np
 import copy
+import os
+from os import path
 
 from autoconf import conf
 from autoarray import exc
@@ -11,6 +14,7 @@ from autoarray.structures.grids.two_d import grid_2d_irregular
 from autoarray.structures import visibilities as vis
 from autoarray.dataset import abstract_dataset, preprocess
 from autoarray.operators import transformer as trans
+from autoarray.operators import transformer_util
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +32,7 @@ class SettingsInterferometer(abstract_dataset.AbstractSettingsDataset):
         pixel_scales_interp=None,
         signal_to_noise_limit=None,
         transformer_class=trans.TransformerNUFFT,
+        w_tilde_cache_path=None,
     ):
         """
           The lens dataset is the collection of data_type (image, noise-map), a mask, grid, convolver \
@@ -59,6 +64,12 @@ class SettingsInterferometer(abstract_dataset.AbstractSettingsDataset):
         signal_to_noise_limit : float
             If input, the dataset's noise-map is rescaled such that no pixel has a signal-to-noise above the
             signa to noise limit.
+        transformer_class : trans.TransformerDFT or trans.TransformerNUFFT
+            The class of the transformer which performs the Fourier transforms of the `Interferometer`.
+        w_tilde_cache_path : str or None
+            If input, the w_tilde matrix of the `Interferometer` is stored in this directory and loaded from it as a
+            memory map whenever it is required for the same uv-wavelengths, noise-map and mask (see
+            `Interferometer.w_tilde`).
           """
 
         super().__init__(
@@ -73,6 +84,26 @@ class SettingsInterferometer(abstract_dataset.AbstractSettingsDataset):
         )
 
         self.transformer_class = transformer_class
+        self.w_tilde_cache_path = w_tilde_cache_path
+
+
+class WTildeInterferometer:
+    def __init__(self, curvature_preload: np.ndarray, dirty_image: np.ndarray):
+        """
+        The w_tilde preload of an `Interferometer`, which allows an inversion to compute its curvature matrix and data
+        vector from the mapping matrix in real-space, such that their calculation does not scale with the number of
+        visibilities (see `transformer_util.w_tilde_curvature_interferometer_from`).
+
+        Parameters
+        ----------
+        curvature_preload : np.ndarray
+            The [image_pixels, image_pixels] matrix w_tilde, where the curvature matrix is M^T w_tilde M for a mapping
+            matrix M.
+        dirty_image : np.ndarray
+            The noise-weighted dirty image of the visibilities, where the data vector is M^T dirty_image.
+        """
+        self.curvature_preload = curvature_preload
+        self.dirty_image = dirty_image
 
 
 class Interferometer(abstract_dataset.AbstractDataset):
@@ -98,6 +129,8 @@ class Interferometer(abstract_dataset.AbstractDataset):
             uv_wavelengths=uv_wavelengths, real_space_mask=real_space_mask
         )
 
+        self._w_tilde = None
+
     @classmethod
     def from_fits(
         cls,
@@ -193,10 +226,180 @@ class Interferometer(abstract_dataset.AbstractDataset):
             visibilities=self.inverse_noise_map
         )
 
+    @property
+    def w_tilde_grid_radians(self):
+        """
+        The grid of the real-space mask in radians on which the w_tilde preload is computed, which is the same grid
+        the `TransformerDFT` Fourier transforms.
+        """
+        return self.real_space_mask.mask_sub_1.masked_grid_sub_1.binned.in_radians
+
+    @property
+    def w_tilde_cache_key(self):
+        """
+        A hash of the uv-wavelengths, noise-map and real-space mask, which uniquely identifies the w_tilde matrix of
+        this interferometer and names the file it is stored in within `settings.w_tilde_cache_path`.
+        """
+        key = hashlib.sha256()
+        key.update(np.asarray(self.uv_wavelengths, dtype="float").tobytes())
+        key.update(np.asarray(self.noise_map, dtype="complex").tobytes())
+        key.update(np.asarray(self.real_space_mask, dtype="bool").tobytes())
+        key.update(np.asarray(self.real_space_mask.pixel_scales, dtype="float").tobytes())
+        return key.hexdigest()
+
+    def w_tilde_curvature_preload_from(self):
+        """
+        Returns the w_tilde matrix of the interferometer, loading it from `settings.w_tilde_cache_path` as a read-only
+        memory map if it has been computed and stored for the same uv-wavelengths, noise-map and mask before.
+
+        The matrix is written to a temporary file which is then renamed, so processes computing the same matrix at
+        the same time never load a partially written file.
+        """
+
+        def curvature_preload_func():
+            return transformer_util.w_tilde_curvature_interferometer_from(
+                noise_map_real=np.asarray(self.noise_map.real),
+                noise_map_imag=np.asarray(self.noise_map.imag),
+                uv_wavelengths=np.asarray(self.uv_wavelengths, dtype="float"),
+                grid_radians=np.asarray(self.w_tilde_grid_radians),
+            )
+
+        if self.settings.w_tilde_cache_path is None:
+            return curvature_preload_func()
+
+        file_path = path.join(
+            self.settings.w_tilde_cache_path, f"w_tilde_{self.w_tilde_cache_key}.npy"
+        )
+
+        if not path.exists(file_path):
+
+            os.makedirs(self.settings.w_tilde_cache_path, exist_ok=True)
+
+            temporary_file_path = f"{file_path}.{os.getpid()}.tmp"
+
+            with open(temporary_file_path, "wb") as f:
+                np.save(f, curvature_preload_func())
+
+            os.replace(temporary_file_path, file_path)
+
+        return np.load(file_path, mmap_mode="r")
+
+    @property
+    def w_tilde(self):
+        """
+        The w_tilde preload of the interferometer, which is computed the first time it is used (e.g. by an inversion
+        whose `SettingsInversion` has `use_w_tilde=True`) and reused for every subsequent inversion.
+        """
+        if self._w_tilde is None:
+
+            dirty_image = transformer_util.w_tilde_data_interferometer_from(
+                visibilities_real=np.asarray(self.visibilities.real),
+                visibilities_imag=np.asarray(self.visibilities.imag),
+                noise_map_real=np.asarray(self.noise_map.real),
+                noise_map_imag=np.asarray(self.noise_map.imag),
+                uv_wavelengths=np.asarray(self.uv_wavelengths, dtype="float"),
+                grid_radians=np.asarray(self.w_tilde_grid_radians),
+            )
+
+            self._w_tilde = WTildeInterferometer(
+                curvature_preload=self.w_tilde_curvature_preload_from(),
+                dirty_image=dirty_image,
+            )
+
+        return self._w_tilde
+
+    @property
+    def max_radius_radians(self):
+        """
+        The maximum distance of the centre of an unmasked real-space pixel from the phase centre in radians, which
+        bounds the error of binning the visibilities (see `preprocess.uv_smearing_bound_from`).
+        """
+        grid_radians = np.asarray(self.w_tilde_grid_radians)
+
+        return float(np.max(np.sqrt(np.sum(grid_radians ** 2.0, axis=1))))
+
+    def uv_grid_bin_indexes_from(self, uv_cell_size):
+        return preprocess.uv_grid_bin_indexes_from(
+            uv_wavelengths=self.uv_wavelengths, uv_cell_size=uv_cell_size
+        )
+
+    def binned_via_uv_grid_from(self, uv_cell_size=None, smearing_bound=None):
+        """
+        Returns a new interferometer whose visibilities are the inverse-variance weighted averages of the visibilities
+        in every cell of a uv-grid (see `preprocess.visibilities_binned_from`), reducing the number of visibilities
+        and therefore the run time of every fit.
+
+        Binning introduces an error into every binned visibility of at most `smearing_bound` times the total absolute
+        flux of the image (see `preprocess.uv_smearing_bound_from`), such that the cell size can be input directly or
+        computed as the largest cell size below an input `smearing_bound`.
+
+        Parameters
+        ----------
+        uv_cell_size : float or None
+            The size of every uv-grid cell in wavelengths.
+        smearing_bound : float or None
+            If `uv_cell_size` is not input, the maximum error of every binned visibility as a fraction of the total
+            absolute flux of the image, from which the cell size is computed.
+        """
+        if uv_cell_size is None:
+
+            if smearing_bound is None:
+                raise exc.DatasetException(
+                    "Either a uv_cell_size or smearing_bound must be input to bin an Interferometer."
+                )
+
+            uv_cell_size = preprocess.uv_cell_size_from_smearing_bound(
+                smearing_bound=smearing_bound,
+                max_radius_radians=self.max_radius_radians,
+            )
+
+        visibilities, noise_map, uv_wavelengths = preprocess.visibilities_binned_from(
+            visibilities=self.visibilities,
+            noise_map=self.noise_map,
+            uv_wavelengths=self.uv_wavelengths,
+            bin_indexes=self.uv_grid_bin_indexes_from(uv_cell_size=uv_cell_size),
+        )
+
+        return Interferometer(
+            visibilities=vis.Visibilities(visibilities=visibilities),
+            noise_map=vis.VisibilitiesNoiseMap(visibilities=noise_map),
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=self.real_space_mask,
+            settings=self.settings,
+            name=self.name,
+        )
+
+    def uv_smearing_bound_via_uv_grid_from(self, uv_cell_size):
+        """
+        Returns the upper bound on the error of every visibility of the interferometer binned on a uv-grid of cell
+        size `uv_cell_size` (see `binned_via_uv_grid_from`), as a fraction of the total absolute flux of the image.
+
+        Parameters
+        ----------
+        uv_cell_size : float
+            The size of every uv-grid cell in wavelengths.
+        """
+        bin_indexes = self.uv_grid_bin_indexes_from(uv_cell_size=uv_cell_size)
+
+        _, _, uv_wavelengths_binned = preprocess.visibilities_binned_from(
+            visibilities=self.visibilities,
+            noise_map=self.noise_map,
+            uv_wavelengths=self.uv_wavelengths,
+            bin_indexes=bin_indexes,
+        )
+
+        return preprocess.uv_smearing_bound_from(
+            uv_wavelengths=self.uv_wavelengths,
+            uv_wavelengths_binned=uv_wavelengths_binned,
+            bin_indexes=bin_indexes,
+            max_radius_radians=self.max_radius_radians,
+        )
+
     def modified_visibilities_from_visibilities(self, visibilities):
 
         interferometer = copy.deepcopy(self)
         interferometer.data = vis.Visibilities(visibilities=visibilities)
+        interferometer._w_tilde = None
         return interferometer
 
     @property
@@ -232,6 +435,7 @@ class Interferometer(abstract_dataset.AbstractDataset):
         interferometer.noise_map = vis.VisibilitiesNoiseMap(
             visibilities=noise_map_limit_real + 1j * noise_map_limit_imag
         )
+        interferometer._w_tilde = None
 
         return interferometer
 
@@ -240,6 +444,7 @@ class Interferometer(abstract_dataset.AbstractDataset):
         interferometer = copy.deepcopy(self)
 
         interferometer.noise_map = noise_map
+        interferometer._w_tilde = None
 
         return interferometer
 
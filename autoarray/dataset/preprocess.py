@@ -405,3 +405,157 @@ def data_with_complex_gaussian_noise_added(data, sigma, seed=-1):
     )
 
     return data + gaussian_noise[:, 0] + 1.0j * gaussian_noise[:, 1]
+
+
+def uv_grid_bin_indexes_from(uv_wavelengths, uv_cell_size):
+    """
+    Returns the index of the bin every visibility is in when the uv-plane is divided into a grid of square cells of
+    size `uv_cell_size`, where only cells containing at least one visibility are bins and are numbered from 0.
+
+    Parameters
+    ----------
+    uv_wavelengths : np.ndarray
+        The (u,v) wavelengths of every visibility.
+    uv_cell_size : float
+        The size of every uv-grid cell in wavelengths.
+    """
+    uv_cells = np.floor(np.asarray(uv_wavelengths) / uv_cell_size).astype("int")
+
+    return np.unique(uv_cells, axis=0, return_inverse=True)[1].reshape(-1)
+
+
+def visibilities_binned_from(visibilities, noise_map, uv_wavelengths, bin_indexes):
+    """
+    Average the visibilities in every bin, using inverse-variance weighting of their real and imaginary parts, such
+    that the binned visibilities contain the same information as the originals for signal which is constant over
+    every bin.
+
+    The noise of a binned real (or imaginary) value is 1.0 / sqrt(sum(1.0 / noise_map**2)) of its visibilities, and
+    the (u,v) wavelengths of a bin are the mean of its visibilities' wavelengths weighted by the sum of their real
+    and imaginary inverse variances.
+
+    The bins can be a uv-grid (see `uv_grid_bin_indexes_from`) or any other grouping of redundant visibilities, for
+    example the time intervals of every baseline.
+
+    Parameters
+    ----------
+    visibilities : np.ndarray
+        The complex visibilities which are binned.
+    noise_map : np.ndarray
+        The complex noise-map of the visibilities, whose real and imaginary values are the noise of the real and
+        imaginary visibility values.
+    uv_wavelengths : np.ndarray
+        The (u,v) wavelengths of every visibility.
+    bin_indexes : np.ndarray
+        The index of the bin every visibility is in, numbered from 0.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray, np.ndarray)
+        The binned visibilities, noise-map and uv-wavelengths.
+    """
+    visibilities = np.asarray(visibilities)
+    noise_map = np.asarray(noise_map)
+    uv_wavelengths = np.asarray(uv_wavelengths)
+
+    total_bins = int(np.max(bin_indexes)) + 1
+
+    weights_real = 1.0 / noise_map.real ** 2.0
+    weights_imag = 1.0 / noise_map.imag ** 2.0
+
+    weights_real_binned = np.bincount(
+        bin_indexes, weights=weights_real, minlength=total_bins
+    )
+    weights_imag_binned = np.bincount(
+        bin_indexes, weights=weights_imag, minlength=total_bins
+    )
+
+    visibilities_binned = np.bincount(
+        bin_indexes, weights=weights_real * visibilities.real, minlength=total_bins
+    ) / weights_real_binned + 1j * (
+        np.bincount(
+            bin_indexes, weights=weights_imag * visibilities.imag, minlength=total_bins
+        )
+        / weights_imag_binned
+    )
+
+    noise_map_binned = 1.0 / np.sqrt(weights_real_binned) + 1j / np.sqrt(
+        weights_imag_binned
+    )
+
+    weights_uv = weights_real + weights_imag
+    weights_uv_binned = weights_real_binned + weights_imag_binned
+
+    uv_wavelengths_binned = np.stack(
+        [
+            np.bincount(
+                bin_indexes,
+                weights=weights_uv * uv_wavelengths[:, index],
+                minlength=total_bins,
+            )
+            / weights_uv_binned
+            for index in range(uv_wavelengths.shape[1])
+        ],
+        axis=1,
+    )
+
+    return visibilities_binned, noise_map_binned, uv_wavelengths_binned
+
+
+def uv_smearing_bound_from(
+    uv_wavelengths, uv_wavelengths_binned, bin_indexes, max_radius_radians
+):
+    """
+    Returns an upper bound on the error binning introduces into every binned visibility, as a fraction of the total
+    absolute flux of the image.
+
+    The visibility of an image I at u is V(u) = sum_i I_i exp(-2 pi i x_i . u), therefore for every visibility in a
+    bin whose (u,v) wavelengths are offset by du from those of the bin:
+
+        |V(u) - V(u + du)| <= 2 pi |du| max_i |x_i| sum_i |I_i|
+
+    which also bounds the error of the real and imaginary parts of the weighted average of the bin's visibilities
+    relative to the visibility at the bin's (u,v) wavelengths.
+
+    Parameters
+    ----------
+    uv_wavelengths : np.ndarray
+        The (u,v) wavelengths of every visibility before binning.
+    uv_wavelengths_binned : np.ndarray
+        The (u,v) wavelengths of every bin.
+    bin_indexes : np.ndarray
+        The index of the bin every visibility is in, numbered from 0.
+    max_radius_radians : float
+        The maximum distance of the image's emission from the phase centre in radians, e.g. the radius of the
+        real-space mask.
+    """
+    uv_offsets = np.sqrt(
+        np.sum(
+            (np.asarray(uv_wavelengths) - uv_wavelengths_binned[bin_indexes]) ** 2.0,
+            axis=1,
+        )
+    )
+
+    uv_offsets_max = np.zeros(uv_wavelengths_binned.shape[0])
+    np.maximum.at(uv_offsets_max, bin_indexes, uv_offsets)
+
+    return 2.0 * np.pi * max_radius_radians * uv_offsets_max
+
+
+def uv_cell_size_from_smearing_bound(smearing_bound, max_radius_radians):
+    """
+    Returns the largest uv-grid cell size for which the error of binning visibilities onto the uv-grid (see
+    `uv_smearing_bound_from`) is below `smearing_bound` times the total absolute flux of the image.
+
+    The weighted mean (u,v) wavelengths of a bin lie within its cell, so every visibility is offset from its bin by
+    at most the cell's diagonal, sqrt(2) * uv_cell_size.
+
+    Parameters
+    ----------
+    smearing_bound : float
+        The maximum error of every binned visibility as a fraction of the total absolute flux of the image.
+    max_radius_radians : float
+        The maximum distance of the image's emission from the phase centre in radians, e.g. the radius of the
+        real-space mask.
+    """
+    return smearing_bound / (2.0 * np.sqrt(2.0) * np.pi * max_radius_radians)
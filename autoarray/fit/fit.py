@@ -4,7 +4,50 @@ from autoarray.structures import abstract_structure
 from autoarray.fit import fit_util
 
 
+class cached_property:
+    def __init__(self, func):
+        """
+        A property whose value is computed once per instance on first access and then stored in the instance's
+        `__dict__`, such that subsequent accesses return the stored value without recomputing it (the same semantics
+        as Python's `functools.cached_property`).
+
+        The stored value is removed, and therefore recomputed on the next access, by `FitData.invalidate_cache`.
+
+        Parameters
+        ----------
+        func
+            The function computing the value of the property.
+        """
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+
+        if instance is None:
+            return self
+
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+
+        return value
+
+
 class FitData:
+
+    # Assigning any of these attributes invalidates every cached property of the fit.
+    cache_inputs = (
+        "data",
+        "noise_map",
+        "model_data",
+        "_mask",
+        "inversion",
+        "use_mask_in_fit",
+    )
+
     def __init__(
         self,
         data,
@@ -22,11 +65,30 @@ class FitData:
         self.inversion = inversion
         self.use_mask_in_fit = use_mask_in_fit
 
+    def __setattr__(self, key, value):
+
+        if key in self.cache_inputs:
+            self.invalidate_cache()
+
+        super().__setattr__(key, value)
+
+    def invalidate_cache(self):
+        """
+        Remove every value stored by a `cached_property` of the fit, such that they are recomputed from the fit's
+        current data, noise-map, model data, mask and inversion on their next access.
+
+        This is called automatically whenever one of the attributes in `cache_inputs` is assigned.
+        """
+        for cls in type(self).__mro__:
+            for name, value in vars(cls).items():
+                if isinstance(value, cached_property):
+                    self.__dict__.pop(name, None)
+
     @property
     def mask(self):
         return self._mask
 
-    @property
+    @cached_property
     def residual_map(self) -> abstract_structure.AbstractStructure:
         """
         Returns the residual-map between the masked dataset and model data, where:
@@ -40,7 +102,7 @@ class FitData:
             )
         return fit_util.residual_map_from(data=self.data, model_data=self.model_data)
 
-    @property
+    @cached_property
     def normalized_residual_map(self) -> abstract_structure.AbstractStructure:
         """
         Returns the normalized residual-map between the masked dataset and model data, where:
@@ -55,7 +117,7 @@ class FitData:
             residual_map=self.residual_map, noise_map=self.noise_map
         )
 
-    @property
+    @cached_property
     def chi_squared_map(self) -> abstract_structure.AbstractStructure:
         """
         Returns the chi-squared-map between the residual-map and noise-map, where:
@@ -70,53 +132,65 @@ class FitData:
             residual_map=self.residual_map, noise_map=self.noise_map
         )
 
-    @property
+    @cached_property
     def signal_to_noise_map(self) -> abstract_structure.AbstractStructure:
         """The signal-to-noise_map of the dataset and noise-map which are fitted."""
         signal_to_noise_map = np.divide(self.data, self.noise_map)
         signal_to_noise_map[signal_to_noise_map < 0] = 0
         return signal_to_noise_map
 
-    @property
-    def chi_squared(self) -> float:
+    @cached_property
+    def chi_squared_and_noise_normalization(self) -> (float, float):
         """
-        Returns the chi-squared terms of the model data's fit to an dataset, by summing the chi-squared-map.
+        Returns the chi-squared and noise normalization terms of the model data's fit to the dataset, computed in a
+        single pass over the data without materializing the residual-map or chi-squared-map (which are only
+        computed when accessed, for example for visualization).
         """
         if self.use_mask_in_fit:
-            return fit_util.chi_squared_with_mask_from(
-                chi_squared_map=self.chi_squared_map, mask=self.mask
+            return fit_util.chi_squared_and_noise_normalization_with_mask_from(
+                data=self.data,
+                mask=self.mask,
+                model_data=self.model_data,
+                noise_map=self.noise_map,
             )
-        return fit_util.chi_squared_from(chi_squared_map=self.chi_squared_map)
+        return fit_util.chi_squared_and_noise_normalization_from(
+            data=self.data, model_data=self.model_data, noise_map=self.noise_map
+        )
 
-    @property
+    @cached_property
+    def chi_squared(self) -> float:
+        """
+        Returns the chi-squared terms of the model data's fit to an dataset, by summing the chi-squared-map.
+        """
+        return self.chi_squared_and_noise_normalization[0]
+
+    @cached_property
     def reduced_chi_squared(self) -> float:
         return self.chi_squared / int(np.size(self.mask) - np.sum(self.mask))
 
-    @property
+    @cached_property
     def noise_normalization(self) -> float:
         """
         Returns the noise-map normalization term of the noise-map, summing the noise_map value in every pixel as:
 
         [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
         """
-        if self.use_mask_in_fit:
-            return fit_util.noise_normalization_with_mask_from(
-                noise_map=self.noise_map, mask=self.mask
-            )
-        return fit_util.noise_normalization_from(noise_map=self.noise_map)
+        return self.chi_squared_and_noise_normalization[1]
 
-    @property
+    @cached_property
     def log_likelihood(self) -> float:
         """
         Returns the log likelihood of each model data point's fit to the dataset, where:
 
         Log Likelihood = -0.5*[Chi_Squared_Term + Noise_Term] (see functions above for these definitions)
         """
+        chi_squared, noise_normalization = self.chi_squared_and_noise_normalization
+
         return fit_util.log_likelihood_from(
-            chi_squared=self.chi_squared, noise_normalization=self.noise_normalization
+            chi_squared=chi_squared, noise_normalization=noise_normalization
         )
 
-    @property
+    @cached_property
     def log_likelihood_with_regularization(self) -> float:
         """
         Returns the log likelihood of an inversion's fit to the dataset, including a regularization term which \
@@ -125,13 +199,16 @@ class FitData:
         Log Likelihood = -0.5*[Chi_Squared_Term + Regularization_Term + Noise_Term] (see functions above for these definitions)
         """
         if self.inversion is not None:
+
+            chi_squared, noise_normalization = self.chi_squared_and_noise_normalization
+
             return fit_util.log_likelihood_with_regularization_from(
-                chi_squared=self.chi_squared,
+                chi_squared=chi_squared,
                 regularization_term=self.inversion.regularization_term,
-                noise_normalization=self.noise_normalization,
+                noise_normalization=noise_normalization,
             )
 
-    @property
+    @cached_property
     def log_evidence(self) -> float:
         """
         Returns the log evidence of the inversion's fit to a dataset, where the log evidence includes a number of terms
@@ -155,15 +232,18 @@ class FitData:
             The normalization noise_map-term for the data's noise-map.
         """
         if self.inversion is not None:
+
+            chi_squared, noise_normalization = self.chi_squared_and_noise_normalization
+
             return fit_util.log_evidence_from(
-                chi_squared=self.chi_squared,
+                chi_squared=chi_squared,
                 regularization_term=self.inversion.regularization_term,
                 log_curvature_regularization_term=self.inversion.log_det_curvature_reg_matrix_term,
                 log_regularization_term=self.inversion.log_det_regularization_matrix_term,
-                noise_normalization=self.noise_normalization,
+                noise_normalization=noise_normalization,
             )
 
-    @property
+    @cached_property
     def figure_of_merit(self) -> float:
         if self.inversion is None:
             return self.log_likelihood
@@ -344,7 +424,7 @@ class FitInterferometer(FitDataset):
     def visibilities(self) -> abstract_structure.AbstractStructure:
         return self.data
 
-    @property
+    @cached_property
     def signal_to_noise_map(self) -> abstract_structure.AbstractStructure:
         """The signal-to-noise_map of the dataset and noise-map which are fitted."""
         signal_to_noise_map_real = np.divide(
@@ -362,7 +442,7 @@ class FitInterferometer(FitDataset):
     def model_visibilities(self) -> abstract_structure.AbstractStructure:
         return self.model_data
 
-    @property
+    @cached_property
     def normalized_residual_map(self) -> abstract_structure.AbstractStructure:
         """
         Returns the normalized residual-map between the masked dataset and model data, where:
@@ -373,7 +453,7 @@ class FitInterferometer(FitDataset):
             residual_map=self.residual_map, noise_map=self.noise_map, mask=self.mask
         )
 
-    @property
+    @cached_property
     def chi_squared_map(self) -> abstract_structure.AbstractStructure:
         """
         Returns the chi-squared-map between the residual-map and noise-map, where:
@@ -384,58 +464,167 @@ class FitInterferometer(FitDataset):
             residual_map=self.residual_map, noise_map=self.noise_map, mask=self.mask
         )
 
-    @property
-    def chi_squared(self) -> float:
-        """
-        Returns the chi-squared terms of the model data's fit to an dataset, by summing the chi-squared-map.
-        """
-        return fit_util.chi_squared_complex_with_mask_from(
-            chi_squared_map=self.chi_squared_map, mask=self.mask
-        )
-
-    @property
-    def noise_normalization(self) -> float:
+    @cached_property
+    def chi_squared_and_noise_normalization(self) -> (float, float):
         """
-        Returns the noise-map normalization term of the noise-map, summing the noise_map value in every pixel as:
-
-        [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
+        Returns the chi-squared and noise normalization terms of the model visibilities fit to the visibilities,
+        computed in a single pass over the real and imaginary components of every visibility.
         """
-        return fit_util.noise_normalization_complex_with_mask_from(
-            noise_map=self.noise_map, mask=self.mask
+        return fit_util.chi_squared_and_noise_normalization_complex_with_mask_from(
+            data=self.data,
+            mask=self.mask,
+            model_data=self.model_data,
+            noise_map=self.noise_map,
         )
 
-    @property
+    @cached_property
     def dirty_image(self):
         return self.transformer.image_from_visibilities(visibilities=self.visibilities)
 
-    @property
+    @cached_property
     def dirty_noise_map(self):
         return self.transformer.image_from_visibilities(visibilities=self.noise_map)
 
-    @property
+    @cached_property
     def dirty_signal_to_noise_map(self):
         return self.transformer.image_from_visibilities(
             visibilities=self.signal_to_noise_map
         )
 
-    @property
+    @cached_property
     def dirty_model_image(self):
         return self.transformer.image_from_visibilities(
             visibilities=self.model_visibilities
         )
 
-    @property
+    @cached_property
     def dirty_residual_map(self):
         return self.transformer.image_from_visibilities(visibilities=self.residual_map)
 
-    @property
+    @cached_property
     def dirty_normalized_residual_map(self):
         return self.transformer.image_from_visibilities(
             visibilities=self.normalized_residual_map
         )
 
-    @property
+    @cached_property
     def dirty_chi_squared_map(self):
         return self.transformer.image_from_visibilities(
             visibilities=self.chi_squared_map
         )
+
+
+class FitDataScalar(FitData):
+    def __init__(
+        self,
+        data,
+        noise_map,
+        model_data,
+        mask=None,
+        inversion=None,
+        use_mask_in_fit=False,
+    ):
+        """
+        A fit which only computes the scalar quantities of the fit (the `chi_squared`, `noise_normalization`,
+        `log_likelihood`, `log_evidence` and `figure_of_merit`), for example during a non-linear search.
+
+        The data, noise-map, model data and mask are stored as plain NumPy arrays (their slim or native buffers),
+        such that no data structure (e.g. an `Array2D` or `Visibilities`) is created during the fit. The scalar
+        quantities are computed by the same single pass functions as the `FitData` they replace and are
+        therefore identical to them.
+
+        Parameters
+        -----------
+        data : np.ndarray
+            The data that is fitted.
+        noise_map : np.ndarray
+            The noise-map of the data.
+        model_data : np.ndarray
+            The model data the data is fitted with.
+        mask : np.ndarray
+            The mask applied to the data, where `False` entries are included in the fit.
+        inversion : Inversion
+            If the fit uses an `Inversion` this is the instance of the object used to perform the fit. This determines
+            if the `log_likelihood` or `log_evidence` is used as the `figure_of_merit`.
+        use_mask_in_fit : bool
+            If `True`, masked data points are omitted from the fit.
+        """
+        super().__init__(
+            data=np.asarray(data),
+            noise_map=np.asarray(noise_map),
+            model_data=np.asarray(model_data),
+            mask=None if mask is None else np.asarray(mask),
+            inversion=inversion,
+            use_mask_in_fit=use_mask_in_fit,
+        )
+
+
+class FitImagingScalar(FitDataScalar):
+    def __init__(self, imaging, model_image, inversion=None, use_mask_in_fit=True):
+        """
+        Class to compute only the scalar quantities (e.g. the `figure_of_merit`) of the fit of a masked imaging
+        dataset, which are identical to those of a `FitImaging` with the same inputs.
+
+        Parameters
+        -----------
+        imaging : MaskedImaging
+            The masked imaging dataset that is fitted.
+        model_image : Array2D
+            The model image the masked imaging is fitted with.
+        inversion : Inversion
+            If the fit uses an `Inversion` this is the instance of the object used to perform the fit. This determines
+            if the `log_likelihood` or `log_evidence` is used as the `figure_of_merit`.
+        use_mask_in_fit : bool
+            If `True`, masked data points are omitted from the fit.
+        """
+        super().__init__(
+            data=imaging.data,
+            noise_map=imaging.noise_map,
+            model_data=model_image,
+            mask=imaging.mask,
+            inversion=inversion,
+            use_mask_in_fit=use_mask_in_fit,
+        )
+
+
+class FitInterferometerScalar(FitDataScalar):
+    def __init__(
+        self, interferometer, model_visibilities, inversion=None, use_mask_in_fit=True
+    ):
+        """
+        Class to compute only the scalar quantities (e.g. the `figure_of_merit`) of the fit of an interferometer
+        dataset, which are identical to those of a `FitInterferometer` with the same inputs.
+
+        Parameters
+        -----------
+        interferometer : MaskedInterferometer
+            The masked interferometer dataset that is fitted.
+        model_visibilities : Visibilities
+            The model visibilities the masked imaging is fitted with.
+        inversion : Inversion
+            If the fit uses an `Inversion` this is the instance of the object used to perform the fit. This determines
+            if the `log_likelihood` or `log_evidence` is used as the `figure_of_merit`.
+        use_mask_in_fit : bool
+            If `True`, masked data points are omitted from the fit.
+        """
+        super().__init__(
+            data=interferometer.visibilities,
+            noise_map=interferometer.noise_map,
+            model_data=model_visibilities,
+            mask=np.full(shape=interferometer.visibilities.shape, fill_value=False),
+            inversion=inversion,
+            use_mask_in_fit=use_mask_in_fit,
+        )
+
+    @cached_property
+    def chi_squared_and_noise_normalization(self) -> (float, float):
+        """
+        Returns the chi-squared and noise normalization terms of the model visibilities fit to the visibilities,
+        computed in a single pass over the real and imaginary components of every visibility.
+        """
+        return fit_util.chi_squared_and_noise_normalization_complex_with_mask_from(
+            data=self.data,
+            mask=self.mask,
+            model_data=self.model_data,
+            noise_map=self.noise_map,
+        )
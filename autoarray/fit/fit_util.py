@@ -1,5 +1,6 @@
 import numpy as np
 
+from autoarray import decorator_util
 from autoarray.structures import abstract_structure
 
 
@@ -417,6 +418,190 @@ def noise_normalization_complex_with_mask_from(
     return noise_normalization_real + noise_normalization_imag
 
 
+@decorator_util.jit()
+def chi_squared_and_noise_normalization_jit(
+    data: np.ndarray, mask: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> (float, float):
+    """
+    Returns the chi-squared and noise normalization of the fit of model-data to a masked dataset, computed in a
+    single streaming pass over the (raveled) data, model-data, noise-map and mask without allocating the
+    residual-map, normalized residual-map or chi-squared-map.
+
+    See the functions `chi_squared_and_noise_normalization_with_mask_from` and
+    `chi_squared_and_noise_normalization_complex_with_mask_from`, which should be used to call this function.
+
+    Parameters
+    -----------
+    data : np.ndarray
+        The 1D data that is fitted.
+    mask : np.ndarray
+        The 1D mask applied to the dataset, where `False` entries are included in the calculation.
+    model_data : np.ndarray
+        The 1D model data used to fit the data.
+    noise_map : np.ndarray
+        The 1D noise-map of the dataset.
+    """
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for index in range(data.shape[0]):
+
+        if not mask[index]:
+
+            normalized_residual = (data[index] - model_data[index]) / noise_map[index]
+
+            chi_squared += normalized_residual ** 2.0
+            noise_normalization += np.log(2 * np.pi * noise_map[index] ** 2.0)
+
+    return chi_squared, noise_normalization
+
+
+@decorator_util.jit()
+def chi_squared_and_noise_normalization_complex_jit(
+    data: np.ndarray, mask: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> (float, float):
+    """
+    Returns the chi-squared and noise normalization of the fit of complex model-data to a masked dataset, computed
+    in a single streaming pass where the real and imaginary components of every visibility are treated as
+    independent data points.
+
+    Parameters
+    -----------
+    data : np.ndarray
+        The 1D complex data that is fitted.
+    mask : np.ndarray
+        The 1D mask applied to the dataset, where `False` entries are included in the calculation.
+    model_data : np.ndarray
+        The 1D complex model data used to fit the data.
+    noise_map : np.ndarray
+        The 1D complex noise-map of the dataset.
+    """
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for index in range(data.shape[0]):
+
+        if not mask[index]:
+
+            noise_real = noise_map[index].real
+            noise_imag = noise_map[index].imag
+
+            normalized_residual_real = (
+                data[index].real - model_data[index].real
+            ) / noise_real
+            normalized_residual_imag = (
+                data[index].imag - model_data[index].imag
+            ) / noise_imag
+
+            chi_squared += normalized_residual_real ** 2.0
+            chi_squared += normalized_residual_imag ** 2.0
+            noise_normalization += np.log(2 * np.pi * noise_real ** 2.0)
+            noise_normalization += np.log(2 * np.pi * noise_imag ** 2.0)
+
+    return chi_squared, noise_normalization
+
+
+def chi_squared_and_noise_normalization_from(
+    *, data: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> (float, float):
+    """
+    Returns the chi-squared and noise normalization terms of the model data's fit to a dataset, in one pass over
+    the data and without computing the residual-map or chi-squared-map, where:
+
+    Chi_Squared = sum(((Data - Model)**2.0)/(Variances))
+    [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
+
+    Parameters
+    -----------
+    data : np.ndarray
+        The data that is fitted.
+    model_data : np.ndarray
+        The model data used to fit the data.
+    noise_map : np.ndarray
+        The noise-map of the dataset.
+    """
+    return chi_squared_and_noise_normalization_with_mask_from(
+        data=data,
+        mask=np.full(shape=np.shape(data), fill_value=False),
+        model_data=model_data,
+        noise_map=noise_map,
+    )
+
+
+def chi_squared_and_noise_normalization_with_mask_from(
+    *, data: np.ndarray, mask: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> (float, float):
+    """
+    Returns the chi-squared and noise normalization terms of the model data's fit to a masked dataset, in one pass
+    over the data and without computing the residual-map or chi-squared-map.
+
+    The values in masked pixels are omitted from the calculation.
+
+    Parameters
+    -----------
+    data : np.ndarray
+        The data that is fitted.
+    mask : np.ndarray
+        The mask applied to the dataset, where `False` entries are included in the calculation.
+    model_data : np.ndarray
+        The model data used to fit the data.
+    noise_map : np.ndarray
+        The noise-map of the dataset.
+    """
+    chi_squared, noise_normalization = chi_squared_and_noise_normalization_jit(
+        *ravelled_fit_arrays_from(
+            data=data, mask=mask, model_data=model_data, noise_map=noise_map
+        )
+    )
+    return float(chi_squared), float(noise_normalization)
+
+
+def chi_squared_and_noise_normalization_complex_with_mask_from(
+    *, data: np.ndarray, mask: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> (float, float):
+    """
+    Returns the chi-squared and noise normalization terms of complex model data's fit to a masked dataset, in one
+    pass over the data and without computing the residual-map or chi-squared-map.
+
+    The values in masked visibilities are omitted from the calculation.
+
+    Parameters
+    -----------
+    data : np.ndarray
+        The complex data that is fitted.
+    mask : np.ndarray
+        The mask applied to the dataset, where `False` entries are included in the calculation.
+    model_data : np.ndarray
+        The complex model data used to fit the data.
+    noise_map : np.ndarray
+        The complex noise-map of the dataset.
+    """
+    chi_squared, noise_normalization = chi_squared_and_noise_normalization_complex_jit(
+        *ravelled_fit_arrays_from(
+            data=data, mask=mask, model_data=model_data, noise_map=noise_map
+        )
+    )
+    return float(chi_squared), float(noise_normalization)
+
+
+def ravelled_fit_arrays_from(
+    *, data: np.ndarray, mask: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    """
+    Returns the data, mask, model-data and noise-map as plain 1D numpy arrays that can be passed to the single pass
+    fit kernels, where the mask is broadcast to the shape of the data (as for the `where` argument of the masked
+    functions above). No copies are made for contiguous inputs.
+    """
+    data = np.asarray(data)
+
+    return (
+        data.ravel(),
+        np.broadcast_to(np.asarray(mask, dtype="bool"), data.shape).ravel(),
+        np.asarray(model_data).ravel(),
+        np.asarray(noise_map).ravel(),
+    )
+
+
 def log_likelihood_from(*, chi_squared: float, noise_normalization: float) -> float:
     """
     Returns the log likelihood of each model data point's fit to the dataset, where:
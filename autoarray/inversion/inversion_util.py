@@ -1,5 +1,9 @@
 from autoarray import decorator_util
+from autoarray import exc
+import itertools
 import numpy as np
+from scipy import sparse
+from scipy.linalg import eigh_tridiagonal
 
 
 @decorator_util.jit()
@@ -35,6 +39,45 @@ def data_vector_via_blurred_mapping_matrix_from(
     return data_vector
 
 
+def inverse_variance_map_from(noise_map: np.ndarray) -> np.ndarray:
+    """
+    Returns the inverse variance 1 / $\sigma$^2 of every value of a 1D noise-map, which weights every data value in the
+    data vector and curvature matrix.
+
+    Parameters
+    -----------
+    noise_map : np.ndarray
+        Flattened 1D array of the noise-map used by the inversion during the fit.
+    """
+    return 1.0 / np.asarray(noise_map) ** 2.0
+
+
+def data_vector_via_blurred_mapping_matrix_and_inverse_variance_map_from(
+    blurred_mapping_matrix, image: np.ndarray, inverse_variance_map: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the data vector `D` from a blurred mapping matrix `f`, the 1D image `d` and the 1D inverse variance map
+    1 / $\sigma$^2 (see Warren & Dye 2003), computed as the matrix-vector product D = f^T (d / $\sigma$^2).
+
+    This gives the same data vector as `data_vector_via_blurred_mapping_matrix_from`. For a dense blurred mapping
+    matrix the product is performed by BLAS (GEMV), as opposed to a loop over every entry of the matrix. For a blurred
+    mapping matrix in compressed sparse row (CSR) format only its non-zero entries are used.
+
+    Parameters
+    -----------
+    blurred_mapping_matrix : np.ndarray or sparse.csr_matrix
+        The matrix representing the blurred mappings between sub-grid pixels and pixelization pixels.
+    image : np.ndarray
+        Flattened 1D array of the observed image the inversion is fitting.
+    inverse_variance_map : np.ndarray
+        Flattened 1D array of the inverse variance of the noise-map used by the inversion during the fit (see
+        `inverse_variance_map_from`).
+    """
+    return blurred_mapping_matrix.T.dot(
+        np.asarray(image) * np.asarray(inverse_variance_map)
+    )
+
+
 def curvature_matrix_via_mapping_matrix_from(
     mapping_matrix: np.ndarray, noise_map: np.ndarray
 ) -> np.ndarray:
@@ -55,6 +98,28 @@ def curvature_matrix_via_mapping_matrix_from(
     return curvature_matrix
 
 
+def curvature_matrix_via_mapping_matrix_sparse_from(
+    mapping_matrix_sparse: sparse.csr_matrix, noise_map: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the curvature matrix `F` from a blurred mapping matrix `f` stored in compressed sparse row (CSR) format
+    and the 1D noise-map $\sigma$ (see Warren & Dye 2003).
+
+    The product of the mapping matrix with itself is performed sparsely, with only the (dense) curvature matrix
+    returned.
+
+    Parameters
+    -----------
+    mapping_matrix_sparse : sparse.csr_matrix
+        The matrix representing the mappings (these could be blurred or transfomed) between sub-grid pixels and
+        pixelization pixels.
+    noise_map : np.ndarray
+        Flattened 1D array of the noise-map used by the inversion during the fit.
+    """
+    array = sparse.diags(1.0 / np.asarray(noise_map)).dot(mapping_matrix_sparse)
+    return array.T.dot(array).toarray()
+
+
 @decorator_util.jit()
 def curvature_matrix_sparse_preload_via_mapping_matrix_from(
     mapping_matrix: np.ndarray,
@@ -96,6 +161,85 @@ def curvature_matrix_sparse_preload_via_mapping_matrix_from(
     return curvature_matrix_sparse_preload, curvature_matrix_preload_counts
 
 
+@decorator_util.jit()
+def curvature_matrix_sparse_preload_via_mapping_matrix_csr_from(
+    mapping_matrix_indptr: np.ndarray,
+    mapping_matrix_indexes: np.ndarray,
+    mapping_matrix_values: np.ndarray,
+):
+    """
+    Returns the same sparse preload matrix and preload counts as
+    `curvature_matrix_sparse_preload_via_mapping_matrix_from`, for a mapping matrix input in compressed sparse row
+    (CSR) format, such that only its non-zero entries are looped over.
+
+    Parameters
+    -----------
+    mapping_matrix_indptr : np.ndarray
+        The CSR index pointers of the matrix representing the mappings between sub-grid pixels and pixelization
+        pixels.
+    mapping_matrix_indexes : np.ndarray
+        The CSR column (pixelization pixel) indexes of the mapping matrix, sorted within every row.
+    mapping_matrix_values : np.ndarray
+        The CSR values of the mapping matrix.
+    """
+    image_pixels = mapping_matrix_indptr.shape[0] - 1
+
+    curvature_matrix_preload_counts = np.zeros(image_pixels)
+
+    for mask_1d_index in range(image_pixels):
+
+        start = mapping_matrix_indptr[mask_1d_index]
+        end = mapping_matrix_indptr[mask_1d_index + 1]
+
+        for preload_index in range(start, end):
+            if mapping_matrix_values[preload_index] > 0.0:
+                curvature_matrix_preload_counts[mask_1d_index] += 1
+
+    preload_max = np.max(curvature_matrix_preload_counts)
+
+    curvature_matrix_sparse_preload = np.zeros((image_pixels, int(preload_max)))
+
+    for mask_1d_index in range(image_pixels):
+
+        index = 0
+
+        start = mapping_matrix_indptr[mask_1d_index]
+        end = mapping_matrix_indptr[mask_1d_index + 1]
+
+        for preload_index in range(start, end):
+            if mapping_matrix_values[preload_index] > 0.0:
+                curvature_matrix_sparse_preload[
+                    mask_1d_index, index
+                ] = mapping_matrix_indexes[preload_index]
+                index += 1
+
+    return curvature_matrix_sparse_preload, curvature_matrix_preload_counts
+
+
+def curvature_matrix_sparse_preload_via_mapping_matrix_sparse_from(
+    mapping_matrix_sparse: sparse.csr_matrix,
+):
+    """
+    Returns the sparse preload matrix and preload counts of a blurred mapping matrix `f` stored as a sparse matrix,
+    which are identical to those `curvature_matrix_sparse_preload_via_mapping_matrix_from` returns for the same matrix
+    stored as a dense `np.ndarray`.
+
+    Parameters
+    -----------
+    mapping_matrix_sparse : sparse.csr_matrix
+        The matrix representing the mappings (these could be blurred or transfomed) between sub-grid pixels and
+        pixelization pixels, stored as a sparse matrix.
+    """
+    mapping_matrix_sparse = sparse.csr_matrix(mapping_matrix_sparse)
+    mapping_matrix_sparse.sort_indices()
+
+    return curvature_matrix_sparse_preload_via_mapping_matrix_csr_from(
+        mapping_matrix_indptr=mapping_matrix_sparse.indptr,
+        mapping_matrix_indexes=mapping_matrix_sparse.indices,
+        mapping_matrix_values=mapping_matrix_sparse.data,
+    )
+
+
 @decorator_util.jit()
 def curvature_matrix_via_sparse_preload_from(
     mapping_matrix: np.ndarray,
@@ -149,6 +293,175 @@ def curvature_matrix_via_sparse_preload_from(
     return curvature_matrix
 
 
+@decorator_util.jit()
+def curvature_matrix_outer_products_preload_entries_from(
+    mapping_matrix_indptr: np.ndarray,
+    mapping_matrix_indexes: np.ndarray,
+    mapping_matrix_values: np.ndarray,
+    pixels: int,
+):
+    """
+    Returns the non-zero entries of the outer products of every row of a blurred mapping matrix `f` with itself,
+    which are the contributions of every image pixel to the upper triangle of the curvature matrix `F`.
+
+    The entries are returned as their values, the flattened index of the curvature matrix entry they contribute to
+    (pix_index_0 * pixels + pix_index_1) and the image pixel they are for. The mapping matrix is input in compressed
+    sparse row (CSR) format, such that only its non-zero entries are looped over.
+
+    Parameters
+    -----------
+    mapping_matrix_indptr : np.ndarray
+        The CSR index pointers of the matrix representing the mappings between sub-grid pixels and pixelization
+        pixels.
+    mapping_matrix_indexes : np.ndarray
+        The CSR column (pixelization pixel) indexes of the mapping matrix.
+    mapping_matrix_values : np.ndarray
+        The CSR values of the mapping matrix.
+    pixels : int
+        The number of pixelization pixels.
+    """
+    image_pixels = mapping_matrix_indptr.shape[0] - 1
+
+    total_entries = 0
+
+    for mask_1d_index in range(image_pixels):
+        total_pix = (
+            mapping_matrix_indptr[mask_1d_index + 1]
+            - mapping_matrix_indptr[mask_1d_index]
+        )
+        total_entries += total_pix * (total_pix + 1) // 2
+
+    values = np.zeros(total_entries)
+    curvature_indexes = np.zeros(total_entries, dtype=np.int64)
+    mask_1d_indexes = np.zeros(total_entries, dtype=np.int64)
+
+    index = 0
+
+    for mask_1d_index in range(image_pixels):
+
+        start = mapping_matrix_indptr[mask_1d_index]
+        end = mapping_matrix_indptr[mask_1d_index + 1]
+
+        for preload_index_0 in range(start, end):
+            for preload_index_1 in range(preload_index_0, end):
+
+                pix_index_0 = mapping_matrix_indexes[preload_index_0]
+                pix_index_1 = mapping_matrix_indexes[preload_index_1]
+
+                if pix_index_0 > pix_index_1:
+                    pix_index_0, pix_index_1 = pix_index_1, pix_index_0
+
+                values[index] = (
+                    mapping_matrix_values[preload_index_0]
+                    * mapping_matrix_values[preload_index_1]
+                )
+                curvature_indexes[index] = pix_index_0 * pixels + pix_index_1
+                mask_1d_indexes[index] = mask_1d_index
+
+                index += 1
+
+    return values, curvature_indexes, mask_1d_indexes
+
+
+def curvature_matrix_outer_products_preload_from(mapping_matrix) -> sparse.csr_matrix:
+    """
+    Returns a sparse matrix of dimensions (pixels * pixels, image_pixels) which contains the contribution of every
+    image pixel to every entry in the upper triangle of the curvature matrix `F`, ignoring the noise-map.
+
+    The curvature matrix is F = f^T W f, where W is the diagonal matrix of inverse noise-map variances, therefore
+    F[a, b] = sum_i f[i, a] * f[i, b] / noise_map[i]**2. For models where the blurred mapping matrix `f` does not change
+    but the noise-map does (e.g. hyper-noise scaling), the products f[i, a] * f[i, b] are computed once by this
+    function. Every subsequent curvature matrix is then a single sparse matrix-vector product with the inverse
+    variances (see `curvature_matrix_via_outer_products_preload_from`).
+
+    Parameters
+    -----------
+    mapping_matrix : np.ndarray or sparse.csr_matrix
+        The matrix representing the mappings (these could be blurred or transfomed) between sub-grid pixels and
+        pixelization pixels.
+    """
+    mapping_matrix = sparse.csr_matrix(mapping_matrix)
+    mapping_matrix.eliminate_zeros()
+
+    pixels = mapping_matrix.shape[1]
+
+    values, curvature_indexes, mask_1d_indexes = curvature_matrix_outer_products_preload_entries_from(
+        mapping_matrix_indptr=mapping_matrix.indptr,
+        mapping_matrix_indexes=mapping_matrix.indices,
+        mapping_matrix_values=mapping_matrix.data,
+        pixels=pixels,
+    )
+
+    return sparse.csr_matrix(
+        (values, (curvature_indexes, mask_1d_indexes)),
+        shape=(pixels * pixels, mapping_matrix.shape[0]),
+    )
+
+
+def curvature_matrix_via_outer_products_preload_from(
+    curvature_matrix_outer_products: sparse.csr_matrix, noise_map: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the curvature matrix `F` from the preloaded outer products of the blurred mapping matrix `f` (see
+    `curvature_matrix_outer_products_preload_from`) and the 1D noise-map $\sigma$ (see Warren & Dye 2003).
+
+    The upper triangle of the curvature matrix is the sum of the outer products weighted by the inverse variance of
+    each image pixel, which is computed as one sparse matrix-vector product and then reflected to the lower triangle.
+
+    Parameters
+    -----------
+    curvature_matrix_outer_products : sparse.csr_matrix
+        The contribution of every image pixel to every entry of the upper triangle of the curvature matrix.
+    noise_map : np.ndarray
+        Flattened 1D array of the noise-map used by the inversion during the fit.
+    """
+    pixels = int(round(np.sqrt(curvature_matrix_outer_products.shape[0])))
+
+    curvature_matrix = curvature_matrix_outer_products.dot(
+        1.0 / np.asarray(noise_map) ** 2.0
+    ).reshape(pixels, pixels)
+
+    return curvature_matrix + curvature_matrix.T - np.diag(np.diag(curvature_matrix))
+
+
+def curvature_matrix_via_w_tilde_from(
+    w_tilde: np.ndarray, mapping_matrix: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the curvature matrix `F` of an interferometer inversion from the w_tilde matrix (see
+    `transformer_util.w_tilde_curvature_interferometer_from`) and the mapping matrix `f`, as F = f^T w_tilde f.
+
+    This does not perform a Fourier transform of the mapping matrix, therefore its run time does not depend on the
+    number of visibilities.
+
+    Parameters
+    -----------
+    w_tilde : np.ndarray
+        The [image_pixels, image_pixels] matrix encoding the noise-weighted Fourier transform of every pair of image
+        pixels.
+    mapping_matrix : np.ndarray
+        The matrix representing the mappings between sub-grid pixels and pixelization pixels.
+    """
+    return mapping_matrix.T @ (w_tilde @ mapping_matrix)
+
+
+def data_vector_via_w_tilde_data_from(
+    w_tilde_data: np.ndarray, mapping_matrix: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the data vector `D` of an interferometer inversion from the noise-weighted dirty image of the visibilities
+    (see `transformer_util.w_tilde_data_interferometer_from`) and the mapping matrix `f`, as D = f^T w_tilde_data.
+
+    Parameters
+    -----------
+    w_tilde_data : np.ndarray
+        The noise-weighted dirty image of the visibilities.
+    mapping_matrix : np.ndarray
+        The matrix representing the mappings between sub-grid pixels and pixelization pixels.
+    """
+    return mapping_matrix.T @ w_tilde_data
+
+
 @decorator_util.jit()
 def mapped_reconstructed_data_from(
     mapping_matrix: np.ndarray, reconstruction: np.ndarray
@@ -170,6 +483,22 @@ def mapped_reconstructed_data_from(
     return mapped_reconstructed_data
 
 
+def mapped_reconstructed_data_via_mapping_matrix_sparse_from(
+    mapping_matrix_sparse: sparse.csr_matrix, reconstruction: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the reconstructed data vector from the blurred mapping matrix `f` stored in compressed sparse row (CSR)
+    format and solution vector *S*.
+
+    Parameters
+    -----------
+    mapping_matrix_sparse : sparse.csr_matrix
+        The matrix representing the blurred mappings between sub-grid pixels and pixelization pixels.
+
+    """
+    return mapping_matrix_sparse.dot(reconstruction)
+
+
 @decorator_util.jit()
 def data_vector_via_transformed_mapping_matrix_from(
     transformed_mapping_matrix: np.ndarray,
@@ -280,23 +609,17 @@ def inversion_residual_map_from(
         The residuals of the `Inversion`'s `reconstruction` on its pixel-grid, computed by mapping the `residual_map`
         from the fit to the data.
     """
-    residual_map = np.zeros(shape=len(all_sub_slim_indexes_for_pixelization_index))
-
-    for pix_index, sub_slim_indexes in enumerate(
-        all_sub_slim_indexes_for_pixelization_index
-    ):
-
-        sub_mask_total = 0
-        for sub_mask_1d_index in sub_slim_indexes:
-            sub_mask_total += 1
-            mask_1d_index = slim_index_for_sub_slim_index[sub_mask_1d_index]
-            residual = data[mask_1d_index] - pixelization_values[pix_index]
-            residual_map[pix_index] += np.abs(residual)
-
-        if sub_mask_total > 0:
-            residual_map[pix_index] /= sub_mask_total
+    sub_slim_indexes_for_pixelization_index, sub_slim_offsets_for_pixelization_index = sub_slim_indexes_for_pixelization_index_csr_from(
+        all_sub_slim_indexes_for_pixelization_index=all_sub_slim_indexes_for_pixelization_index
+    )
 
-    return residual_map.copy()
+    return inversion_residual_map_via_csr_from(
+        pixelization_values=np.asarray(pixelization_values),
+        data=np.asarray(data),
+        slim_index_for_sub_slim_index=np.asarray(slim_index_for_sub_slim_index),
+        sub_slim_indexes_for_pixelization_index=sub_slim_indexes_for_pixelization_index,
+        sub_slim_offsets_for_pixelization_index=sub_slim_offsets_for_pixelization_index,
+    )
 
 
 def inversion_normalized_residual_map_from(
@@ -335,26 +658,18 @@ def inversion_normalized_residual_map_from(
         The normalized residuals of the `Inversion`'s `reconstruction` on its pixel-grid, computed by mapping the
         `normalized_residual_map` from the fit to the data.
     """
-    normalized_residual_map = np.zeros(
-        shape=len(all_sub_slim_indexes_for_pixelization_index)
+    sub_slim_indexes_for_pixelization_index, sub_slim_offsets_for_pixelization_index = sub_slim_indexes_for_pixelization_index_csr_from(
+        all_sub_slim_indexes_for_pixelization_index=all_sub_slim_indexes_for_pixelization_index
     )
 
-    for pix_index, sub_slim_indexes in enumerate(
-        all_sub_slim_indexes_for_pixelization_index
-    ):
-        sub_mask_total = 0
-        for sub_mask_1d_index in sub_slim_indexes:
-            sub_mask_total += 1
-            mask_1d_index = slim_index_for_sub_slim_index[sub_mask_1d_index]
-            residual = data[mask_1d_index] - pixelization_values[pix_index]
-            normalized_residual_map[pix_index] += np.abs(
-                (residual / noise_map_1d[mask_1d_index])
-            )
-
-        if sub_mask_total > 0:
-            normalized_residual_map[pix_index] /= sub_mask_total
-
-    return normalized_residual_map.copy()
+    return inversion_normalized_residual_map_via_csr_from(
+        pixelization_values=np.asarray(pixelization_values),
+        data=np.asarray(data),
+        noise_map_1d=np.asarray(noise_map_1d),
+        slim_index_for_sub_slim_index=np.asarray(slim_index_for_sub_slim_index),
+        sub_slim_indexes_for_pixelization_index=sub_slim_indexes_for_pixelization_index,
+        sub_slim_offsets_for_pixelization_index=sub_slim_offsets_for_pixelization_index,
+    )
 
 
 def inversion_chi_squared_map_from(
@@ -393,24 +708,211 @@ def inversion_chi_squared_map_from(
         The chi-squareds of the `Inversion`'s `reconstruction` on its pixel-grid, computed by mapping the `chi-squared_map`
         from the fit to the data.
     """
-    chi_squared_map = np.zeros(shape=len(all_sub_slim_indexes_for_pixelization_index))
+    sub_slim_indexes_for_pixelization_index, sub_slim_offsets_for_pixelization_index = sub_slim_indexes_for_pixelization_index_csr_from(
+        all_sub_slim_indexes_for_pixelization_index=all_sub_slim_indexes_for_pixelization_index
+    )
+
+    return inversion_chi_squared_map_via_csr_from(
+        pixelization_values=np.asarray(pixelization_values),
+        data=np.asarray(data),
+        noise_map_1d=np.asarray(noise_map_1d),
+        slim_index_for_sub_slim_index=np.asarray(slim_index_for_sub_slim_index),
+        sub_slim_indexes_for_pixelization_index=sub_slim_indexes_for_pixelization_index,
+        sub_slim_offsets_for_pixelization_index=sub_slim_offsets_for_pixelization_index,
+    )
+
+
+def sub_slim_indexes_for_pixelization_index_csr_from(
+    all_sub_slim_indexes_for_pixelization_index: [list],
+) -> (np.ndarray, np.ndarray):
+    """
+    Returns the mappings of every pixel on the `Inversion`'s `reconstruction`'s pixel-grid to the `data` pixels in
+    compressed sparse row (CSR) format (see `mapper_util.sub_slim_indexes_for_pixelization_index_from`), from these
+    mappings as a list of lists.
+
+    Parameters
+    ----------
+    all_sub_slim_indexes_for_pixelization_index : [list]
+        The mapping of every pixel on the `Inversion`'s `reconstruction`'s pixel-grid to the `data` pixels.
+    """
+    sub_slim_offsets_for_pixelization_index = np.zeros(
+        len(all_sub_slim_indexes_for_pixelization_index) + 1, dtype=np.int64
+    )
+    sub_slim_offsets_for_pixelization_index[1:] = np.cumsum(
+        [
+            len(sub_slim_indexes)
+            for sub_slim_indexes in all_sub_slim_indexes_for_pixelization_index
+        ]
+    )
+
+    sub_slim_indexes_for_pixelization_index = np.array(
+        list(
+            itertools.chain.from_iterable(all_sub_slim_indexes_for_pixelization_index)
+        ),
+        dtype=np.int64,
+    )
+
+    return (
+        sub_slim_indexes_for_pixelization_index,
+        sub_slim_offsets_for_pixelization_index,
+    )
+
+
+@decorator_util.jit()
+def inversion_residual_map_via_csr_from(
+    pixelization_values: np.ndarray,
+    data: np.ndarray,
+    slim_index_for_sub_slim_index: np.ndarray,
+    sub_slim_indexes_for_pixelization_index: np.ndarray,
+    sub_slim_offsets_for_pixelization_index: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the residual-map of the `reconstruction` of an `Inversion` on its pixel-grid, using the mappings of every
+    pixel on the pixel-grid to the `data` pixels in compressed sparse row (CSR) format (see
+    `inversion_residual_map_from`).
+
+    Parameters
+    ----------
+    pixelization_values : np.ndarray
+        The values computed by the `Inversion` for the `reconstruction`, which are used in this function to compute
+        the `residual_map` values.
+    data : np.ndarray
+        The array of `data` that the `Inversion` fits.
+    slim_index_for_sub_slim_index : np.ndarray
+        The mappings between the observed grid's sub-pixels and observed grid's pixels.
+    sub_slim_indexes_for_pixelization_index : np.ndarray
+        The sub-slimmed indexes of the `data` pixels, sorted by the pixel on the pixel-grid they map to.
+    sub_slim_offsets_for_pixelization_index : np.ndarray
+        The offsets of every pixel's entries in `sub_slim_indexes_for_pixelization_index`.
+    """
+    pixels = sub_slim_offsets_for_pixelization_index.shape[0] - 1
+
+    residual_map = np.zeros(pixels)
+
+    for pix_index in range(pixels):
+
+        sub_mask_start = sub_slim_offsets_for_pixelization_index[pix_index]
+        sub_mask_end = sub_slim_offsets_for_pixelization_index[pix_index + 1]
+
+        for sub_index in range(sub_mask_start, sub_mask_end):
+            mask_1d_index = slim_index_for_sub_slim_index[
+                sub_slim_indexes_for_pixelization_index[sub_index]
+            ]
+            residual = data[mask_1d_index] - pixelization_values[pix_index]
+            residual_map[pix_index] += np.abs(residual)
+
+        if sub_mask_end > sub_mask_start:
+            residual_map[pix_index] /= sub_mask_end - sub_mask_start
+
+    return residual_map
+
+
+@decorator_util.jit()
+def inversion_normalized_residual_map_via_csr_from(
+    pixelization_values: np.ndarray,
+    data: np.ndarray,
+    noise_map_1d: np.ndarray,
+    slim_index_for_sub_slim_index: np.ndarray,
+    sub_slim_indexes_for_pixelization_index: np.ndarray,
+    sub_slim_offsets_for_pixelization_index: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the normalized residual-map of the `reconstruction` of an `Inversion` on its pixel-grid, using the
+    mappings of every pixel on the pixel-grid to the `data` pixels in compressed sparse row (CSR) format (see
+    `inversion_normalized_residual_map_from`).
+
+    Parameters
+    ----------
+    pixelization_values : np.ndarray
+        The values computed by the `Inversion` for the `reconstruction`, which are used in this function to compute
+        the `normalized residual_map` values.
+    data : np.ndarray
+        The array of `data` that the `Inversion` fits.
+    noise_map_1d : np.ndarray
+        The noise-map of the `data` that the `Inversion` fits.
+    slim_index_for_sub_slim_index : np.ndarray
+        The mappings between the observed grid's sub-pixels and observed grid's pixels.
+    sub_slim_indexes_for_pixelization_index : np.ndarray
+        The sub-slimmed indexes of the `data` pixels, sorted by the pixel on the pixel-grid they map to.
+    sub_slim_offsets_for_pixelization_index : np.ndarray
+        The offsets of every pixel's entries in `sub_slim_indexes_for_pixelization_index`.
+    """
+    pixels = sub_slim_offsets_for_pixelization_index.shape[0] - 1
+
+    normalized_residual_map = np.zeros(pixels)
+
+    for pix_index in range(pixels):
+
+        sub_mask_start = sub_slim_offsets_for_pixelization_index[pix_index]
+        sub_mask_end = sub_slim_offsets_for_pixelization_index[pix_index + 1]
+
+        for sub_index in range(sub_mask_start, sub_mask_end):
+            mask_1d_index = slim_index_for_sub_slim_index[
+                sub_slim_indexes_for_pixelization_index[sub_index]
+            ]
+            residual = data[mask_1d_index] - pixelization_values[pix_index]
+            normalized_residual_map[pix_index] += np.abs(
+                (residual / noise_map_1d[mask_1d_index])
+            )
+
+        if sub_mask_end > sub_mask_start:
+            normalized_residual_map[pix_index] /= sub_mask_end - sub_mask_start
+
+    return normalized_residual_map
+
+
+@decorator_util.jit()
+def inversion_chi_squared_map_via_csr_from(
+    pixelization_values: np.ndarray,
+    data: np.ndarray,
+    noise_map_1d: np.ndarray,
+    slim_index_for_sub_slim_index: np.ndarray,
+    sub_slim_indexes_for_pixelization_index: np.ndarray,
+    sub_slim_offsets_for_pixelization_index: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the chi-squared-map of the `reconstruction` of an `Inversion` on its pixel-grid, using the mappings of
+    every pixel on the pixel-grid to the `data` pixels in compressed sparse row (CSR) format (see
+    `inversion_chi_squared_map_from`).
 
-    for pix_index, sub_slim_indexes in enumerate(
-        all_sub_slim_indexes_for_pixelization_index
-    ):
-        sub_mask_total = 0
-        for sub_mask_1d_index in sub_slim_indexes:
-            sub_mask_total += 1
-            mask_1d_index = slim_index_for_sub_slim_index[sub_mask_1d_index]
+    Parameters
+    ----------
+    pixelization_values : np.ndarray
+        The values computed by the `Inversion` for the `reconstruction`, which are used in this function to compute
+        the `chi_squared_map` values.
+    data : np.ndarray
+        The array of `data` that the `Inversion` fits.
+    noise_map_1d : np.ndarray
+        The noise-map of the `data` that the `Inversion` fits.
+    slim_index_for_sub_slim_index : np.ndarray
+        The mappings between the observed grid's sub-pixels and observed grid's pixels.
+    sub_slim_indexes_for_pixelization_index : np.ndarray
+        The sub-slimmed indexes of the `data` pixels, sorted by the pixel on the pixel-grid they map to.
+    sub_slim_offsets_for_pixelization_index : np.ndarray
+        The offsets of every pixel's entries in `sub_slim_indexes_for_pixelization_index`.
+    """
+    pixels = sub_slim_offsets_for_pixelization_index.shape[0] - 1
+
+    chi_squared_map = np.zeros(pixels)
+
+    for pix_index in range(pixels):
+
+        sub_mask_start = sub_slim_offsets_for_pixelization_index[pix_index]
+        sub_mask_end = sub_slim_offsets_for_pixelization_index[pix_index + 1]
+
+        for sub_index in range(sub_mask_start, sub_mask_end):
+            mask_1d_index = slim_index_for_sub_slim_index[
+                sub_slim_indexes_for_pixelization_index[sub_index]
+            ]
             residual = data[mask_1d_index] - pixelization_values[pix_index]
             chi_squared_map[pix_index] += (
                 residual / noise_map_1d[mask_1d_index]
             ) ** 2.0
 
-        if sub_mask_total > 0:
-            chi_squared_map[pix_index] /= sub_mask_total
+        if sub_mask_end > sub_mask_start:
+            chi_squared_map[pix_index] /= sub_mask_end - sub_mask_start
 
-    return chi_squared_map.copy()
+    return chi_squared_map
 
 
 def preconditioner_matrix_via_mapping_matrix_from(
@@ -440,3 +942,190 @@ def preconditioner_matrix_via_mapping_matrix_from(
     return (
         preconditioner_noise_normalization * curvature_matrix
     ) + regularization_matrix
+
+
+def preconditioner_matrix_sparse_via_mapping_matrix_from(
+    mapping_matrix: np.ndarray,
+    regularization_matrix_sparse: sparse.csr_matrix,
+    preconditioner_noise_normalization: float,
+) -> sparse.csc_matrix:
+    """
+    Returns the preconditioner matrix (see `preconditioner_matrix_via_mapping_matrix_from`) as a sparse matrix, which
+    is computed from the sparse mapping matrix and regularization matrix without forming any dense matrix.
+
+    Parameters
+    -----------
+    mapping_matrix : np.ndarray
+        The matrix representing the mappings between sub-grid pixels and pixelization pixels.
+    regularization_matrix_sparse : sparse.csr_matrix
+        The sparse matrix defining how the pixelization's pixels are regularized with one another for smoothing (H).
+    preconditioner_noise_normalization : np.ndarray
+        The sum of (1.0 / noise-map**2.0) every value in the noise-map.
+    """
+    mapping_matrix_sparse = sparse.csr_matrix(mapping_matrix)
+
+    return sparse.csc_matrix(
+        preconditioner_noise_normalization
+        * (mapping_matrix_sparse.T @ mapping_matrix_sparse)
+        + regularization_matrix_sparse
+    )
+
+
+def reconstruction_via_preconditioned_conjugate_gradient_from(
+    curvature_reg_matvec,
+    data_vector: np.ndarray,
+    preconditioner_solve,
+    initial_reconstruction: np.ndarray = None,
+    tolerance: float = 1e-8,
+    maxiter: int = 250,
+):
+    """
+    Solve the linear system (F + H) s = D for the reconstruction `s` using the preconditioned conjugate gradient
+    method, where the curvature reg matrix (F + H) and the inverse of the preconditioner are only accessed via
+    functions which apply them to a vector.
+
+    The solver starts from `initial_reconstruction` if input, for example the reconstruction of the previous model
+    of a non-linear search, which reduces the number of iterations when consecutive models are similar. It stops when
+    the norm of the residual D - (F + H) s is below `tolerance` times the norm of `D`, or after `maxiter` iterations.
+
+    Parameters
+    -----------
+    curvature_reg_matvec : func
+        The function which returns the curvature reg matrix (F + H) multiplied by a vector.
+    data_vector : np.ndarray
+        The data vector D.
+    preconditioner_solve : func
+        The function which returns the inverse of the preconditioner matrix multiplied by a vector.
+    initial_reconstruction : np.ndarray or None
+        The reconstruction the solver starts from, which is all zeros if not input.
+    tolerance : float
+        The tolerance of the norm of the residual relative to the norm of the data vector.
+    maxiter : int
+        The maximum number of iterations.
+
+    Returns
+    -------
+    (np.ndarray, int, np.ndarray)
+        The reconstruction, the number of iterations performed and the norm of the residual at the start and after
+        every iteration.
+    """
+    if initial_reconstruction is None:
+        reconstruction = np.zeros(data_vector.shape[0])
+        residual = np.array(data_vector, dtype="float")
+    else:
+        reconstruction = np.array(initial_reconstruction, dtype="float")
+        residual = data_vector - curvature_reg_matvec(reconstruction)
+
+    residual_norms = [np.linalg.norm(residual)]
+    residual_norm_limit = tolerance * np.linalg.norm(data_vector)
+
+    preconditioned_residual = preconditioner_solve(residual)
+    search_direction = preconditioned_residual.copy()
+    residual_dot = residual @ preconditioned_residual
+
+    iterations = 0
+
+    while iterations < maxiter and residual_norms[-1] > residual_norm_limit:
+
+        curvature_reg_search_direction = curvature_reg_matvec(search_direction)
+
+        step = residual_dot / (search_direction @ curvature_reg_search_direction)
+
+        reconstruction += step * search_direction
+        residual -= step * curvature_reg_search_direction
+
+        residual_norms.append(np.linalg.norm(residual))
+        iterations += 1
+
+        preconditioned_residual = preconditioner_solve(residual)
+        residual_dot_new = residual @ preconditioned_residual
+        search_direction = (
+            preconditioned_residual
+            + (residual_dot_new / residual_dot) * search_direction
+        )
+        residual_dot = residual_dot_new
+
+    return reconstruction, iterations, np.asarray(residual_norms)
+
+
+def log_determinant_via_stochastic_lanczos_quadrature_from(
+    matvec,
+    pixels: int,
+    total_probes: int = 30,
+    lanczos_steps: int = 30,
+    seed: int = 1,
+) -> float:
+    """
+    Estimate the log determinant of a positive-definite matrix, for example the curvature reg matrix ln[det(F + H)],
+    using stochastic Lanczos quadrature, which only accesses the matrix via a function which multiplies it with a
+    vector.
+
+    The log determinant is the trace of the matrix logarithm, which is estimated as the average of z^T log(A) z over
+    `total_probes` random vectors z whose entries are +1 or -1 (Hutchinson's estimator). Each z^T log(A) z is
+    computed via Gaussian quadrature using the tridiagonal matrix T of `lanczos_steps` steps of the Lanczos algorithm
+    started from z, as n * sum_k tau_k^2 log(theta_k), where theta_k are the eigenvalues of T and tau_k the first
+    entries of its eigenvectors.
+
+    The cost is `total_probes` * `lanczos_steps` matrix-vector products, as opposed to the cube of the matrix
+    dimensions for a Cholesky decomposition. The estimate is random, but reproducible for the same `seed`.
+
+    Parameters
+    -----------
+    matvec : func
+        The function which returns the matrix multiplied by a vector.
+    pixels : int
+        The dimensions of the matrix.
+    total_probes : int
+        The number of random vectors the trace of the matrix logarithm is averaged over.
+    lanczos_steps : int
+        The number of Lanczos steps (and matrix-vector products) used for every random vector.
+    seed : int
+        The seed of the random number generator of the random vectors.
+    """
+    random_state = np.random.RandomState(seed)
+
+    lanczos_steps = min(lanczos_steps, pixels)
+
+    log_determinant = 0.0
+
+    for probe in range(total_probes):
+
+        probe_vector = random_state.choice([-1.0, 1.0], size=pixels)
+
+        basis = np.zeros((lanczos_steps, pixels))
+        alphas = np.zeros(lanczos_steps)
+        betas = np.zeros(lanczos_steps)
+
+        basis[0] = probe_vector / np.sqrt(pixels)
+
+        steps = lanczos_steps
+
+        for step in range(lanczos_steps):
+
+            vector = matvec(basis[step])
+
+            alphas[step] = basis[step] @ vector
+
+            vector -= basis[: step + 1].T @ (basis[: step + 1] @ vector)
+
+            if step + 1 == lanczos_steps:
+                break
+
+            betas[step] = np.linalg.norm(vector)
+
+            if betas[step] < 1e-12 * np.abs(alphas[step]):
+                steps = step + 1
+                break
+
+            basis[step + 1] = vector / betas[step]
+
+        eigenvalues, eigenvectors = eigh_tridiagonal(
+            alphas[:steps], betas[: steps - 1]
+        )
+
+        if np.any(eigenvalues <= 0.0):
+            raise exc.InversionException()
+
+        log_determinant += pixels * np.sum(eigenvectors[0] ** 2.0 * np.log(eigenvalues))
+
+    return log_determinant / total_probes
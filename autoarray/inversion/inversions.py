@@ -12,6 +12,8 @@ from autoarray.dataset import imaging, interferometer
 from autoarray import preloads as pload
 from scipy.interpolate import griddata
 from scipy import sparse
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, eigh
+from scipy.sparse.linalg import splu
 import pylops
 import typing
 
@@ -23,12 +25,55 @@ class SettingsInversion:
         tolerance=1e-8,
         maxiter=250,
         check_solution=True,
+        sparse_fill_fraction_threshold=0.01,
+        use_w_tilde=False,
+        stochastic_log_det_probes=None,
+        stochastic_log_det_lanczos_steps=30,
+        stochastic_log_det_seed=1,
     ):
+        """
+        The settings of an `Inversion`.
 
+        Parameters
+        ----------
+        use_linear_operators : bool
+            If `True`, interferometer inversions are performed using linear operators (via pylops) as opposed to
+            matrices.
+        tolerance : float
+            The tolerance of the linear operator inversion's iterative solver.
+        maxiter : int
+            The maximum number of iterations of the linear operator inversion's iterative solver.
+        check_solution : bool
+            If `True`, the inversion raises an `InversionException` if every reconstructed value is the same, which
+            indicates a failed inversion.
+        sparse_fill_fraction_threshold : float
+            If the fraction of non-zero entries in the mapper's mapping matrix (see
+            `Mapper.mapping_matrix_fill_fraction`) is below this value, imaging inversions store the mapping matrix
+            and blurred mapping matrix as sparse matrices, which are used directly to compute the data vector and
+            curvature matrix. Setting this to 0.0 always uses dense matrices.
+        use_w_tilde : bool
+            If `True`, interferometer inversions which use matrices compute the curvature matrix and data vector from
+            the w_tilde preload of the `Interferometer` (see `Interferometer.w_tilde`), such that their calculation
+            does not depend on the number of visibilities.
+        stochastic_log_det_probes : int or None
+            If input, linear operator inversions estimate the log determinant of the curvature reg matrix using
+            stochastic Lanczos quadrature with this many random probe vectors (see
+            `inversion_util.log_determinant_via_stochastic_lanczos_quadrature_from`), as opposed to using the log
+            determinant of the preconditioner matrix.
+        stochastic_log_det_lanczos_steps : int
+            The number of Lanczos steps used for every probe vector of the stochastic log determinant.
+        stochastic_log_det_seed : int
+            The seed of the random probe vectors of the stochastic log determinant, which makes it reproducible.
+        """
         self.use_linear_operators = use_linear_operators
         self.tolerance = tolerance
         self.maxiter = maxiter
         self.check_solution = check_solution
+        self.sparse_fill_fraction_threshold = sparse_fill_fraction_threshold
+        self.use_w_tilde = use_w_tilde
+        self.stochastic_log_det_probes = stochastic_log_det_probes
+        self.stochastic_log_det_lanczos_steps = stochastic_log_det_lanczos_steps
+        self.stochastic_log_det_seed = stochastic_log_det_seed
 
 
 def inversion(
@@ -36,6 +81,7 @@ def inversion(
     mapper: typing.Union[mappers.MapperRectangular, mappers.MapperVoronoi],
     regularization,
     settings=SettingsInversion(),
+    initial_reconstruction=None,
 ):
 
     if isinstance(dataset, imaging.Imaging):
@@ -58,6 +104,8 @@ def inversion(
             mapper=mapper,
             regularization=regularization,
             settings=settings,
+            w_tilde=dataset.w_tilde if settings.use_w_tilde else None,
+            initial_reconstruction=initial_reconstruction,
         )
 
 
@@ -83,6 +131,50 @@ def log_determinant_of_matrix_cholesky(matrix):
         raise exc.InversionException()
 
 
+def sparse_lu_of_matrix(matrix):
+    """
+    Returns the sparse LU decomposition of a sparse positive-definite matrix, for example the regularization matrix.
+
+    The matrix is factorized with a fill-reducing ordering, applied symmetrically to its rows and columns with no
+    pivoting. For a positive-definite matrix every diagonal entry of U is then positive, which is checked such that an
+    `InversionException` is raised if the matrix is not positive-definite. The cost scales with the number of non-zero
+    entries of the factorization, as opposed to the cube of the matrix dimensions for a dense Cholesky decomposition.
+
+    Parameters
+    -----------
+    matrix : sparse.csc_matrix
+        The sparse positive-definite matrix which is factorized.
+    """
+    try:
+        lu = splu(
+            sparse.csc_matrix(matrix),
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options=dict(SymmetricMode=True),
+        )
+    except RuntimeError:
+        raise exc.InversionException()
+
+    if np.any(lu.U.diagonal() <= 0.0):
+        raise exc.InversionException()
+
+    return lu
+
+
+def log_determinant_of_sparse_matrix_lu(matrix):
+    """
+    Returns the log determinant of a sparse positive-definite matrix, for example the regularization matrix
+    ln[det(H)] (see `log_determinant_of_matrix_cholesky`), as the sum of the logs of the diagonal entries of U of its
+    sparse LU decomposition (see `sparse_lu_of_matrix`).
+
+    Parameters
+    -----------
+    matrix : sparse.csc_matrix
+        The sparse positive-definite matrix the log determinant is computed for.
+    """
+    return np.sum(np.log(sparse_lu_of_matrix(matrix=matrix).U.diagonal()))
+
+
 class AbstractInversion:
     def __init__(
         self,
@@ -92,15 +184,46 @@ class AbstractInversion:
         regularization_matrix: np.ndarray,
         reconstruction: np.ndarray,
         settings: SettingsInversion,
+        regularization_matrix_sparse: typing.Optional[sparse.csr_matrix] = None,
+        log_det_regularization_matrix_term: typing.Optional[float] = None,
     ):
 
         self.noise_map = noise_map
         self.mapper = mapper
         self.regularization = regularization
         self.regularization_matrix = regularization_matrix
+        self._regularization_matrix_sparse = regularization_matrix_sparse
+        self._log_det_regularization_matrix_term = log_det_regularization_matrix_term
         self.reconstruction = reconstruction
         self.settings = settings
 
+    @property
+    def regularization_matrix(self):
+        return self._regularization_matrix
+
+    @regularization_matrix.setter
+    def regularization_matrix(self, regularization_matrix):
+        """
+        Setting the regularization_matrix discards its sparse representation and log determinant, which are
+        recomputed when they are next required.
+        """
+        self._regularization_matrix = regularization_matrix
+        self._regularization_matrix_sparse = None
+        self._log_det_regularization_matrix_term = None
+
+    @property
+    def regularization_matrix_sparse(self):
+        """
+        The regularization matrix (H) as a compressed sparse row (CSR) matrix, which is used to compute its log
+        determinant.
+        """
+        if self._regularization_matrix_sparse is None:
+            self._regularization_matrix_sparse = sparse.csr_matrix(
+                self.regularization_matrix
+            )
+
+        return self._regularization_matrix_sparse
+
     def interpolated_reconstructed_data_from_shape_native(self, shape_native=None):
         return self.interpolated_values_from_shape_native(
             values=self.reconstruction, shape_native=shape_native
@@ -182,7 +305,12 @@ class AbstractInversion:
 
     @property
     def log_det_regularization_matrix_term(self):
-        return log_determinant_of_matrix_cholesky(self.regularization_matrix)
+        if self._log_det_regularization_matrix_term is None:
+            self._log_det_regularization_matrix_term = log_determinant_of_sparse_matrix_lu(
+                self.regularization_matrix_sparse
+            )
+
+        return self._log_det_regularization_matrix_term
 
     @property
     def brightest_reconstruction_pixel(self):
@@ -221,25 +349,93 @@ class AbstractInversion:
         )
 
 
+def cholesky_factor_of_matrix(matrix):
+    """
+    Returns the Cholesky factorization of a positive-definite matrix, in the form returned by `scipy.linalg.cho_factor`
+    and accepted by `scipy.linalg.cho_solve`.
+
+    An inversion factorizes the curvature_reg_matrix (F + H) once and reuses the factor to solve for the
+    reconstruction, compute the log determinant ln[det(F + H)] and compute the covariance matrix of the
+    reconstruction.
+
+    Parameters
+    -----------
+    matrix : np.ndarray
+        The positive-definite matrix which is factorized.
+    """
+    try:
+        return cho_factor(matrix)
+    except np.linalg.LinAlgError:
+        raise exc.InversionException()
+
+
 class AbstractInversionMatrix:
     def __init__(
         self,
         curvature_reg_matrix: np.ndarray,
         curvature_matrix: np.ndarray,
-        regularization_matrix: np.ndarray,
+        curvature_reg_matrix_cholesky: typing.Optional[tuple] = None,
+        log_det_curvature_reg_matrix_term: typing.Optional[float] = None,
     ):
 
         self.curvature_matrix = curvature_matrix
         self.curvature_reg_matrix = curvature_reg_matrix
-        self.regularization_matrix = regularization_matrix
+        self._curvature_reg_matrix_cholesky = curvature_reg_matrix_cholesky
+        self._log_det_curvature_reg_matrix_term = log_det_curvature_reg_matrix_term
+
+    @property
+    def curvature_reg_matrix(self):
+        return self._curvature_reg_matrix
+
+    @curvature_reg_matrix.setter
+    def curvature_reg_matrix(self, curvature_reg_matrix):
+        """
+        Setting the curvature_reg_matrix discards its Cholesky factorization and log determinant, which are
+        recomputed when they are next required.
+        """
+        self._curvature_reg_matrix = curvature_reg_matrix
+        self._curvature_reg_matrix_cholesky = None
+        self._log_det_curvature_reg_matrix_term = None
+
+    @property
+    def curvature_reg_matrix_cholesky(self):
+        """
+        The Cholesky factorization of the curvature_reg_matrix (F + H), in the form returned by
+        `scipy.linalg.cho_factor`.
+
+        This is computed once when the inversion solves for its reconstruction and is reused for the log determinant
+        and covariance matrix calculations.
+        """
+        if self._curvature_reg_matrix_cholesky is None:
+            self._curvature_reg_matrix_cholesky = cholesky_factor_of_matrix(
+                matrix=self.curvature_reg_matrix
+            )
+
+        return self._curvature_reg_matrix_cholesky
 
     @property
     def log_det_curvature_reg_matrix_term(self):
-        return log_determinant_of_matrix_cholesky(self.curvature_reg_matrix)
+        """
+        The log determinant ln[det(F + H)], computed from the diagonal of the Cholesky factorization of the
+        curvature_reg_matrix unless it was input when the inversion was created.
+        """
+        if self._log_det_curvature_reg_matrix_term is None:
+            self._log_det_curvature_reg_matrix_term = 2.0 * np.sum(
+                np.log(np.diag(self.curvature_reg_matrix_cholesky[0]))
+            )
+
+        return self._log_det_curvature_reg_matrix_term
 
     @property
     def errors_with_covariance(self):
-        return np.linalg.inv(self.curvature_reg_matrix)
+        """
+        The covariance matrix of the reconstruction, which is the inverse of the curvature_reg_matrix and computed
+        using its Cholesky factorization.
+        """
+        return cho_solve(
+            self.curvature_reg_matrix_cholesky,
+            np.eye(self.curvature_reg_matrix.shape[0]),
+        )
 
     @property
     def errors(self):
@@ -260,6 +456,10 @@ class InversionImagingMatrix(AbstractInversion, AbstractInversionMatrix):
         curvature_reg_matrix: np.ndarray,
         reconstruction: np.ndarray,
         settings: SettingsInversion,
+        curvature_reg_matrix_cholesky: typing.Optional[tuple] = None,
+        regularization_matrix_sparse: typing.Optional[sparse.csr_matrix] = None,
+        log_det_curvature_reg_matrix_term: typing.Optional[float] = None,
+        log_det_regularization_matrix_term: typing.Optional[float] = None,
     ):
         """ An inversion, which given an input image and noise-map reconstructs the image using a linear inversion, \
         including a convolution that accounts for blurring.
@@ -284,15 +484,19 @@ class InversionImagingMatrix(AbstractInversion, AbstractInversionMatrix):
 
         Attributes
         -----------
-        blurred_mapping_matrix : np.ndarray
+        blurred_mapping_matrix : np.ndarray or scipy.sparse.csr_matrix
             The matrix representing the blurred mappings between the image's sub-grid of pixels and the pixelization \
-            pixels.
+            pixels. This is a sparse matrix if the inversion used the sparse mapping matrix (see \
+            `SettingsInversion.sparse_fill_fraction_threshold`).
         regularization_matrix : np.ndarray
             The matrix defining how the pixelization's pixels are regularized with one another for smoothing (H).
         curvature_matrix : np.ndarray
             The curvature_matrix between each pixelization pixel and all other pixelization pixels (F).
         curvature_reg_matrix : np.ndarray
             The curvature_matrix + regularization matrix.
+        curvature_reg_matrix_cholesky : (np.ndarray, bool)
+            The Cholesky factorization of the curvature_reg_matrix, used to solve for the reconstruction and reused \
+            to compute its log determinant and the errors.
         solution_vector : np.ndarray
             The vector containing the reconstructed fit to the hyper_galaxies.
         """
@@ -304,48 +508,91 @@ class InversionImagingMatrix(AbstractInversion, AbstractInversionMatrix):
             regularization_matrix=regularization_matrix,
             reconstruction=reconstruction,
             settings=settings,
+            regularization_matrix_sparse=regularization_matrix_sparse,
+            log_det_regularization_matrix_term=log_det_regularization_matrix_term,
         )
 
         AbstractInversionMatrix.__init__(
             self=self,
             curvature_matrix=curvature_matrix,
             curvature_reg_matrix=curvature_reg_matrix,
-            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix_cholesky=curvature_reg_matrix_cholesky,
+            log_det_curvature_reg_matrix_term=log_det_curvature_reg_matrix_term,
         )
 
         self.image = image
         self.convolver = convolver
         self.blurred_mapping_matrix = blurred_mapping_matrix
 
-    @classmethod
-    def from_data_mapper_and_regularization(
-        cls,
+        self._curvature_matrix_outer_products = None
+
+    @staticmethod
+    def blurred_mapping_matrix_data_vector_and_curvature_matrix_from(
         image: array_2d.Array2D,
         noise_map: array_2d.Array2D,
         convolver: conv.Convolver,
         mapper: typing.Union[mappers.MapperRectangular, mappers.MapperVoronoi],
-        regularization: reg.Regularization,
         settings=SettingsInversion(),
         preloads=pload.Preloads(),
     ):
+        """
+        Returns the blurred mapping matrix `f`, data vector `D` and curvature matrix `F` of an imaging inversion, which
+        do not depend on the regularization.
 
+        Parameters
+        -----------
+        image : np.ndarray
+            Flattened 1D array of the observed image the inversion is fitting.
+        noise_map : np.ndarray
+            Flattened 1D array of the noise-map used by the inversion during the fit.
+        convolver : imaging.convolution.Convolver
+            The convolver used to blur the mapping matrix with the PSF.
+        mapper : inversion.mappers.Mapper
+            The util between the image-pixels (via its / sub-grid) and pixelization pixels.
+        """
         if preloads.blurred_mapping_matrix is None:
 
-            blurred_mapping_matrix = convolver.convolve_mapping_matrix(
-                mapping_matrix=mapper.mapping_matrix
-            )
+            if (
+                mapper.mapping_matrix_fill_fraction
+                < settings.sparse_fill_fraction_threshold
+            ):
+
+                blurred_mapping_matrix = convolver.convolve_mapping_matrix_sparse(
+                    mapping_matrix_sparse=mapper.mapping_matrix_sparse
+                )
+
+            else:
+
+                blurred_mapping_matrix = convolver.convolve_mapping_matrix(
+                    mapping_matrix=mapper.mapping_matrix
+                )
 
         else:
 
             blurred_mapping_matrix = preloads.blurred_mapping_matrix
 
-        data_vector = inversion_util.data_vector_via_blurred_mapping_matrix_from(
+        data_vector = inversion_util.data_vector_via_blurred_mapping_matrix_and_inverse_variance_map_from(
             blurred_mapping_matrix=blurred_mapping_matrix,
             image=image,
-            noise_map=noise_map,
+            inverse_variance_map=inversion_util.inverse_variance_map_from(
+                noise_map=noise_map
+            ),
         )
 
-        if preloads.curvature_matrix_sparse_preload is None:
+        if preloads.curvature_matrix_outer_products is not None:
+
+            curvature_matrix = inversion_util.curvature_matrix_via_outer_products_preload_from(
+                curvature_matrix_outer_products=preloads.curvature_matrix_outer_products,
+                noise_map=noise_map,
+            )
+
+        elif sparse.issparse(blurred_mapping_matrix):
+
+            curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_sparse_from(
+                mapping_matrix_sparse=blurred_mapping_matrix, noise_map=noise_map
+            )
+
+        elif preloads.curvature_matrix_sparse_preload is None:
 
             curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
                 mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
@@ -364,16 +611,45 @@ class InversionImagingMatrix(AbstractInversion, AbstractInversionMatrix):
                 ),
             )
 
-        regularization_matrix = regularization.regularization_matrix_from_mapper(
+        return blurred_mapping_matrix, data_vector, curvature_matrix
+
+    @classmethod
+    def from_data_mapper_and_regularization(
+        cls,
+        image: array_2d.Array2D,
+        noise_map: array_2d.Array2D,
+        convolver: conv.Convolver,
+        mapper: typing.Union[mappers.MapperRectangular, mappers.MapperVoronoi],
+        regularization: reg.Regularization,
+        settings=SettingsInversion(),
+        preloads=pload.Preloads(),
+    ):
+
+        (
+            blurred_mapping_matrix,
+            data_vector,
+            curvature_matrix,
+        ) = cls.blurred_mapping_matrix_data_vector_and_curvature_matrix_from(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            settings=settings,
+            preloads=preloads,
+        )
+
+        regularization_matrix_sparse = regularization.regularization_matrix_sparse_from_mapper(
             mapper=mapper
         )
+        regularization_matrix = regularization_matrix_sparse.toarray()
 
         curvature_reg_matrix = np.add(curvature_matrix, regularization_matrix)
 
-        try:
-            values = np.linalg.solve(curvature_reg_matrix, data_vector)
-        except np.linalg.LinAlgError:
-            raise exc.InversionException()
+        curvature_reg_matrix_cholesky = cholesky_factor_of_matrix(
+            matrix=curvature_reg_matrix
+        )
+
+        values = cho_solve(curvature_reg_matrix_cholesky, data_vector)
 
         if settings.check_solution:
             if np.isclose(a=values[0], b=values[1], atol=1e-4).all():
@@ -389,17 +665,192 @@ class InversionImagingMatrix(AbstractInversion, AbstractInversionMatrix):
             blurred_mapping_matrix=blurred_mapping_matrix,
             curvature_matrix=curvature_matrix,
             regularization_matrix=regularization_matrix,
+            regularization_matrix_sparse=regularization_matrix_sparse,
             curvature_reg_matrix=curvature_reg_matrix,
+            curvature_reg_matrix_cholesky=curvature_reg_matrix_cholesky,
             reconstruction=values,
             settings=settings,
         )
 
+    @classmethod
+    def list_from_data_mapper_and_regularization_coefficients(
+        cls,
+        image: array_2d.Array2D,
+        noise_map: array_2d.Array2D,
+        convolver: conv.Convolver,
+        mapper: typing.Union[mappers.MapperRectangular, mappers.MapperVoronoi],
+        coefficients: typing.List[float],
+        settings=SettingsInversion(),
+        preloads=pload.Preloads(),
+    ):
+        """
+        Returns a list of inversions of the same image, mapper and convolver using `Constant` regularization schemes
+        with each of the input regularization coefficients, as used when searching for the coefficient which maximizes
+        the Bayesian evidence.
+
+        The blurred mapping matrix, data vector `D` and curvature matrix `F` do not depend on the regularization, and
+        are computed once. The constant regularization matrix is H(c) = e * I + c^2 * B, where e * I = H(0) is the
+        small diagonal term which keeps H positive-definite and B is the unit-coefficient regularization matrix.
+
+        Source pixels which no image pixel maps to give F all-zero columns, so F + H(0) is numerically singular.
+        The decomposition is therefore performed about a reference matrix F + H(c_ref), where c_ref is the median of
+        the (non-zero) input coefficients. The generalized eigendecomposition B V = (F + H(c_ref)) V diag(mu),
+        normalized such that V^T (F + H(c_ref)) V = I, and the eigenvalues lambda of B are computed once, after which
+        for every coefficient:
+
+        - The reconstruction is V diag(1 / (1 + (c^2 - c_ref^2) mu)) V^T D.
+        - ln[det(F + H)] = ln[det(F + H(c_ref))] + sum ln(1 + (c^2 - c_ref^2) mu).
+        - ln[det(H)] = sum ln(e + c^2 lambda).
+
+        Each coefficient therefore costs O(pixels^2) operations, rather than the O(pixels^3) Cholesky decompositions
+        of `from_data_mapper_and_regularization`.
+
+        Parameters
+        -----------
+        image : np.ndarray
+            Flattened 1D array of the observed image the inversion is fitting.
+        noise_map : np.ndarray
+            Flattened 1D array of the noise-map used by the inversion during the fit.
+        convolver : imaging.convolution.Convolver
+            The convolver used to blur the mapping matrix with the PSF.
+        mapper : inversion.mappers.Mapper
+            The util between the image-pixels (via its / sub-grid) and pixelization pixels.
+        coefficients : [float]
+            The regularization coefficients of the `Constant` regularization scheme of every inversion.
+        """
+        (
+            blurred_mapping_matrix,
+            data_vector,
+            curvature_matrix,
+        ) = cls.blurred_mapping_matrix_data_vector_and_curvature_matrix_from(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            settings=settings,
+            preloads=preloads,
+        )
+
+        regularization_matrix_0 = reg.Constant(
+            coefficient=0.0
+        ).regularization_matrix_from_mapper(mapper=mapper)
+
+        regularization_matrix_unit = (
+            reg.Constant(coefficient=1.0).regularization_matrix_from_mapper(
+                mapper=mapper
+            )
+            - regularization_matrix_0
+        )
+
+        coefficients_non_zero = [
+            coefficient for coefficient in coefficients if coefficient != 0.0
+        ]
+        coefficient_reference = (
+            np.median(coefficients_non_zero) if coefficients_non_zero else 0.0
+        )
+
+        curvature_reg_matrix_reference = np.add(
+            curvature_matrix,
+            regularization_matrix_0
+            + coefficient_reference ** 2.0 * regularization_matrix_unit,
+        )
+
+        log_det_curvature_reg_matrix_reference = 2.0 * np.sum(
+            np.log(
+                np.diag(
+                    cholesky_factor_of_matrix(matrix=curvature_reg_matrix_reference)[0]
+                )
+            )
+        )
+
+        try:
+            curvature_eigenvalues, curvature_eigenvectors = eigh(
+                regularization_matrix_unit, curvature_reg_matrix_reference
+            )
+            regularization_eigenvalues = eigh(
+                regularization_matrix_unit, eigvals_only=True
+            )
+        except LinAlgError:
+            raise exc.InversionException()
+
+        # B is positive semi-definite, so negative eigenvalues are round-off of its null space (e.g. the constant
+        # vector), which H(c) regularizes with the diagonal term alone.
+        regularization_eigenvalues = np.clip(regularization_eigenvalues, 0.0, None)
+
+        regularization_diagonal = regularization_matrix_0[0, 0]
+
+        data_vector_eigen = np.dot(curvature_eigenvectors.T, data_vector)
+
+        inversion_list = []
+
+        for coefficient in coefficients:
+
+            regularization = reg.Constant(coefficient=coefficient)
+
+            regularization_matrix_sparse = regularization.regularization_matrix_sparse_from_mapper(
+                mapper=mapper
+            )
+            regularization_matrix = regularization_matrix_sparse.toarray()
+
+            curvature_scaling = (
+                1.0
+                + (coefficient ** 2.0 - coefficient_reference ** 2.0)
+                * curvature_eigenvalues
+            )
+
+            if np.any(curvature_scaling <= 0.0):
+                raise exc.InversionException()
+
+            values = np.dot(curvature_eigenvectors, data_vector_eigen / curvature_scaling)
+
+            if settings.check_solution:
+                if np.isclose(a=values[0], b=values[1], atol=1e-4).all():
+                    if np.isclose(a=values[0], b=values, atol=1e-4).all():
+                        raise exc.InversionException()
+
+            inversion_list.append(
+                InversionImagingMatrix(
+                    image=image,
+                    noise_map=noise_map,
+                    convolver=convolver,
+                    mapper=mapper,
+                    regularization=regularization,
+                    blurred_mapping_matrix=blurred_mapping_matrix,
+                    curvature_matrix=curvature_matrix,
+                    regularization_matrix=regularization_matrix,
+                    regularization_matrix_sparse=regularization_matrix_sparse,
+                    curvature_reg_matrix=np.add(curvature_matrix, regularization_matrix),
+                    reconstruction=values,
+                    settings=settings,
+                    log_det_curvature_reg_matrix_term=log_det_curvature_reg_matrix_reference
+                    + np.sum(np.log(curvature_scaling)),
+                    log_det_regularization_matrix_term=np.sum(
+                        np.log(
+                            regularization_diagonal
+                            + coefficient ** 2.0 * regularization_eigenvalues
+                        )
+                    ),
+                )
+            )
+
+        return inversion_list
+
     @property
     def mapped_reconstructed_image(self):
-        reconstructed_image = inversion_util.mapped_reconstructed_data_from(
-            mapping_matrix=self.blurred_mapping_matrix,
-            reconstruction=self.reconstruction,
-        )
+
+        if sparse.issparse(self.blurred_mapping_matrix):
+
+            reconstructed_image = inversion_util.mapped_reconstructed_data_via_mapping_matrix_sparse_from(
+                mapping_matrix_sparse=self.blurred_mapping_matrix,
+                reconstruction=self.reconstruction,
+            )
+
+        else:
+
+            reconstructed_image = inversion_util.mapped_reconstructed_data_from(
+                mapping_matrix=self.blurred_mapping_matrix,
+                reconstruction=self.reconstruction,
+            )
 
         return array_2d.Array2D(
             array=reconstructed_image, mask=self.mapper.source_grid_slim.mask.mask_sub_1
@@ -407,51 +858,90 @@ class InversionImagingMatrix(AbstractInversion, AbstractInversionMatrix):
 
     @property
     def residual_map(self):
-        return inversion_util.inversion_residual_map_from(
+        return inversion_util.inversion_residual_map_via_csr_from(
             pixelization_values=self.reconstruction,
             data=self.image,
             slim_index_for_sub_slim_index=self.mapper.source_grid_slim.mask._slim_index_for_sub_slim_index,
-            all_sub_slim_indexes_for_pixelization_index=self.mapper.all_sub_slim_indexes_for_pixelization_index,
+            sub_slim_indexes_for_pixelization_index=self.mapper.sub_slim_indexes_for_pixelization_index,
+            sub_slim_offsets_for_pixelization_index=self.mapper.sub_slim_offsets_for_pixelization_index,
         )
 
     @property
     def normalized_residual_map(self):
-        return inversion_util.inversion_normalized_residual_map_from(
+        return inversion_util.inversion_normalized_residual_map_via_csr_from(
             pixelization_values=self.reconstruction,
             data=self.image,
             noise_map_1d=self.noise_map,
             slim_index_for_sub_slim_index=self.mapper.source_grid_slim.mask._slim_index_for_sub_slim_index,
-            all_sub_slim_indexes_for_pixelization_index=self.mapper.all_sub_slim_indexes_for_pixelization_index,
+            sub_slim_indexes_for_pixelization_index=self.mapper.sub_slim_indexes_for_pixelization_index,
+            sub_slim_offsets_for_pixelization_index=self.mapper.sub_slim_offsets_for_pixelization_index,
         )
 
     @property
     def chi_squared_map(self):
-        return inversion_util.inversion_chi_squared_map_from(
+        return inversion_util.inversion_chi_squared_map_via_csr_from(
             pixelization_values=self.reconstruction,
             data=self.image,
             noise_map_1d=self.noise_map,
             slim_index_for_sub_slim_index=self.mapper.source_grid_slim.mask._slim_index_for_sub_slim_index,
-            all_sub_slim_indexes_for_pixelization_index=self.mapper.all_sub_slim_indexes_for_pixelization_index,
+            sub_slim_indexes_for_pixelization_index=self.mapper.sub_slim_indexes_for_pixelization_index,
+            sub_slim_offsets_for_pixelization_index=self.mapper.sub_slim_offsets_for_pixelization_index,
         )
 
     @property
     def curvature_matrix_sparse_preload(self):
 
-        curvature_matrix_sparse_preload, curvature_matrix_preload_counts = inversion_util.curvature_matrix_sparse_preload_via_mapping_matrix_from(
-            mapping_matrix=self.blurred_mapping_matrix
-        )
+        if sparse.issparse(self.blurred_mapping_matrix):
+
+            curvature_matrix_sparse_preload, curvature_matrix_preload_counts = inversion_util.curvature_matrix_sparse_preload_via_mapping_matrix_sparse_from(
+                mapping_matrix_sparse=self.blurred_mapping_matrix
+            )
+
+        else:
+
+            curvature_matrix_sparse_preload, curvature_matrix_preload_counts = inversion_util.curvature_matrix_sparse_preload_via_mapping_matrix_from(
+                mapping_matrix=self.blurred_mapping_matrix
+            )
 
         return curvature_matrix_sparse_preload
 
     @property
     def curvature_matrix_preload_counts(self):
 
-        curvature_matrix_sparse_preload, curvature_matrix_preload_counts = inversion_util.curvature_matrix_sparse_preload_via_mapping_matrix_from(
-            mapping_matrix=self.blurred_mapping_matrix
-        )
+        if sparse.issparse(self.blurred_mapping_matrix):
+
+            curvature_matrix_sparse_preload, curvature_matrix_preload_counts = inversion_util.curvature_matrix_sparse_preload_via_mapping_matrix_sparse_from(
+                mapping_matrix_sparse=self.blurred_mapping_matrix
+            )
+
+        else:
+
+            curvature_matrix_sparse_preload, curvature_matrix_preload_counts = inversion_util.curvature_matrix_sparse_preload_via_mapping_matrix_from(
+                mapping_matrix=self.blurred_mapping_matrix
+            )
 
         return curvature_matrix_preload_counts
 
+    @property
+    def curvature_matrix_outer_products(self):
+        """
+        The outer products of every row of the blurred mapping matrix, which can be passed to the `Preloads` of
+        subsequent inversions using the same blurred mapping matrix, such that their curvature matrix is computed for
+        a new noise-map via a single sparse matrix-vector product. They are computed the first time they are
+        accessed and stored thereafter.
+
+        A row of the blurred mapping matrix with nnz non-zero entries contributes nnz * (nnz + 1) / 2 entries, each
+        stored as a float64 value and an int32 index (12 bytes). The memory therefore grows with the square of the
+        PSF size, for example about 3 million entries (36 MB) for a 1600 pixel source with an 11 x 11 PSF and
+        roughly 16 times that for a 21 x 21 PSF.
+        """
+        if self._curvature_matrix_outer_products is None:
+            self._curvature_matrix_outer_products = inversion_util.curvature_matrix_outer_products_preload_from(
+                mapping_matrix=self.blurred_mapping_matrix
+            )
+
+        return self._curvature_matrix_outer_products
+
 
 class AbstractInversionInterferometer(AbstractInversion):
     def __init__(
@@ -464,6 +954,7 @@ class AbstractInversionInterferometer(AbstractInversion):
         regularization_matrix: np.ndarray,
         reconstruction: np.ndarray,
         settings: SettingsInversion,
+        regularization_matrix_sparse: typing.Optional[sparse.csr_matrix] = None,
     ):
 
         super(AbstractInversionInterferometer, self).__init__(
@@ -473,6 +964,7 @@ class AbstractInversionInterferometer(AbstractInversion):
             regularization_matrix=regularization_matrix,
             reconstruction=reconstruction,
             settings=settings,
+            regularization_matrix_sparse=regularization_matrix_sparse,
         )
 
         self.visibilities = visibilities
@@ -487,6 +979,8 @@ class AbstractInversionInterferometer(AbstractInversion):
         mapper: typing.Union[mappers.MapperRectangular, mappers.MapperVoronoi],
         regularization: reg.Regularization,
         settings=SettingsInversion(use_linear_operators=True),
+        w_tilde=None,
+        initial_reconstruction=None,
     ):
 
         if not settings.use_linear_operators:
@@ -497,6 +991,7 @@ class AbstractInversionInterferometer(AbstractInversion):
                 mapper=mapper,
                 regularization=regularization,
                 settings=settings,
+                w_tilde=w_tilde,
             )
         else:
             return InversionInterferometerLinearOperator.from_data_mapper_and_regularization(
@@ -506,6 +1001,7 @@ class AbstractInversionInterferometer(AbstractInversion):
                 mapper=mapper,
                 regularization=regularization,
                 settings=settings,
+                initial_reconstruction=initial_reconstruction,
             )
 
     @property
@@ -550,6 +1046,8 @@ class InversionInterferometerMatrix(
         curvature_matrix: np.ndarray,
         curvature_reg_matrix: np.ndarray,
         settings: SettingsInversion,
+        curvature_reg_matrix_cholesky: typing.Optional[tuple] = None,
+        regularization_matrix_sparse: typing.Optional[sparse.csr_matrix] = None,
     ):
         """ An inversion, which given an input image and noise-map reconstructs the image using a linear inversion, \
         including a convolution that accounts for blurring.
@@ -583,6 +1081,9 @@ class InversionInterferometerMatrix(
             The curvature_matrix between each pixelization pixel and all other pixelization pixels (F).
         curvature_reg_matrix : np.ndarray
             The curvature_matrix + regularization matrix.
+        curvature_reg_matrix_cholesky : (np.ndarray, bool)
+            The Cholesky factorization of the curvature_reg_matrix, used to solve for the reconstruction and reused \
+            to compute its log determinant and the errors.
         solution_vector : np.ndarray
             The vector containing the reconstructed fit to the hyper_galaxies.
         """
@@ -596,16 +1097,16 @@ class InversionInterferometerMatrix(
             regularization_matrix=regularization_matrix,
             reconstruction=reconstruction,
             settings=settings,
+            regularization_matrix_sparse=regularization_matrix_sparse,
         )
 
         AbstractInversionMatrix.__init__(
             self=self,
             curvature_matrix=curvature_matrix,
             curvature_reg_matrix=curvature_reg_matrix,
-            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix_cholesky=curvature_reg_matrix_cholesky,
         )
 
-        self.curvature_reg_matrix = curvature_reg_matrix
         self.transformed_mapping_matrix = transformed_mapping_matrix
 
     @classmethod
@@ -617,37 +1118,65 @@ class InversionInterferometerMatrix(
         mapper: typing.Union[mappers.MapperRectangular, mappers.MapperVoronoi],
         regularization: reg.Regularization,
         settings=SettingsInversion(),
+        w_tilde=None,
     ):
+        """
+        Perform an interferometer inversion using matrices.
 
-        transformed_mapping_matrix = transformer.transformed_mapping_matrix_from_mapping_matrix(
-            mapping_matrix=mapper.mapping_matrix
-        )
+        If a `w_tilde` preload is input (see `Interferometer.w_tilde`), the curvature matrix and data vector are
+        computed from it and the mapping matrix, without Fourier transforming the mapping matrix. The transformed
+        mapping matrix is then not stored and the mapped reconstructed visibilities are computed by Fourier
+        transforming the mapped reconstructed image.
+        """
 
-        data_vector = inversion_util.data_vector_via_transformed_mapping_matrix_from(
-            transformed_mapping_matrix=transformed_mapping_matrix,
-            visibilities=visibilities,
-            noise_map=noise_map,
-        )
+        if w_tilde is None:
 
-        real_curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
-            mapping_matrix=transformed_mapping_matrix.real, noise_map=noise_map.real
-        )
+            transformed_mapping_matrix = transformer.transformed_mapping_matrix_from_mapping_matrix(
+                mapping_matrix=mapper.mapping_matrix
+            )
 
-        imag_curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
-            mapping_matrix=transformed_mapping_matrix.imag, noise_map=noise_map.imag
-        )
+            data_vector = inversion_util.data_vector_via_transformed_mapping_matrix_from(
+                transformed_mapping_matrix=transformed_mapping_matrix,
+                visibilities=visibilities,
+                noise_map=noise_map,
+            )
+
+            real_curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=transformed_mapping_matrix.real,
+                noise_map=noise_map.real,
+            )
 
-        regularization_matrix = regularization.regularization_matrix_from_mapper(
+            imag_curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=transformed_mapping_matrix.imag,
+                noise_map=noise_map.imag,
+            )
+
+            curvature_matrix = np.add(real_curvature_matrix, imag_curvature_matrix)
+
+        else:
+
+            transformed_mapping_matrix = None
+
+            data_vector = inversion_util.data_vector_via_w_tilde_data_from(
+                w_tilde_data=w_tilde.dirty_image, mapping_matrix=mapper.mapping_matrix
+            )
+
+            curvature_matrix = inversion_util.curvature_matrix_via_w_tilde_from(
+                w_tilde=w_tilde.curvature_preload, mapping_matrix=mapper.mapping_matrix
+            )
+
+        regularization_matrix_sparse = regularization.regularization_matrix_sparse_from_mapper(
             mapper=mapper
         )
+        regularization_matrix = regularization_matrix_sparse.toarray()
 
-        curvature_matrix = np.add(real_curvature_matrix, imag_curvature_matrix)
         curvature_reg_matrix = np.add(curvature_matrix, regularization_matrix)
 
-        try:
-            values = np.linalg.solve(curvature_reg_matrix, data_vector)
-        except np.linalg.LinAlgError:
-            raise exc.InversionException()
+        curvature_reg_matrix_cholesky = cholesky_factor_of_matrix(
+            matrix=curvature_reg_matrix
+        )
+
+        values = cho_solve(curvature_reg_matrix_cholesky, data_vector)
 
         if settings.check_solution:
             if np.isclose(a=values[0], b=values[1], atol=1e-4).all():
@@ -663,7 +1192,9 @@ class InversionInterferometerMatrix(
             regularization=regularization,
             transformed_mapping_matrix=transformed_mapping_matrix,
             regularization_matrix=regularization_matrix,
+            regularization_matrix_sparse=regularization_matrix_sparse,
             curvature_reg_matrix=curvature_reg_matrix,
+            curvature_reg_matrix_cholesky=curvature_reg_matrix_cholesky,
             reconstruction=values,
             settings=settings,
         )
@@ -671,6 +1202,11 @@ class InversionInterferometerMatrix(
     @property
     def mapped_reconstructed_visibilities(self):
 
+        if self.transformed_mapping_matrix is None:
+            return self.transformer.visibilities_from_image(
+                image=self.mapped_reconstructed_image
+            )
+
         visibilities = inversion_util.mapped_reconstructed_visibilities_from(
             transformed_mapping_matrix=self.transformed_mapping_matrix,
             reconstruction=self.reconstruction,
@@ -691,6 +1227,9 @@ class InversionInterferometerLinearOperator(AbstractInversionInterferometer):
         reconstruction: np.ndarray,
         log_det_curvature_reg_matrix_term: float,
         settings: SettingsInversion,
+        regularization_matrix_sparse: typing.Optional[sparse.csr_matrix] = None,
+        iterations: typing.Optional[int] = None,
+        residual_norms: typing.Optional[np.ndarray] = None,
     ):
         """ An inversion, which given an input image and noise-map reconstructs the image using a linear inversion, \
         including a convolution that accounts for blurring.
@@ -726,9 +1265,15 @@ class InversionInterferometerLinearOperator(AbstractInversionInterferometer):
             The curvature_matrix + regularization matrix.
         solution_vector : np.ndarray
             The vector containing the reconstructed fit to the hyper_galaxies.
+        iterations : int
+            The number of iterations of the preconditioned conjugate gradient solver.
+        residual_norms : np.ndarray
+            The norm of the solver's residual at the start and after every iteration, for monitoring its convergence.
         """
 
         self._log_det_curvature_reg_matrix_term = log_det_curvature_reg_matrix_term
+        self.iterations = iterations
+        self.residual_norms = residual_norms
 
         super(InversionInterferometerLinearOperator, self).__init__(
             visibilities=visibilities,
@@ -739,6 +1284,7 @@ class InversionInterferometerLinearOperator(AbstractInversionInterferometer):
             regularization_matrix=regularization_matrix,
             reconstruction=reconstruction,
             settings=settings,
+            regularization_matrix_sparse=regularization_matrix_sparse,
         )
 
     @classmethod
@@ -750,11 +1296,27 @@ class InversionInterferometerLinearOperator(AbstractInversionInterferometer):
         mapper: typing.Union[mappers.MapperRectangular, mappers.MapperVoronoi],
         regularization: reg.Regularization,
         settings=SettingsInversion(),
+        initial_reconstruction=None,
     ):
+        """
+        Perform an interferometer inversion using linear operators, where the reconstruction is solved for using the
+        preconditioned conjugate gradient method (see
+        `inversion_util.reconstruction_via_preconditioned_conjugate_gradient_from`).
+
+        The preconditioner is the sparse matrix of the mapping matrix and regularization matrix (see
+        `inversion_util.preconditioner_matrix_sparse_via_mapping_matrix_from`), which is factorized once using a
+        sparse LU decomposition that is used to apply its inverse and compute the approximate log determinant term.
+        If `settings.stochastic_log_det_probes` is input, the log determinant term is instead estimated from the
+        curvature reg matrix itself via stochastic Lanczos quadrature.
+
+        The solver starts from the `initial_reconstruction` if it is input and has the same number of pixels as the
+        mapper, for example the reconstruction of the previous model of a non-linear search.
+        """
 
-        regularization_matrix = regularization.regularization_matrix_from_mapper(
+        regularization_matrix_sparse = regularization.regularization_matrix_sparse_from_mapper(
             mapper=mapper
         )
+        regularization_matrix = regularization_matrix_sparse.toarray()
 
         Aop = pylops.MatrixMult(sparse.bsr_matrix(mapper.mapping_matrix))
 
@@ -762,32 +1324,50 @@ class InversionInterferometerLinearOperator(AbstractInversionInterferometer):
 
         Op = Fop * Aop
 
-        curvature_matrix_approx = np.multiply(
-            np.sum(noise_map.weight_list_ordered_1d),
-            mapper.mapping_matrix.T @ mapper.mapping_matrix,
+        weights = noise_map.weight_list_ordered_1d
+
+        preconditioner_matrix = inversion_util.preconditioner_matrix_sparse_via_mapping_matrix_from(
+            mapping_matrix=mapper.mapping_matrix,
+            regularization_matrix_sparse=regularization_matrix_sparse,
+            preconditioner_noise_normalization=np.sum(weights),
         )
 
-        preconditioner_matrix = np.add(curvature_matrix_approx, regularization_matrix)
+        preconditioner_lu = sparse_lu_of_matrix(matrix=preconditioner_matrix)
 
-        preconditioner_inverse_matrix = np.linalg.inv(preconditioner_matrix)
+        def curvature_reg_matvec(vector):
+            return np.real(
+                Op.rmatvec(weights * Op.matvec(vector))
+            ) + regularization_matrix_sparse.dot(vector)
 
-        MOp = pylops.MatrixMult(sparse.bsr_matrix(preconditioner_inverse_matrix))
+        if settings.stochastic_log_det_probes is None:
 
-        log_det_curvature_reg_matrix_term = 2.0 * np.sum(
-            np.log(np.diag(np.linalg.cholesky(preconditioner_matrix)))
-        )
+            log_det_curvature_reg_matrix_term = np.sum(
+                np.log(preconditioner_lu.U.diagonal())
+            )
+
+        else:
+
+            log_det_curvature_reg_matrix_term = inversion_util.log_determinant_via_stochastic_lanczos_quadrature_from(
+                matvec=curvature_reg_matvec,
+                pixels=mapper.pixels,
+                total_probes=settings.stochastic_log_det_probes,
+                lanczos_steps=settings.stochastic_log_det_lanczos_steps,
+                seed=settings.stochastic_log_det_seed,
+            )
+
+        data_vector = np.real(Op.rmatvec(weights * visibilities.ordered_1d))
 
-        reconstruction = pylops.NormalEquationsInversion(
-            Op=Op,
-            Regs=None,
-            epsNRs=[1.0],
-            data=visibilities.ordered_1d,
-            Weight=pylops.Diagonal(diag=noise_map.weight_list_ordered_1d),
-            NRegs=[pylops.MatrixMult(sparse.bsr_matrix(regularization_matrix))],
-            M=MOp,
-            tol=settings.tolerance,
-            atol=settings.tolerance,
-            **dict(maxiter=settings.maxiter),
+        if initial_reconstruction is not None:
+            if initial_reconstruction.shape != data_vector.shape:
+                initial_reconstruction = None
+
+        reconstruction, iterations, residual_norms = inversion_util.reconstruction_via_preconditioned_conjugate_gradient_from(
+            curvature_reg_matvec=curvature_reg_matvec,
+            data_vector=data_vector,
+            preconditioner_solve=preconditioner_lu.solve,
+            initial_reconstruction=initial_reconstruction,
+            tolerance=settings.tolerance,
+            maxiter=settings.maxiter,
         )
 
         return InversionInterferometerLinearOperator(
@@ -797,9 +1377,12 @@ class InversionInterferometerLinearOperator(AbstractInversionInterferometer):
             mapper=mapper,
             regularization=regularization,
             regularization_matrix=regularization_matrix,
-            reconstruction=np.real(reconstruction),
+            regularization_matrix_sparse=regularization_matrix_sparse,
+            reconstruction=reconstruction,
             settings=settings,
             log_det_curvature_reg_matrix_term=log_det_curvature_reg_matrix_term,
+            iterations=iterations,
+            residual_norms=residual_norms,
         )
 
     @property
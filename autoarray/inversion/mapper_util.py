@@ -1,4 +1,6 @@
 import numpy as np
+from scipy import sparse
+from scipy import spatial
 from autoarray import decorator_util
 
 from autoarray import exc
@@ -40,6 +42,110 @@ def mapping_matrix_from(
     return mapping_matrix
 
 
+def mapping_matrix_sparse_from(
+    pixelization_index_for_sub_slim_index: np.ndarray,
+    pixels: int,
+    total_mask_pixels: int,
+    slim_index_for_sub_slim_index: np.ndarray,
+    sub_fraction: float,
+) -> sparse.csr_matrix:
+    """
+    Returns the mapping matrix as a compressed sparse row (CSR) matrix, which stores only its non-zero entries.
+
+    Every sub-pixel maps to a single pixelization pixel, therefore each row of the mapping matrix has at most
+    sub_size**2 non-zero entries. For pixelizations with many pixels the dense mapping matrix (see
+    `mapping_matrix_from`) is therefore almost entirely zeros, and the sparse representation uses significantly less
+    memory and is faster to blur and multiply.
+
+    Sub-pixels in the same data pixel which map to the same pixelization pixel are summed, giving entries identical
+    to the dense mapping matrix.
+
+    Parameters
+    -----------
+    pixelization_index_for_sub_slim_index : np.ndarray
+        The mappings between the pixelization grid's pixels and the data's slimmed pixels.
+    pixels : int
+        The number of pixels in the pixelization.
+    total_mask_pixels : int
+        The number of datas pixels in the observed datas and thus on the grid.
+    slim_index_for_sub_slim_index : np.ndarray
+        The mappings between the data's sub slimmed indexes and the slimmed indexes on the non sub-sized indexes.
+    sub_fraction : float
+        The fractional area each sub-pixel takes up in an pixel.
+    """
+    return sparse.csr_matrix(
+        (
+            np.full(slim_index_for_sub_slim_index.shape[0], sub_fraction),
+            (slim_index_for_sub_slim_index, pixelization_index_for_sub_slim_index),
+        ),
+        shape=(total_mask_pixels, pixels),
+    )
+
+
+@decorator_util.jit()
+def sub_slim_indexes_for_pixelization_index_from(
+    pixelization_index_for_sub_slim_index: np.ndarray, pixels: int
+) -> (np.ndarray, np.ndarray):
+    """
+    Returns the mappings between every pixelization pixel and the sub-pixels that map to it, in compressed sparse
+    row (CSR) format.
+
+    The sub-slimmed indexes of all sub-pixels are sorted by the pixelization pixel they map to and stored in one flat
+    array, `sub_slim_indexes_for_pixelization_index`. The sub-pixels mapping to pixelization pixel `pix_index` are
+    therefore:
+
+    sub_slim_indexes_for_pixelization_index[
+        sub_slim_offsets_for_pixelization_index[pix_index] : sub_slim_offsets_for_pixelization_index[pix_index + 1]
+    ]
+
+    Within each pixelization pixel the sub-slimmed indexes are in ascending order.
+
+    Parameters
+    -----------
+    pixelization_index_for_sub_slim_index : np.ndarray
+        The mappings between the pixelization grid's pixels and the data's sub slimmed pixels.
+    pixels : int
+        The number of pixels in the pixelization.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        The sub-slimmed indexes sorted by pixelization pixel and the offsets of every pixelization pixel's entries,
+        of length `pixels + 1`.
+    """
+
+    sub_slim_offsets_for_pixelization_index = np.zeros(pixels + 1, dtype=np.int64)
+
+    for sub_slim_index in range(pixelization_index_for_sub_slim_index.shape[0]):
+        sub_slim_offsets_for_pixelization_index[
+            pixelization_index_for_sub_slim_index[sub_slim_index] + 1
+        ] += 1
+
+    for pix_index in range(pixels):
+        sub_slim_offsets_for_pixelization_index[
+            pix_index + 1
+        ] += sub_slim_offsets_for_pixelization_index[pix_index]
+
+    sub_slim_indexes_for_pixelization_index = np.zeros(
+        pixelization_index_for_sub_slim_index.shape[0], dtype=np.int64
+    )
+    fill_index_for_pixelization_index = sub_slim_offsets_for_pixelization_index[
+        :-1
+    ].copy()
+
+    for sub_slim_index in range(pixelization_index_for_sub_slim_index.shape[0]):
+        pix_index = pixelization_index_for_sub_slim_index[sub_slim_index]
+        sub_slim_indexes_for_pixelization_index[
+            fill_index_for_pixelization_index[pix_index]
+        ] = sub_slim_index
+        fill_index_for_pixelization_index[pix_index] += 1
+
+    return (
+        sub_slim_indexes_for_pixelization_index,
+        sub_slim_offsets_for_pixelization_index,
+    )
+
+
 @decorator_util.jit()
 def pixelization_index_for_voronoi_sub_slim_index_from(
     grid: np.ndarray,
@@ -147,6 +253,42 @@ def pixelization_index_for_voronoi_sub_slim_index_from(
     return pixelization_index_for_voronoi_sub_slim_index
 
 
+def pixelization_index_for_voronoi_sub_slim_index_via_kd_tree_from(
+    grid: np.ndarray, pixelization_grid: np.ndarray, workers: int = -1
+) -> np.ndarray:
+    """
+    Returns the mappings between a set of slimmed sub-grid pixels and pixelization pixels, by pairing every sub-pixel
+    to its nearest Voronoi pixel centre via a k-d tree of the pixelization's pixel centres.
+
+    This gives the same pairings as `pixelization_index_for_voronoi_sub_slim_index_from` (a Voronoi cell is the
+    region nearest its centre), except for sub-pixels exactly equidistant from two centres. All sub-pixels are queried
+    in one batch which is distributed over `workers` CPUs, and the run time does not depend on the pixel neighbors,
+    such that it cannot be slowed down by a pathological graph walk.
+
+    Parameters
+    ----------
+    grid : Grid2D
+        The grid of (y,x) scaled coordinates at the centre of every unmasked pixel, which has been traced to
+        to an irgrid via lens.
+    pixelization_grid : np.ndarray
+        The (y,x) centre of every Voronoi pixel in arc-seconds.
+    workers : int
+        The number of CPUs the k-d tree query is distributed over, where -1 uses every available CPU.
+    """
+    kd_tree = spatial.cKDTree(np.asarray(pixelization_grid))
+
+    try:
+        _, pixelization_index_for_voronoi_sub_slim_index = kd_tree.query(
+            np.asarray(grid), k=1, workers=workers
+        )
+    except TypeError:
+        _, pixelization_index_for_voronoi_sub_slim_index = kd_tree.query(
+            np.asarray(grid), k=1, n_jobs=workers
+        )
+
+    return pixelization_index_for_voronoi_sub_slim_index
+
+
 @decorator_util.jit()
 def adaptive_pixel_signals_from(
     pixels: int,
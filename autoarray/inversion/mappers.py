@@ -1,3 +1,4 @@
+from autoarray import exc
 from autoarray.structures.arrays.two_d import array_2d
 from autoarray.structures.grids.two_d import grid_2d_pixelization
 from autoarray.inversion import mapper_util
@@ -13,6 +14,7 @@ def mapper(
     source_pixelization_grid,
     data_pixelization_grid=None,
     hyper_data=None,
+    nearest_pixel_engine="graph",
 ):
 
     if isinstance(source_pixelization_grid, grid_2d_pixelization.Grid2DRectangular):
@@ -28,6 +30,7 @@ def mapper(
             source_pixelization_grid=source_pixelization_grid,
             data_pixelization_grid=data_pixelization_grid,
             hyper_image=hyper_data,
+            nearest_pixel_engine=nearest_pixel_engine,
         )
 
 
@@ -112,13 +115,11 @@ class Mapper:
         self.source_pixelization_grid = source_pixelization_grid
         self.data_pixelization_grid = data_pixelization_grid
 
-        self.mapping_matrix = mapper_util.mapping_matrix_from(
-            pixelization_index_for_sub_slim_index=self.pixelization_index_for_sub_slim_index,
-            pixels=self.pixels,
-            total_mask_pixels=self.source_grid_slim.mask.pixels_in_mask,
-            slim_index_for_sub_slim_index=self._slim_index_for_sub_slim_index,
-            sub_fraction=self.source_grid_slim.mask.sub_fraction,
-        )
+        self._pixelization_index_for_sub_slim_index = None
+        self._sub_slim_indexes_for_pixelization_index_csr = None
+
+        self._mapping_matrix = None
+        self._mapping_matrix_sparse = None
 
         self.hyper_image = hyper_image
 
@@ -126,16 +127,105 @@ class Mapper:
     def pixels(self):
         return self.source_pixelization_grid.pixels
 
+    @property
+    def mapping_matrix(self):
+        """
+        The dense mapping matrix of dimensions (total_mask_pixels, pixels), which is computed the first time it is
+        accessed and stored thereafter.
+        """
+        if self._mapping_matrix is None:
+
+            if self._mapping_matrix_sparse is not None:
+                self._mapping_matrix = self._mapping_matrix_sparse.toarray()
+            else:
+                self._mapping_matrix = mapper_util.mapping_matrix_from(
+                    pixelization_index_for_sub_slim_index=self.pixelization_index_for_sub_slim_index,
+                    pixels=self.pixels,
+                    total_mask_pixels=self.source_grid_slim.mask.pixels_in_mask,
+                    slim_index_for_sub_slim_index=self._slim_index_for_sub_slim_index,
+                    sub_fraction=self.source_grid_slim.mask.sub_fraction,
+                )
+
+        return self._mapping_matrix
+
+    @property
+    def mapping_matrix_sparse(self):
+        """
+        The mapping matrix in compressed sparse row (CSR) format, which stores only the non-zero entries of the
+        dense `mapping_matrix`. It is computed the first time it is accessed and stored thereafter.
+        """
+        if self._mapping_matrix_sparse is None:
+
+            self._mapping_matrix_sparse = mapper_util.mapping_matrix_sparse_from(
+                pixelization_index_for_sub_slim_index=self.pixelization_index_for_sub_slim_index,
+                pixels=self.pixels,
+                total_mask_pixels=self.source_grid_slim.mask.pixels_in_mask,
+                slim_index_for_sub_slim_index=self._slim_index_for_sub_slim_index,
+                sub_fraction=self.source_grid_slim.mask.sub_fraction,
+            )
+
+        return self._mapping_matrix_sparse
+
+    @property
+    def mapping_matrix_fill_fraction(self):
+        """
+        An upper limit on the fraction of entries in the mapping matrix which are non-zero.
+
+        Every data pixel is divided into sub_size**2 sub-pixels which each map to one pixelization pixel, thus each
+        row of the mapping matrix has at most sub_size**2 non-zero entries. This limit is computed without
+        pairing any sub-pixels to the pixelization, so it can be used to decide whether an inversion should use
+        the sparse or dense mapping matrix before either is computed.
+        """
+        sub_length = self.source_grid_slim.mask.sub_length
+        return min(sub_length, self.pixels) / self.pixels
+
     @property
     def _slim_index_for_sub_slim_index(self):
         return self.source_grid_slim.mask._slim_index_for_sub_slim_index
 
     @property
     def pixelization_index_for_sub_slim_index(self):
+        """
+        The 1D index mappings between the sub pixels and pixelization pixels, which are computed the first time they
+        are accessed and stored thereafter.
+        """
+        if self._pixelization_index_for_sub_slim_index is None:
+            self._pixelization_index_for_sub_slim_index = (
+                self.pixelization_index_for_sub_slim_index_from_grid()
+            )
+
+        return self._pixelization_index_for_sub_slim_index
+
+    def pixelization_index_for_sub_slim_index_from_grid(self):
         raise NotImplementedError(
-            "pixelization_index_for_sub_slim_index should be overridden"
+            "pixelization_index_for_sub_slim_index_from_grid should be overridden"
         )
 
+    @property
+    def sub_slim_indexes_for_pixelization_index_csr(self):
+        """
+        The mappings between a pixelization's pixels and the unmasked sub-grid pixels in compressed sparse row (CSR)
+        format, which are computed the first time they are accessed and stored thereafter.
+
+        This is a tuple of the sub-slimmed indexes sorted by pixelization pixel and the offsets of every pixelization
+        pixel's entries (see `mapper_util.sub_slim_indexes_for_pixelization_index_from`).
+        """
+        if self._sub_slim_indexes_for_pixelization_index_csr is None:
+            self._sub_slim_indexes_for_pixelization_index_csr = mapper_util.sub_slim_indexes_for_pixelization_index_from(
+                pixelization_index_for_sub_slim_index=self.pixelization_index_for_sub_slim_index,
+                pixels=self.pixels,
+            )
+
+        return self._sub_slim_indexes_for_pixelization_index_csr
+
+    @property
+    def sub_slim_indexes_for_pixelization_index(self):
+        return self.sub_slim_indexes_for_pixelization_index_csr[0]
+
+    @property
+    def sub_slim_offsets_for_pixelization_index(self):
+        return self.sub_slim_indexes_for_pixelization_index_csr[1]
+
     @property
     def all_sub_slim_indexes_for_pixelization_index(self):
         """
@@ -144,14 +234,13 @@ class Mapper:
 
         The pixelization's pixels map to different number of sub-grid pixels, thus a list of lists is used to \
         represent these mappings"""
-        all_sub_slim_indexes_for_pixelization_index = [[] for _ in range(self.pixels)]
-
-        for slim_index, pix_index in enumerate(
-            self.pixelization_index_for_sub_slim_index
-        ):
-            all_sub_slim_indexes_for_pixelization_index[pix_index].append(slim_index)
-
-        return all_sub_slim_indexes_for_pixelization_index
+        return [
+            sub_slim_indexes.tolist()
+            for sub_slim_indexes in np.split(
+                self.sub_slim_indexes_for_pixelization_index,
+                self.sub_slim_offsets_for_pixelization_index[1:-1],
+            )
+        ]
 
     def pixel_signals_from_signal_scale(self, signal_scale):
 
@@ -229,8 +318,7 @@ class MapperRectangular(Mapper):
     def shape_native(self):
         return self.source_pixelization_grid.shape_native
 
-    @property
-    def pixelization_index_for_sub_slim_index(self):
+    def pixelization_index_for_sub_slim_index_from_grid(self):
         """The 1D index mappings between the sub grid's pixels and rectangular pixelization's pixels"""
         return grid_2d_util.grid_pixel_indexes_2d_slim_from(
             grid_scaled_2d_slim=self.source_grid_slim,
@@ -264,6 +352,7 @@ class MapperVoronoi(Mapper):
         source_pixelization_grid,
         data_pixelization_grid=None,
         hyper_image=None,
+        nearest_pixel_engine="graph",
     ):
         """Class representing a Voronoi mapper, which maps unmasked pixels on a masked 2D array (in the form of \
         a grid, see the *hyper_galaxies.array.grid* module) to pixels discretized on a Voronoi grid.
@@ -283,6 +372,9 @@ class MapperVoronoi(Mapper):
             The geometry (e.g. y / x edge locations, pixel-scales) of the Vornoi pixelization.
         hyper_image : np.ndarray
             A pre-computed hyper-image of the image the mapper is expected to reconstruct, used for adaptive analysis.
+        nearest_pixel_engine : str
+            How every sub-pixel is paired with its nearest Voronoi pixel, either `graph` (a graph walk over the
+            Voronoi pixel neighbors) or `kd_tree` (a batch query of a k-d tree of the Voronoi pixel centres).
         """
         super().__init__(
             source_grid_slim=source_grid_slim,
@@ -291,11 +383,24 @@ class MapperVoronoi(Mapper):
             hyper_image=hyper_image,
         )
 
-    @property
-    def pixelization_index_for_sub_slim_index(self):
+        if nearest_pixel_engine not in ("graph", "kd_tree"):
+            raise exc.PixelizationException(
+                "The nearest_pixel_engine of a Voronoi mapper must be graph or kd_tree, not {}".format(
+                    nearest_pixel_engine
+                )
+            )
+
+        self.nearest_pixel_engine = nearest_pixel_engine
+
+    def pixelization_index_for_sub_slim_index_from_grid(self):
         """
         The 1D index mappings between the sub pixels and Voronoi pixelization pixels.
         """
+        if self.nearest_pixel_engine == "kd_tree":
+            return mapper_util.pixelization_index_for_voronoi_sub_slim_index_via_kd_tree_from(
+                grid=self.source_grid_slim, pixelization_grid=self.source_pixelization_grid
+            ).astype("int")
+
         return mapper_util.pixelization_index_for_voronoi_sub_slim_index_from(
             grid=self.source_grid_slim,
             nearest_pixelization_index_for_slim_index=self.source_pixelization_grid.nearest_pixelization_index_for_slim_index,
@@ -15,12 +15,31 @@ class SettingsPixelization:
         pixel_limit: int = None,
         is_stochastic: bool = False,
         kmeans_seed: int = 0,
+        voronoi_nearest_pixel_engine: str = "graph",
     ):
+        """
+        The settings of a pixelization, which customize how its mapper is created.
 
+        Parameters
+        ----------
+        use_border : bool
+            If `True`, the grid and pixelization grid are relocated to the border of the grid's mask.
+        pixel_limit : int
+            The maximum number of pixels a pixelization may have.
+        is_stochastic : bool
+            If `True`, the KMeans pixelization grid of a `VoronoiBrightness` pixelization uses a random seed.
+        kmeans_seed : int
+            The seed of the KMeans pixelization grid of a `VoronoiBrightness` pixelization if it is not stochastic.
+        voronoi_nearest_pixel_engine : str
+            How a Voronoi mapper pairs every sub-pixel with its nearest Voronoi pixel, either `graph` (a graph walk
+            over the Voronoi pixel neighbors) or `kd_tree` (a batch query of a k-d tree of the Voronoi pixel centres
+            parallelized over every CPU).
+        """
         self.use_border = use_border
         self.pixel_limit = pixel_limit
         self.is_stochastic = is_stochastic
         self.kmeans_seed = kmeans_seed
+        self.voronoi_nearest_pixel_engine = voronoi_nearest_pixel_engine
 
     def settings_with_is_stochastic_true(self):
         settings = copy.copy(self)
@@ -186,6 +205,7 @@ class Voronoi(Pixelization):
                 source_pixelization_grid=pixelization_grid,
                 data_pixelization_grid=sparse_image_plane_grid,
                 hyper_image=hyper_image,
+                nearest_pixel_engine=settings.voronoi_nearest_pixel_engine,
             )
 
         except ValueError as e:
@@ -1,5 +1,6 @@
 import numpy as np
 import pylops
+from scipy import sparse
 
 from autoarray.inversion import regularization_util
 
@@ -129,6 +130,13 @@ class Regularization:
     def regularization_matrix_from_mapper(self, mapper):
         raise NotImplementedError
 
+    def regularization_matrix_sparse_from_mapper(self, mapper):
+        """
+        The regularization matrix as a compressed sparse row (CSR) matrix. Regularization schemes which can build
+        this matrix directly from the pixel neighbors override this method, avoiding the dense matrix entirely.
+        """
+        return sparse.csr_matrix(self.regularization_matrix_from_mapper(mapper=mapper))
+
 
 class Constant(Regularization):
     def __init__(self, coefficient=1.0):
@@ -163,6 +171,13 @@ class Constant(Regularization):
             pixel_neighbors_size=mapper.source_pixelization_grid.pixel_neighbors_size,
         )
 
+    def regularization_matrix_sparse_from_mapper(self, mapper):
+        return regularization_util.constant_regularization_matrix_sparse_from(
+            coefficient=self.coefficient,
+            pixel_neighbors=mapper.source_pixelization_grid.pixel_neighbors,
+            pixel_neighbors_size=mapper.source_pixelization_grid.pixel_neighbors_size,
+        )
+
 
 class AdaptiveBrightness(Regularization):
     def __init__(self, inner_coefficient=1.0, outer_coefficient=1.0, signal_scale=1.0):
@@ -237,6 +252,18 @@ class AdaptiveBrightness(Regularization):
             pixel_neighbors_size=mapper.source_pixelization_grid.pixel_neighbors_size,
         )
 
+    def regularization_matrix_sparse_from_mapper(self, mapper):
+
+        regularization_weight_list = self.regularization_weight_list_from_mapper(
+            mapper=mapper
+        )
+
+        return regularization_util.weighted_regularization_matrix_sparse_from(
+            regularization_weight_list=regularization_weight_list,
+            pixel_neighbors=mapper.source_pixelization_grid.pixel_neighbors,
+            pixel_neighbors_size=mapper.source_pixelization_grid.pixel_neighbors_size,
+        )
+
 
 class RegularizationLop(pylops.LinearOperator):
     def __init__(self, regularization_matrix):
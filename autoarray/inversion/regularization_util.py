@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import sparse
 from autoarray import decorator_util
 
 
@@ -46,6 +47,98 @@ def constant_regularization_matrix_from(
     return regularization_matrix
 
 
+@decorator_util.jit()
+def constant_regularization_matrix_sparse_entries_from(
+    coefficient: float, pixel_neighbors: np.ndarray, pixel_neighbors_size: np.ndarray
+) -> (np.ndarray, np.ndarray, np.ndarray):
+    """
+    From the pixel-neighbors array, returns the non-zero entries of the regularization matrix using the instance
+    regularization scheme, as arrays of values, row indexes and column indexes (coordinate format).
+
+    There is one entry on the diagonal of every pixel and one entry for every pixel neighbor pair, meaning the number
+    of entries scales with the number of pixels as opposed to the number of pixels squared. The diagonal entries are
+    accumulated in the same order as `constant_regularization_matrix_from`, so the two matrices are identical.
+
+    Parameters
+    ----------
+    coefficients : float
+        The regularization coefficients which controls the degree of smoothing of the inversion reconstruction.
+    pixel_neighbors : np.ndarray
+        An array of length (total_pixels) which provides the index of all neighbors of every pixel in
+        the Voronoi grid (entries of -1 correspond to no neighbor).
+    pixel_neighbors_size : ndarrayy
+        An array of length (total_pixels) which gives the number of neighbors of every pixel in the
+        Voronoi grid.
+    """
+
+    pixels = len(pixel_neighbors)
+
+    total_entries = pixels + np.sum(pixel_neighbors_size)
+
+    values = np.zeros(total_entries)
+    row_indexes = np.zeros(total_entries, dtype=np.int64)
+    column_indexes = np.zeros(total_entries, dtype=np.int64)
+
+    regularization_coefficient = coefficient ** 2.0
+
+    index = pixels
+
+    for i in range(pixels):
+        row_indexes[i] = i
+        column_indexes[i] = i
+        values[i] += 1e-8
+        for j in range(pixel_neighbors_size[i]):
+            neighbor_index = pixel_neighbors[i, j]
+            values[i] += regularization_coefficient
+            row_indexes[index] = i
+            column_indexes[index] = neighbor_index
+            values[index] = -regularization_coefficient
+            index += 1
+
+    return values, row_indexes, column_indexes
+
+
+def constant_regularization_matrix_sparse_from(
+    coefficient: float, pixel_neighbors: np.ndarray, pixel_neighbors_size: np.ndarray
+) -> sparse.csr_matrix:
+    """
+    From the pixel-neighbors array, setup the regularization matrix using the instance regularization scheme as a
+    compressed sparse row (CSR) matrix.
+
+    Every pixel has only a small number of neighbors, therefore the regularization matrix is almost entirely zeros
+    for pixelizations with many pixels. This function returns the same matrix as
+    `constant_regularization_matrix_from` without allocating the dense (pixels, pixels) array.
+
+    Parameters
+    ----------
+    coefficients : float
+        The regularization coefficients which controls the degree of smoothing of the inversion reconstruction.
+    pixel_neighbors : np.ndarray
+        An array of length (total_pixels) which provides the index of all neighbors of every pixel in
+        the Voronoi grid (entries of -1 correspond to no neighbor).
+    pixel_neighbors_size : ndarrayy
+        An array of length (total_pixels) which gives the number of neighbors of every pixel in the
+        Voronoi grid.
+
+    Returns
+    -------
+    sparse.csr_matrix
+        The regularization matrix computed using a constant regularization scheme where the effective regularization
+        coefficient of every source pixel is the same.
+    """
+    pixels = len(pixel_neighbors)
+
+    values, row_indexes, column_indexes = constant_regularization_matrix_sparse_entries_from(
+        coefficient=coefficient,
+        pixel_neighbors=pixel_neighbors,
+        pixel_neighbors_size=pixel_neighbors_size,
+    )
+
+    return sparse.csr_matrix(
+        (values, (row_indexes, column_indexes)), shape=(pixels, pixels)
+    )
+
+
 def adaptive_regularization_weight_list_from(
     inner_coefficient: float, outer_coefficient: float, pixel_signals: np.ndarray
 ) -> np.ndarray:
@@ -127,3 +220,104 @@ def weighted_regularization_matrix_from(
             ]
 
     return regularization_matrix
+
+
+@decorator_util.jit()
+def weighted_regularization_matrix_sparse_entries_from(
+    regularization_weight_list: np.ndarray,
+    pixel_neighbors: np.ndarray,
+    pixel_neighbors_size: np.ndarray,
+) -> (np.ndarray, np.ndarray, np.ndarray):
+    """
+    From the pixel-neighbors, returns the non-zero entries of the regularization matrix using the weighted
+    regularization scheme, as arrays of values, row indexes and column indexes (coordinate format).
+
+    Off-diagonal entries of the same pixel pair appear twice (once for each pixel in the pair) and are summed when the
+    sparse matrix is created. The diagonal entries are accumulated in the same order as
+    `weighted_regularization_matrix_from`, so the two matrices are identical.
+
+    Parameters
+    ----------
+    regularization_weight_list : np.ndarray
+        The regularization_ weight of each pixel, which governs how much smoothing is applied to that individual pixel.
+    pixel_neighbors : np.ndarray
+        An array of length (total_pixels) which provides the index of all neighbors of every pixel in
+        the Voronoi grid (entries of -1 correspond to no neighbor).
+    pixel_neighbors_size : ndarrayy
+        An array of length (total_pixels) which gives the number of neighbors of every pixel in the
+        Voronoi grid.
+    """
+
+    pixels = len(regularization_weight_list)
+
+    total_entries = pixels + 2 * np.sum(pixel_neighbors_size)
+
+    values = np.zeros(total_entries)
+    row_indexes = np.zeros(total_entries, dtype=np.int64)
+    column_indexes = np.zeros(total_entries, dtype=np.int64)
+
+    regularization_weight = regularization_weight_list ** 2.0
+
+    for i in range(pixels):
+        row_indexes[i] = i
+        column_indexes[i] = i
+
+    index = pixels
+
+    for i in range(pixels):
+        values[i] += 1e-8
+        for j in range(pixel_neighbors_size[i]):
+            neighbor_index = pixel_neighbors[i, j]
+            values[i] += regularization_weight[neighbor_index]
+            values[neighbor_index] += regularization_weight[neighbor_index]
+            row_indexes[index] = i
+            column_indexes[index] = neighbor_index
+            values[index] = -regularization_weight[neighbor_index]
+            row_indexes[index + 1] = neighbor_index
+            column_indexes[index + 1] = i
+            values[index + 1] = -regularization_weight[neighbor_index]
+            index += 2
+
+    return values, row_indexes, column_indexes
+
+
+def weighted_regularization_matrix_sparse_from(
+    regularization_weight_list: np.ndarray,
+    pixel_neighbors: np.ndarray,
+    pixel_neighbors_size: np.ndarray,
+) -> sparse.csr_matrix:
+    """
+    From the pixel-neighbors, setup the regularization matrix using the weighted regularization scheme as a
+    compressed sparse row (CSR) matrix.
+
+    This returns the same matrix as `weighted_regularization_matrix_from` without allocating the dense
+    (pixels, pixels) array.
+
+    Parameters
+    ----------
+    regularization_weight_list : np.ndarray
+        The regularization_ weight of each pixel, which governs how much smoothing is applied to that individual pixel.
+    pixel_neighbors : np.ndarray
+        An array of length (total_pixels) which provides the index of all neighbors of every pixel in
+        the Voronoi grid (entries of -1 correspond to no neighbor).
+    pixel_neighbors_size : ndarrayy
+        An array of length (total_pixels) which gives the number of neighbors of every pixel in the
+        Voronoi grid.
+
+    Returns
+    -------
+    sparse.csr_matrix
+        The regularization matrix computed using an adaptive regularization scheme where the effective regularization
+        coefficient of every source pixel is different.
+    """
+    pixels = len(regularization_weight_list)
+
+    values, row_indexes, column_indexes = weighted_regularization_matrix_sparse_entries_from(
+        regularization_weight_list=regularization_weight_list,
+        pixel_neighbors=pixel_neighbors,
+        pixel_neighbors_size=pixel_neighbors_size,
+    )
+
+    return sparse.csr_matrix(
+        (values, (row_indexes, column_indexes)), shape=(pixels, pixels)
+    )
@@ -1,6 +1,7 @@
 import logging
 import copy
 import numpy as np
+from functools import wraps
 
 from autoarray import exc
 from autoarray.mask import abstract_mask, mask_2d_util
@@ -15,6 +16,63 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
+class Mask2DIndexes:
+    def __init__(self):
+        """
+        The bundle of index arrays (and edge / border masks) derived from a `Mask2D`, for example the mappings
+        between its slim and native pixels and the indexes of its edge and border pixels.
+
+        Each entry is computed the first time it is accessed and stored, because a mask is not changed during a
+        fit but the entries are used repeatedly (e.g. every time a grid is relocated or a mapper is created). The
+        bundle is shared by every view of the same mask (see `AbstractMask2D.__array_finalize__`) and is pickled
+        with the mask, such that a mask sent to a parallel process does not recompute its indexes.
+
+        Entries are stored separately for each `sub_size`, `pixel_scales` and `origin` they are computed for, as
+        views of the same mask may differ in these attributes.
+        """
+        self.entries = {}
+
+    def entry_from(self, name: str, mask: "AbstractMask2D", func):
+        """
+        Returns an entry of the bundle, computing and storing it via `func` if it has not been computed already.
+
+        Parameters
+        ----------
+        name : str
+            The name of the entry, which is the name of the `Mask2D` property that computes it.
+        mask : AbstractMask2D
+            The mask the entry is derived from.
+        func
+            The function which computes the entry if it is not stored.
+        """
+        key = (name, mask.sub_size, mask.pixel_scales, mask.origin)
+
+        if key not in self.entries:
+            self.entries[key] = func()
+
+        return self.entries[key]
+
+
+def indexes_cached(func):
+    """
+    Decorate a `Mask2D` property such that its value is stored in the mask's `Mask2DIndexes` bundle the first time it
+    is accessed and is not recomputed thereafter.
+
+    Parameters
+    ----------
+    func : (AbstractMask2D) -> object
+        The property function, which computes the value from the mask.
+    """
+
+    @wraps(func)
+    def wrapper(mask):
+        return mask.indexes.entry_from(
+            name=func.__name__, mask=mask, func=lambda: func(mask)
+        )
+
+    return wrapper
+
+
 class AbstractMask2D(abstract_mask.AbstractMask):
 
     # noinspection PyUnusedLocal
@@ -67,10 +125,25 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         super().__array_finalize__(obj=obj)
 
         if isinstance(obj, AbstractMask2D):
-            pass
+            if (
+                self.shape == obj.shape
+                and self.strides == obj.strides
+                and self.ctypes.data == obj.ctypes.data
+            ):
+                self._indexes = obj.indexes
         else:
             self.origin = (0.0, 0.0)
 
+    @property
+    def indexes(self) -> Mask2DIndexes:
+        """
+        The bundle of index arrays derived from the mask, which is created when first accessed and shared by every
+        view of the mask with the same shape and data buffer (see `Mask2DIndexes`).
+        """
+        if "_indexes" not in self.__dict__:
+            self._indexes = Mask2DIndexes()
+        return self._indexes
+
     @property
     def shape_native(self):
         return self.shape
@@ -482,6 +555,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         return grid_2d.Grid2D(grid=grid_scaled_1d, mask=self.edge_mask.mask_sub_1)
 
     @property
+    @indexes_cached
     def _sub_native_index_for_sub_slim_index(self):
         """A 1D array of mappings between every unmasked pixel and its 2D pixel coordinates."""
         return mask_2d_util.native_index_for_slim_index_2d_from(
@@ -489,6 +563,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         ).astype("int")
 
     @property
+    @indexes_cached
     def _edge_1d_indexes(self):
         """
         The indicies of the mask's edge pixels, where an edge pixel is any unmasked pixel on its edge \
@@ -497,6 +572,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         return mask_2d_util.edge_1d_indexes_from(mask_2d=self).astype("int")
 
     @property
+    @indexes_cached
     def _edge_2d_indexes(self):
         """
         The indicies of the mask's edge pixels, where an edge pixel is any unmasked pixel on its edge \
@@ -507,6 +583,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         )
 
     @property
+    @indexes_cached
     def _border_1d_indexes(self):
         """
         The indicies of the mask's border pixels, where a border pixel is any unmasked pixel on an
@@ -516,6 +593,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         return mask_2d_util.border_slim_indexes_from(mask_2d=self).astype("int")
 
     @property
+    @indexes_cached
     def _border_2d_indexes(self):
         """The indicies of the mask's border pixels, where a border pixel is any unmasked pixel on an
         exterior edge (e.g. next to at least one pixel with a `True` value but not central pixels like those within
@@ -526,6 +604,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         ].astype("int")
 
     @property
+    @indexes_cached
     def _sub_border_flat_indexes(self):
         """The indicies of the mask's border pixels, where a border pixel is any unmasked pixel on an
         exterior edge (e.g. next to at least one pixel with a `True` value but not central pixels like those within
@@ -576,6 +655,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         )
 
     @property
+    @indexes_cached
     def edge_mask(self):
         """
         The indicies of the mask's border pixels, where a border pixel is any unmasked pixel on an
@@ -592,6 +672,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         )
 
     @property
+    @indexes_cached
     def border_mask(self):
         """
         The indicies of the mask's border pixels, where a border pixel is any unmasked pixel on an
@@ -608,6 +689,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         )
 
     @property
+    @indexes_cached
     def _sub_mask_index_for_sub_mask_1d_index(self):
         """
         A 1D array of mappings between every unmasked sub pixel and its 2D sub-pixel coordinates.
@@ -617,7 +699,7 @@ class AbstractMask2D(abstract_mask.AbstractMask):
         ).astype("int")
 
     @property
-    @array_2d_util.Memoizer()
+    @indexes_cached
     def _slim_index_for_sub_slim_index(self):
         """
         The util between every sub-pixel and its host pixel.
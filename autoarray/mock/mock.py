@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import sparse
 
 from autoarray.structures.grids import grid_decorators
 
@@ -248,6 +249,9 @@ class MockRegularization:
     def regularization_matrix_from_mapper(self, mapper):
         return np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
 
+    def regularization_matrix_sparse_from_mapper(self, mapper):
+        return sparse.csr_matrix(self.regularization_matrix_from_mapper(mapper=mapper))
+
 
 class MockPixelizationGrid:
     def __init__(self, pixel_neighbors=None, pixel_neighbors_size=None):
@@ -279,6 +283,10 @@ class MockMapper:
         else:
             self.pixels = None
 
+    @property
+    def mapping_matrix_fill_fraction(self):
+        return np.count_nonzero(self.mapping_matrix) / self.mapping_matrix.size
+
 
 class MockConvolver:
     def __init__(self, matrix_shape):
@@ -1,12 +1,23 @@
 from autoarray import decorator_util
+import hashlib
 import numpy as np
+import os
+from os import path
+from numba import prange
+from scipy import sparse
+from scipy.fft import irfft2, next_fast_len, rfft2
 from autoarray import exc
 from autoarray.structures.arrays.two_d import array_2d
 from autoarray.mask import mask_2d_util
 
 
 class Convolver:
-    def __init__(self, mask, kernel):
+
+    fft_kernel_min_size = 441
+    fft_batch_size = 64
+    fft_sparse_tolerance = 1.0e-12
+
+    def __init__(self, mask, kernel, parallel=False, use_fft=None, cache_path=None):
         """
         Class to setup the 1D convolution of an / mapping matrix.
 
@@ -174,11 +185,27 @@ class Convolver:
             A masks of pixels outside the masks but whose light blurs into it after PSF convolution.
         kernel : grid.PSF or ndarray
             An array representing a PSF.
+        parallel : bool
+            If `True`, convolutions are performed by default using the parallel functions `convolve_parallel_jit`
+            and `convolve_matrix_parallel_jit`, which distribute the calculation over all available cores. This can
+            be overridden for an individual convolution via the `parallel` input of `convolve_image` and
+            `convolve_mapping_matrix`.
+        use_fft : bool or None
+            If `True`, convolutions are performed using FFTs of the masked array and blurring region padded to their
+            native 2D shape, instead of the image and blurring frames. For large kernels this is faster and the frames,
+            whose size scales as the number of unmasked pixels times the kernel size, are not computed unless they are
+            accessed. If `None`, FFTs are used if the kernel has at least `fft_kernel_min_size` pixels (e.g. 21 x 21).
+        cache_path : str or None
+            If input, the image and blurring frames are stored in this directory the first time they are computed for
+            a given mask and kernel and loaded from it thereafter as read-only memory maps (see
+            `frames_via_cache_from`).
         """
         if kernel.shape_native[0] % 2 == 0 or kernel.shape_native[1] % 2 == 0:
             raise exc.ConvolverException("PSF kernel must be odd")
 
         self.mask = mask
+        self.parallel = parallel
+        self.cache_path = cache_path
 
         self.mask_index_array = np.full(mask.shape, -1)
         self.pixels_in_mask = int(np.size(mask) - np.sum(mask))
@@ -193,78 +220,264 @@ class Convolver:
         self.kernel = kernel
         self.kernel_max_size = self.kernel.shape_native[0] * self.kernel.shape_native[1]
 
+        self.blurring_mask = mask_2d_util.blurring_mask_2d_from(
+            mask_2d=mask, kernel_shape_native=kernel.shape_native
+        )
+
+        self.pixels_in_blurring_mask = int(
+            np.size(self.blurring_mask) - np.sum(self.blurring_mask)
+        )
+
+        if use_fft is None:
+            use_fft = self.kernel_max_size >= self.fft_kernel_min_size
+
+        self.use_fft = use_fft
+
+        self._image_frames = None
+        self._blurring_frames = None
+        self._kernel_fft = None
+        self._convolution_matrix_sparse = None
+        self._blurring_convolution_matrix_sparse = None
+
+        if not self.use_fft:
+            self._image_frames = self.frames_via_cache_from(
+                name="image", frames_func=self.image_frames_from
+            )
+            self._blurring_frames = self.frames_via_cache_from(
+                name="blurring", frames_func=self.blurring_frames_from
+            )
+
+    def image_frames_from(self):
+        """
+        Returns the image frames of every unmasked pixel, which are the indexes of the unmasked pixels it blurs light
+        into, the kernel values it blurs light into them with and the number of these pixels (see the class
+        description).
+        """
         mask_1d_index = 0
-        self.image_frame_1d_indexes = np.zeros(
+        image_frame_1d_indexes = np.zeros(
             (self.pixels_in_mask, self.kernel_max_size), dtype="int"
         )
-        self.image_frame_1d_kernels = np.zeros(
-            (self.pixels_in_mask, self.kernel_max_size)
-        )
-        self.image_frame_1d_lengths = np.zeros((self.pixels_in_mask), dtype="int")
+        image_frame_1d_kernels = np.zeros((self.pixels_in_mask, self.kernel_max_size))
+        image_frame_1d_lengths = np.zeros((self.pixels_in_mask), dtype="int")
         for x in range(self.mask_index_array.shape[0]):
             for y in range(self.mask_index_array.shape[1]):
-                if not mask[x][y]:
-                    (
-                        image_frame_1d_indexes,
-                        image_frame_1d_kernels,
-                    ) = self.frame_at_coordinates_jit(
+                if not self.mask[x][y]:
+                    (frame_1d_indexes, frame_1d_kernels) = self.frame_at_coordinates_jit(
                         coordinates=(x, y),
-                        mask=mask,
+                        mask=self.mask,
                         mask_index_array=self.mask_index_array,
                         kernel_2d=self.kernel.native[:, :],
                     )
-                    self.image_frame_1d_indexes[
-                        mask_1d_index, :
-                    ] = image_frame_1d_indexes
-                    self.image_frame_1d_kernels[
-                        mask_1d_index, :
-                    ] = image_frame_1d_kernels
-                    self.image_frame_1d_lengths[mask_1d_index] = image_frame_1d_indexes[
-                        image_frame_1d_indexes >= 0
+                    image_frame_1d_indexes[mask_1d_index, :] = frame_1d_indexes
+                    image_frame_1d_kernels[mask_1d_index, :] = frame_1d_kernels
+                    image_frame_1d_lengths[mask_1d_index] = frame_1d_indexes[
+                        frame_1d_indexes >= 0
                     ].shape[0]
                     mask_1d_index += 1
 
-        self.blurring_mask = mask_2d_util.blurring_mask_2d_from(
-            mask_2d=mask, kernel_shape_native=kernel.shape_native
-        )
-
-        self.pixels_in_blurring_mask = int(
-            np.size(self.blurring_mask) - np.sum(self.blurring_mask)
-        )
+        return image_frame_1d_indexes, image_frame_1d_kernels, image_frame_1d_lengths
 
+    def blurring_frames_from(self):
+        """
+        Returns the blurring frames of every unmasked pixel of the blurring mask, which are the indexes of the
+        unmasked pixels in the mask it blurs light into, the kernel values it blurs light into them with and the number
+        of these pixels (see the class description).
+        """
         mask_1d_index = 0
-        self.blurring_frame_1d_indexes = np.zeros(
+        blurring_frame_1d_indexes = np.zeros(
             (self.pixels_in_blurring_mask, self.kernel_max_size), dtype="int"
         )
-        self.blurring_frame_1d_kernels = np.zeros(
+        blurring_frame_1d_kernels = np.zeros(
             (self.pixels_in_blurring_mask, self.kernel_max_size)
         )
-        self.blurring_frame_1d_lengths = np.zeros(
+        blurring_frame_1d_lengths = np.zeros(
             (self.pixels_in_blurring_mask), dtype="int"
         )
-        for x in range(mask.shape[0]):
-            for y in range(mask.shape[1]):
-                if mask[x][y] and not self.blurring_mask[x, y]:
-                    (
-                        image_frame_1d_indexes,
-                        image_frame_1d_kernels,
-                    ) = self.frame_at_coordinates_jit(
+        for x in range(self.mask.shape[0]):
+            for y in range(self.mask.shape[1]):
+                if self.mask[x][y] and not self.blurring_mask[x, y]:
+                    (frame_1d_indexes, frame_1d_kernels) = self.frame_at_coordinates_jit(
                         coordinates=(x, y),
-                        mask=mask,
+                        mask=self.mask,
                         mask_index_array=self.mask_index_array,
                         kernel_2d=self.kernel.native,
                     )
-                    self.blurring_frame_1d_indexes[
-                        mask_1d_index, :
-                    ] = image_frame_1d_indexes
-                    self.blurring_frame_1d_kernels[
-                        mask_1d_index, :
-                    ] = image_frame_1d_kernels
-                    self.blurring_frame_1d_lengths[
-                        mask_1d_index
-                    ] = image_frame_1d_indexes[image_frame_1d_indexes >= 0].shape[0]
+                    blurring_frame_1d_indexes[mask_1d_index, :] = frame_1d_indexes
+                    blurring_frame_1d_kernels[mask_1d_index, :] = frame_1d_kernels
+                    blurring_frame_1d_lengths[mask_1d_index] = frame_1d_indexes[
+                        frame_1d_indexes >= 0
+                    ].shape[0]
                     mask_1d_index += 1
 
+        return (
+            blurring_frame_1d_indexes,
+            blurring_frame_1d_kernels,
+            blurring_frame_1d_lengths,
+        )
+
+    @property
+    def cache_key(self):
+        """
+        A hash of the mask (including its sub-size) and kernel, which uniquely identifies the frames of this
+        convolver and names the directory they are stored in within `cache_path`.
+        """
+        key = hashlib.sha256()
+        key.update(np.asarray(self.mask, dtype="bool").tobytes())
+        key.update(np.asarray(self.mask.shape, dtype="int").tobytes())
+        key.update(np.asarray(self.mask.sub_size, dtype="int").tobytes())
+        key.update(np.asarray(self.kernel.native, dtype="float").tobytes())
+        key.update(np.asarray(self.kernel.shape_native, dtype="int").tobytes())
+        return key.hexdigest()
+
+    def frames_via_cache_from(self, name, frames_func):
+        """
+        Returns the image or blurring frames of the convolver, loading them from the on-disk cache if the convolver
+        has a `cache_path` and they have been computed and stored for the same mask and kernel before.
+
+        Frames are stored as `.npy` files in the directory `cache_path/cache_key` and loaded as read-only memory maps,
+        such that processes which use the same mask and kernel share one copy of the frames in memory. Each file is
+        written to a temporary file which is then renamed, so processes computing the same frames at the same time
+        never load a partially written file.
+
+        Parameters
+        -----------
+        name : str
+            The name of the frames, "image" or "blurring".
+        frames_func : func
+            The function which computes the frames if they are not in the cache.
+        """
+        if self.cache_path is None:
+            return frames_func()
+
+        frames_path = path.join(self.cache_path, self.cache_key)
+
+        file_paths = [
+            path.join(frames_path, f"{name}_frame_1d_{attribute}.npy")
+            for attribute in ("indexes", "kernels", "lengths")
+        ]
+
+        if not all(path.exists(file_path) for file_path in file_paths):
+
+            os.makedirs(frames_path, exist_ok=True)
+
+            for file_path, frames in zip(file_paths, frames_func()):
+
+                temporary_file_path = f"{file_path}.{os.getpid()}.tmp"
+
+                with open(temporary_file_path, "wb") as f:
+                    np.save(f, frames)
+
+                os.replace(temporary_file_path, file_path)
+
+        return tuple(np.load(file_path, mmap_mode="r") for file_path in file_paths)
+
+    @property
+    def image_frames(self):
+        """
+        The image frames (`image_frame_1d_indexes`, `image_frame_1d_kernels`, `image_frame_1d_lengths`), which are
+        computed when the convolver is created or, if it uses FFTs, the first time they are accessed.
+        """
+        if self._image_frames is None:
+            self._image_frames = self.frames_via_cache_from(
+                name="image", frames_func=self.image_frames_from
+            )
+
+        return self._image_frames
+
+    @property
+    def image_frame_1d_indexes(self):
+        return self.image_frames[0]
+
+    @property
+    def image_frame_1d_kernels(self):
+        return self.image_frames[1]
+
+    @property
+    def image_frame_1d_lengths(self):
+        return self.image_frames[2]
+
+    @property
+    def blurring_frames(self):
+        """
+        The blurring frames (`blurring_frame_1d_indexes`, `blurring_frame_1d_kernels`, `blurring_frame_1d_lengths`),
+        which are computed when the convolver is created or, if it uses FFTs, the first time they are accessed.
+        """
+        if self._blurring_frames is None:
+            self._blurring_frames = self.frames_via_cache_from(
+                name="blurring", frames_func=self.blurring_frames_from
+            )
+
+        return self._blurring_frames
+
+    @property
+    def blurring_frame_1d_indexes(self):
+        return self.blurring_frames[0]
+
+    @property
+    def blurring_frame_1d_kernels(self):
+        return self.blurring_frames[1]
+
+    @property
+    def blurring_frame_1d_lengths(self):
+        return self.blurring_frames[2]
+
+    @property
+    def fft_shape(self):
+        """
+        The shape of the zero-padded canvas the FFT convolution is performed on, which is large enough that the linear
+        convolution of the mask's native array with the kernel does not wrap around its edges.
+        """
+        return tuple(
+            next_fast_len(mask_length + kernel_length - 1, real=True)
+            for mask_length, kernel_length in zip(
+                self.mask.shape, self.kernel.shape_native
+            )
+        )
+
+    @property
+    def kernel_fft(self):
+        """
+        The real FFT of the kernel on the padded canvas of shape `fft_shape`, which is computed the first time it is
+        accessed and reused by every FFT convolution thereafter.
+        """
+        if self._kernel_fft is None:
+            self._kernel_fft = rfft2(np.asarray(self.kernel.native), s=self.fft_shape)
+
+        return self._kernel_fft
+
+    def convolve_native_via_fft(self, native_arrays, parallel):
+        """
+        Convolve a batch of arrays of the mask's native shape with the kernel using FFTs and return the convolved
+        values of the unmasked pixels.
+
+        Every array is zero-padded to `fft_shape`, multiplied by the cached `kernel_fft` in Fourier space and
+        transformed back, with the central region of the linear convolution gathered back to the mask's slim
+        representation.
+
+        Parameters
+        -----------
+        native_arrays : np.ndarray
+            An array of shape (total_arrays, mask.shape[0], mask.shape[1]) of the arrays which are convolved.
+        parallel : bool
+            If `True` the FFTs use all available cores.
+        """
+        workers = -1 if parallel else None
+
+        half_y = self.kernel.shape_native[0] // 2
+        half_x = self.kernel.shape_native[1] // 2
+
+        convolved_native_arrays = irfft2(
+            rfft2(native_arrays, s=self.fft_shape, workers=workers) * self.kernel_fft,
+            s=self.fft_shape,
+            workers=workers,
+        )[
+            :,
+            half_y : half_y + self.mask.shape[0],
+            half_x : half_x + self.mask.shape[1],
+        ]
+
+        return convolved_native_arrays[:, np.invert(self.mask)]
+
     @staticmethod
     @decorator_util.jit()
     def frame_at_coordinates_jit(coordinates, mask, mask_index_array, kernel_2d):
@@ -306,7 +519,7 @@ class Convolver:
 
         return frame, kernel_frame
 
-    def convolve_image(self, image, blurring_image):
+    def convolve_image(self, image, blurring_image, parallel=None):
         """For a given 1D array and blurring array, convolve the two using this convolver.
 
         Parameters
@@ -315,6 +528,9 @@ class Convolver:
             1D array of the values which are to be blurred with the convolver's PSF.
         blurring_image : np.ndarray
             1D array of the blurring values which blur into the array after PSF convolution.
+        parallel : bool or None
+            If `True` the convolution is performed in parallel using `convolve_parallel_jit`, if `False` it is
+            performed serially using `convolve_jit`. If `None`, the `parallel` attribute of the convolver is used.
         """
 
         if self.blurring_mask is None:
@@ -323,6 +539,36 @@ class Convolver:
                 "not created with a blurring_mask."
             )
 
+        if parallel is None:
+            parallel = self.parallel
+
+        if self.use_fft:
+
+            native_image = np.zeros(self.mask.shape)
+            native_image[np.invert(self.mask)] = image.binned.slim
+            native_image[np.invert(self.blurring_mask)] = blurring_image.binned.slim
+
+            convolved_image = self.convolve_native_via_fft(
+                native_arrays=native_image[None, :, :], parallel=parallel
+            )[0]
+
+            return array_2d.Array2D(array=convolved_image, mask=self.mask.mask_sub_1)
+
+        if parallel:
+
+            convolved_image = self.convolve_parallel_jit(
+                image_1d_array=image.binned.slim,
+                image_gather_indptr=self.convolution_matrix_sparse.indptr,
+                image_gather_indexes=self.convolution_matrix_sparse.indices,
+                image_gather_kernels=self.convolution_matrix_sparse.data,
+                blurring_1d_array=blurring_image.binned.slim,
+                blurring_gather_indptr=self.blurring_convolution_matrix_sparse.indptr,
+                blurring_gather_indexes=self.blurring_convolution_matrix_sparse.indices,
+                blurring_gather_kernels=self.blurring_convolution_matrix_sparse.data,
+            )
+
+            return array_2d.Array2D(array=convolved_image, mask=self.mask.mask_sub_1)
+
         convolved_image = self.convolve_jit(
             image_1d_array=image.binned.slim,
             image_frame_1d_indexes=self.image_frame_1d_indexes,
@@ -378,7 +624,80 @@ class Convolver:
 
         return blurred_image_1d
 
-    def convolve_mapping_matrix(self, mapping_matrix):
+    @staticmethod
+    @decorator_util.jit(parallel=True)
+    def convolve_parallel_jit(
+        image_1d_array,
+        image_gather_indptr,
+        image_gather_indexes,
+        image_gather_kernels,
+        blurring_1d_array,
+        blurring_gather_indptr,
+        blurring_gather_indexes,
+        blurring_gather_kernels,
+    ):
+        """
+        Convolve a 1D array and blurring array in parallel over the pixels of the blurred image.
+
+        The serial function `convolve_jit` scatters the light of every image pixel into the pixels of its frame, such
+        that different image pixels write to the same blurred pixel and cannot be looped over in parallel. This
+        function instead gathers, for every blurred pixel, the light of all image and blurring pixels which blur into
+        it. Each blurred pixel is therefore written by one thread only.
+
+        The gather frames are the rows of `convolution_matrix_sparse` and `blurring_convolution_matrix_sparse` in
+        compressed sparse row (CSR) format, where the source pixels of every row are in ascending order. The values
+        are therefore summed in the same order as `convolve_jit`.
+
+        Parameters
+        -----------
+        image_1d_array : np.ndarray
+            1D array of the values which are to be blurred with the convolver's PSF.
+        image_gather_indptr : np.ndarray
+            For every blurred pixel, the index range of `image_gather_indexes` containing the image pixels that blur
+            into it.
+        image_gather_indexes : np.ndarray
+            The indexes of the image pixels which blur into every blurred pixel.
+        image_gather_kernels : np.ndarray
+            The kernel values with which each image pixel blurs into every blurred pixel.
+        blurring_1d_array : np.ndarray
+            1D array of the blurring values which blur into the array after PSF convolution.
+        blurring_gather_indptr : np.ndarray
+            For every blurred pixel, the index range of `blurring_gather_indexes` containing the blurring pixels that
+            blur into it.
+        blurring_gather_indexes : np.ndarray
+            The indexes of the blurring pixels which blur into every blurred pixel.
+        blurring_gather_kernels : np.ndarray
+            The kernel values with which each blurring pixel blurs into every blurred pixel.
+        """
+
+        blurred_image_1d = np.zeros(image_1d_array.shape)
+
+        for vector_index in prange(len(image_1d_array)):
+
+            value = 0.0
+
+            for gather_index in range(
+                image_gather_indptr[vector_index], image_gather_indptr[vector_index + 1]
+            ):
+                value += (
+                    image_1d_array[image_gather_indexes[gather_index]]
+                    * image_gather_kernels[gather_index]
+                )
+
+            for gather_index in range(
+                blurring_gather_indptr[vector_index],
+                blurring_gather_indptr[vector_index + 1],
+            ):
+                value += (
+                    blurring_1d_array[blurring_gather_indexes[gather_index]]
+                    * blurring_gather_kernels[gather_index]
+                )
+
+            blurred_image_1d[vector_index] = value
+
+        return blurred_image_1d
+
+    def convolve_mapping_matrix(self, mapping_matrix, parallel=None):
         """For a given inversion mapping matrix, convolve every pixel's mapped with the PSF kernel.
 
         A mapping matrix provides non-zero entries in all elements which map two pixels to one another
@@ -448,7 +767,27 @@ class Convolver:
         -----------
         mapping_matrix : np.ndarray
             The 2D mapping matrix describing how every inversion pixel maps to a pixel on the data pixel.
+        parallel : bool or None
+            If `True` the convolution is performed in parallel using `convolve_matrix_parallel_jit`, if `False` it is
+            performed serially using `convolve_matrix_jit`. If `None`, the `parallel` attribute of the convolver is
+            used.
         """
+        if parallel is None:
+            parallel = self.parallel
+
+        if self.use_fft:
+            return self.convolve_mapping_matrix_via_fft(
+                mapping_matrix=mapping_matrix, parallel=parallel
+            )
+
+        if parallel:
+            return self.convolve_matrix_parallel_jit(
+                mapping_matrix=mapping_matrix,
+                image_frame_1d_indexes=self.image_frame_1d_indexes,
+                image_frame_1d_kernels=self.image_frame_1d_kernels,
+                image_frame_1d_lengths=self.image_frame_1d_lengths,
+            )
+
         return self.convolve_matrix_jit(
             mapping_matrix=mapping_matrix,
             image_frame_1d_indexes=self.image_frame_1d_indexes,
@@ -456,6 +795,154 @@ class Convolver:
             image_frame_1d_lengths=self.image_frame_1d_lengths,
         )
 
+    def convolve_mapping_matrix_via_fft(self, mapping_matrix, parallel=False):
+        """For a given inversion mapping matrix, convolve every pixel's mapped values with the PSF kernel using FFTs.
+
+        The columns of the mapping matrix are mapped to the mask's native 2D shape and convolved in batches of
+        `fft_batch_size` columns, such that the memory used by the padded canvases is bounded for pixelizations with
+        many pixels.
+
+        Parameters
+        -----------
+        mapping_matrix : np.ndarray
+            The 2D mapping matrix describing how every inversion pixel maps to a pixel on the data pixel.
+        parallel : bool
+            If `True` the FFTs use all available cores.
+        """
+        blurred_mapping_matrix = np.zeros(mapping_matrix.shape)
+
+        for pixel_1d_index in range(0, mapping_matrix.shape[1], self.fft_batch_size):
+
+            batch_mapping_matrix = mapping_matrix[
+                :, pixel_1d_index : pixel_1d_index + self.fft_batch_size
+            ]
+
+            native_mapping = np.zeros(
+                (batch_mapping_matrix.shape[1],) + self.mask.shape
+            )
+            native_mapping[:, np.invert(self.mask)] = batch_mapping_matrix.T
+
+            blurred_mapping_matrix[
+                :, pixel_1d_index : pixel_1d_index + self.fft_batch_size
+            ] = self.convolve_native_via_fft(
+                native_arrays=native_mapping, parallel=parallel
+            ).T
+
+        return blurred_mapping_matrix
+
+    @property
+    def convolution_matrix_sparse(self):
+        """
+        The convolution of the masked array as a sparse matrix of dimensions (pixels_in_mask, pixels_in_mask), where
+        entry [i, j] is the kernel value with which pixel j blurs light into pixel i.
+
+        It is built from the image frames (`image_frame_1d_indexes`, `image_frame_1d_kernels`,
+        `image_frame_1d_lengths`) the first time it is accessed and stored thereafter. Blurring light from outside the
+        mask (the blurring frames) is omitted, as for the mapping matrix blurring.
+        """
+        if self._convolution_matrix_sparse is None:
+
+            frame_entries = (
+                np.arange(self.kernel_max_size)[None, :]
+                < self.image_frame_1d_lengths[:, None]
+            )
+
+            self._convolution_matrix_sparse = sparse.csr_matrix(
+                (
+                    self.image_frame_1d_kernels[frame_entries],
+                    (
+                        self.image_frame_1d_indexes[frame_entries],
+                        np.repeat(
+                            np.arange(self.pixels_in_mask), self.image_frame_1d_lengths
+                        ),
+                    ),
+                ),
+                shape=(self.pixels_in_mask, self.pixels_in_mask),
+            )
+
+        return self._convolution_matrix_sparse
+
+    @property
+    def blurring_convolution_matrix_sparse(self):
+        """
+        The convolution of the blurring array as a sparse matrix of dimensions
+        (pixels_in_mask, pixels_in_blurring_mask), where entry [i, j] is the kernel value with which blurring pixel j
+        blurs light into pixel i of the mask.
+
+        It is built from the blurring frames (`blurring_frame_1d_indexes`, `blurring_frame_1d_kernels`,
+        `blurring_frame_1d_lengths`) the first time it is accessed and stored thereafter.
+        """
+        if self._blurring_convolution_matrix_sparse is None:
+
+            frame_entries = (
+                np.arange(self.kernel_max_size)[None, :]
+                < self.blurring_frame_1d_lengths[:, None]
+            )
+
+            self._blurring_convolution_matrix_sparse = sparse.csr_matrix(
+                (
+                    self.blurring_frame_1d_kernels[frame_entries],
+                    (
+                        self.blurring_frame_1d_indexes[frame_entries],
+                        np.repeat(
+                            np.arange(self.pixels_in_blurring_mask),
+                            self.blurring_frame_1d_lengths,
+                        ),
+                    ),
+                ),
+                shape=(self.pixels_in_mask, self.pixels_in_blurring_mask),
+            )
+
+        return self._blurring_convolution_matrix_sparse
+
+    def convolve_mapping_matrix_sparse(self, mapping_matrix_sparse):
+        """For a given inversion mapping matrix in compressed sparse row (CSR) format, convolve every pixel's mapped
+        values with the PSF kernel and return the blurred mapping matrix in CSR format.
+
+        This performs the same calculation as `convolve_mapping_matrix` (see its description for a worked example),
+        but neither the input nor blurred mapping matrix are stored as dense arrays. This is faster and uses much
+        less memory for pixelizations with many pixels, where most mapping matrix entries are zero.
+
+        If `use_fft` is `True`, the columns are instead blurred using FFTs in batches of `fft_batch_size` columns,
+        such that the image frames and `convolution_matrix_sparse` are never computed. Entries of every blurred batch
+        whose absolute value is below `fft_sparse_tolerance` times the largest absolute value of their column are FFT
+        round-off and are removed.
+
+        Parameters
+        -----------
+        mapping_matrix_sparse : scipy.sparse.csr_matrix
+            The 2D mapping matrix describing how every inversion pixel maps to a pixel on the data pixel.
+        """
+        if not self.use_fft:
+            return self.convolution_matrix_sparse.dot(mapping_matrix_sparse).tocsr()
+
+        mapping_matrix_sparse = sparse.csc_matrix(mapping_matrix_sparse)
+
+        blurred_mapping_matrix_batches = []
+
+        for pixel_1d_index in range(
+            0, mapping_matrix_sparse.shape[1], self.fft_batch_size
+        ):
+
+            blurred_mapping_matrix = self.convolve_mapping_matrix_via_fft(
+                mapping_matrix=mapping_matrix_sparse[
+                    :, pixel_1d_index : pixel_1d_index + self.fft_batch_size
+                ].toarray(),
+                parallel=self.parallel,
+            )
+
+            blurred_mapping_matrix[
+                np.abs(blurred_mapping_matrix)
+                < self.fft_sparse_tolerance
+                * np.max(np.abs(blurred_mapping_matrix), axis=0)
+            ] = 0.0
+
+            blurred_mapping_matrix_batches.append(
+                sparse.csr_matrix(blurred_mapping_matrix)
+            )
+
+        return sparse.hstack(blurred_mapping_matrix_batches, format="csr")
+
     @staticmethod
     @decorator_util.jit()
     def convolve_matrix_jit(
@@ -486,3 +973,41 @@ class Convolver:
                         )
 
         return blurred_mapping_matrix
+
+    @staticmethod
+    @decorator_util.jit(parallel=True)
+    def convolve_matrix_parallel_jit(
+        mapping_matrix,
+        image_frame_1d_indexes,
+        image_frame_1d_kernels,
+        image_frame_1d_lengths,
+    ):
+        """
+        Convolve every column of a mapping matrix with the PSF kernel in parallel over the columns (the pixelization
+        pixels).
+
+        Every column of the blurred mapping matrix depends only on the same column of the mapping matrix, therefore
+        each column is written by one thread only and the result is identical to `convolve_matrix_jit`.
+        """
+
+        blurred_mapping_matrix = np.zeros(mapping_matrix.shape)
+
+        for pixel_1d_index in prange(mapping_matrix.shape[1]):
+            for image_1d_index in range(mapping_matrix.shape[0]):
+
+                value = mapping_matrix[image_1d_index, pixel_1d_index]
+
+                if value > 0:
+
+                    frame_1d_indexes = image_frame_1d_indexes[image_1d_index]
+                    frame_1d_kernel = image_frame_1d_kernels[image_1d_index]
+                    frame_1d_length = image_frame_1d_lengths[image_1d_index]
+
+                    for kernel_1d_index in range(frame_1d_length):
+                        vector_index = frame_1d_indexes[kernel_1d_index]
+                        kernel_value = frame_1d_kernel[kernel_1d_index]
+                        blurred_mapping_matrix[vector_index, pixel_1d_index] += (
+                            value * kernel_value
+                        )
+
+        return blurred_mapping_matrix
@@ -8,12 +8,55 @@ from pynufft.linalg.nufft_cpu import NUFFT_cpu
 import pylops
 import warnings
 
+from collections import OrderedDict
 import copy
+import hashlib
 import numpy as np
+import os
+from os import path
+import pickle
 
 
 class TransformerDFT(pylops.LinearOperator):
-    def __init__(self, uv_wavelengths, real_space_mask, preload_transform=True):
+
+    preload_chunk_bytes = 2 ** 28
+
+    def __init__(
+        self,
+        uv_wavelengths,
+        real_space_mask,
+        preload_transform=True,
+        preload_dtype="float64",
+        preload_path=None,
+        preload_chunk_bytes=None,
+    ):
+        """
+        Performs the direct Fourier transform (DFT) of real-space images to visibilities.
+
+        The cosine and sine terms of the DFT for every image pixel and visibility can be preloaded, such that they
+        are not recomputed every time the DFT is performed. These arrays have dimensions [image_pixels,
+        total_visibilities], so the preload is computed and used in chunks of visibilities whose memory is below
+        `preload_chunk_bytes`. For large datasets they can be stored in single precision and / or on disk as memory
+        maps.
+
+        Parameters
+        ----------
+        uv_wavelengths : np.ndarray
+            The wavelengths of the coordinates in the uv-plane of the visibilities that images are transformed to.
+        real_space_mask : Mask2D
+            The real-space mask within which the images that are Fourier transformed are computed.
+        preload_transform : bool
+            If `True`, the cosine and sine terms of the DFT are preloaded.
+        preload_dtype : str
+            The data type the preloaded terms are stored as, where "float32" halves their memory.
+        preload_path : str or None
+            If input, the preloaded terms are stored as `.npy` files in this directory, which are loaded as read-only
+            memory maps whenever a `TransformerDFT` is created for the same uv-wavelengths, grid and data type.
+        preload_chunk_bytes : int or None
+            The maximum memory of the preloaded terms of a chunk of visibilities, which bounds the temporary memory
+            used to compute the preload and the size of the blocks the DFT is performed in. If `None`, the class
+            attribute `preload_chunk_bytes` is used.
+        """
 
         super(TransformerDFT, self).__init__()
 
@@ -25,15 +68,16 @@ class TransformerDFT(pylops.LinearOperator):
         self.total_image_pixels = self.real_space_mask.pixels_in_mask
 
         self.preload_transform = preload_transform
+        self.preload_dtype = np.dtype(preload_dtype)
+        self.preload_path = preload_path
 
-        if preload_transform:
+        if preload_chunk_bytes is not None:
+            self.preload_chunk_bytes = preload_chunk_bytes
 
-            self.preload_real_transforms = transformer_util.preload_real_transforms(
-                grid_radians=self.grid, uv_wavelengths=self.uv_wavelengths
-            )
+        if preload_transform:
 
-            self.preload_imag_transforms = transformer_util.preload_imag_transforms(
-                grid_radians=self.grid, uv_wavelengths=self.uv_wavelengths
+            self.preload_real_transforms, self.preload_imag_transforms = (
+                self.preload_transforms_from()
             )
 
         self.real_space_pixels = self.real_space_mask.pixels_in_mask
@@ -45,15 +89,131 @@ class TransformerDFT(pylops.LinearOperator):
         self.dtype = "complex128"
         self.explicit = False
 
+    @property
+    def preload_chunk_size(self):
+        """
+        The number of visibilities in every chunk of the preload, such that the real and imaginary preloaded terms of
+        a chunk use less than `preload_chunk_bytes` of memory.
+        """
+        bytes_per_visibility = 2 * self.grid.shape[0] * self.preload_dtype.itemsize
+
+        return max(1, int(self.preload_chunk_bytes // bytes_per_visibility))
+
+    @property
+    def preload_chunks(self):
+        """
+        The slices of visibilities which the preload is computed and used in.
+        """
+        return [
+            slice(vis_1d_index, vis_1d_index + self.preload_chunk_size)
+            for vis_1d_index in range(
+                0, self.total_visibilities, self.preload_chunk_size
+            )
+        ]
+
+    @property
+    def preload_cache_key(self):
+        """
+        A hash of the uv-wavelengths, grid and data type of the preload, which uniquely identifies the preloaded terms
+        and names the files they are stored in within `preload_path`.
+        """
+        key = hashlib.sha256()
+        key.update(np.asarray(self.uv_wavelengths, dtype="float").tobytes())
+        key.update(np.asarray(self.grid, dtype="float").tobytes())
+        key.update(self.preload_dtype.str.encode())
+        return key.hexdigest()
+
+    def preload_transforms_from(self):
+        """
+        Returns the preloaded cosine and sine terms of the DFT, which are computed one chunk of visibilities at a
+        time and written to in-memory arrays or, if there is a `preload_path`, to `.npy` files which are then loaded
+        as read-only memory maps.
+
+        Each file is written to a temporary file which is then renamed, so processes computing the same preload at
+        the same time never load a partially written file.
+        """
+        shape = (self.grid.shape[0], self.total_visibilities)
+        grid_radians = np.asarray(self.grid)
+
+        if self.preload_path is None:
+
+            preloads = (
+                np.zeros(shape=shape, dtype=self.preload_dtype),
+                np.zeros(shape=shape, dtype=self.preload_dtype),
+            )
+
+            self.preload_transforms_into(
+                preloads=preloads, grid_radians=grid_radians
+            )
+
+            return preloads
+
+        file_paths = [
+            path.join(self.preload_path, f"dft_{name}_{self.preload_cache_key}.npy")
+            for name in ("real", "imag")
+        ]
+
+        if not all(path.exists(file_path) for file_path in file_paths):
+
+            os.makedirs(self.preload_path, exist_ok=True)
+
+            temporary_file_paths = [
+                f"{file_path}.{os.getpid()}.tmp" for file_path in file_paths
+            ]
+
+            preloads = tuple(
+                np.lib.format.open_memmap(
+                    temporary_file_path,
+                    mode="w+",
+                    dtype=self.preload_dtype,
+                    shape=shape,
+                )
+                for temporary_file_path in temporary_file_paths
+            )
+
+            self.preload_transforms_into(
+                preloads=preloads, grid_radians=grid_radians
+            )
+
+            for preload in preloads:
+                preload.flush()
+
+            del preloads
+
+            for temporary_file_path, file_path in zip(
+                temporary_file_paths, file_paths
+            ):
+                os.replace(temporary_file_path, file_path)
+
+        return tuple(np.load(file_path, mmap_mode="r") for file_path in file_paths)
+
+    def preload_transforms_into(self, preloads, grid_radians):
+        """
+        Fills the real and imaginary `preloads` with the cosine and sine terms of the DFT one chunk of visibilities at
+        a time.
+        """
+
+        for chunk in self.preload_chunks:
+
+            preloads[0][:, chunk], preloads[1][:, chunk] = transformer_util.preload_transforms(
+                grid_radians=grid_radians, uv_wavelengths=self.uv_wavelengths[chunk]
+            )
+
     def visibilities_from_image(self, image):
 
         if self.preload_transform:
 
-            visibilities = transformer_util.visibilities_via_preload_jit_from(
-                image_1d=image.binned,
-                preloaded_reals=self.preload_real_transforms,
-                preloaded_imags=self.preload_imag_transforms,
-            )
+            image_1d = image.binned
+
+            visibilities = np.zeros(self.total_visibilities, dtype="complex128")
+
+            for chunk in self.preload_chunks:
+
+                visibilities[chunk] = transformer_util.visibilities_via_preload_jit_from(
+                    image_1d=image_1d,
+                    preloaded_reals=self.preload_real_transforms[:, chunk],
+                    preloaded_imags=self.preload_imag_transforms[:, chunk],
+                )
 
         else:
 
@@ -88,12 +248,22 @@ class TransformerDFT(pylops.LinearOperator):
 
         if self.preload_transform:
 
-            return transformer_util.transformed_mapping_matrix_via_preload_jit_from(
-                mapping_matrix=mapping_matrix,
-                preloaded_reals=self.preload_real_transforms,
-                preloaded_imags=self.preload_imag_transforms,
+            transformed_mapping_matrix = np.zeros(
+                (self.total_visibilities, mapping_matrix.shape[1]), dtype="complex128"
             )
 
+            for chunk in self.preload_chunks:
+
+                transformed_mapping_matrix[
+                    chunk
+                ] = transformer_util.transformed_mapping_matrix_via_preload_jit_from(
+                    mapping_matrix=mapping_matrix,
+                    preloaded_reals=self.preload_real_transforms[:, chunk],
+                    preloaded_imags=self.preload_imag_transforms[:, chunk],
+                )
+
+            return transformed_mapping_matrix
+
         else:
 
             return transformer_util.transformed_mapping_matrix_jit(
@@ -104,10 +274,39 @@ class TransformerDFT(pylops.LinearOperator):
 
 
 class TransformerNUFFT(NUFFT_cpu, pylops.LinearOperator):
-    def __init__(self, uv_wavelengths, real_space_mask):
+
+    batch_size = 100
+
+    plan_cache = OrderedDict()
+    plan_cache_size = 8
+    plan_path = None
+
+    def __init__(self, uv_wavelengths, real_space_mask, plan_path=None):
+        """
+        Performs the non-uniform fast Fourier transform (NUFFT) of real-space images to visibilities using pynufft.
+
+        The NUFFT plan (e.g. its sparse interpolation matrix) depends only on the uv-wavelengths, the real-space mask
+        and the plan's `ratio` and `interp_kernel`. Plans are therefore stored in the class attribute `plan_cache`,
+        which holds the `plan_cache_size` most recently used plans, such that transformers created for the same
+        inputs (e.g. by `Interferometer.apply_settings`) reuse the same plan.
+
+        Parameters
+        ----------
+        uv_wavelengths : np.ndarray
+            The wavelengths of the coordinates in the uv-plane of the visibilities that images are transformed to.
+        real_space_mask : Mask2D
+            The real-space mask within which the images that are Fourier transformed are computed.
+        plan_path : str or None
+            If input, plans are also stored as pickle files in this directory and loaded from it if they are not in
+            the in-memory cache, such that every process of a parallel search uses the same plan. If `None`, the
+            class attribute `plan_path` is used.
+        """
 
         super(TransformerNUFFT, self).__init__()
 
+        if plan_path is not None:
+            self.plan_path = plan_path
+
         self.uv_wavelengths = uv_wavelengths
         self.real_space_mask = real_space_mask.mask_sub_1
         #        self.grid = self.real_space_mask.unmasked_grid.in_radians
@@ -156,11 +355,84 @@ class TransformerNUFFT(NUFFT_cpu, pylops.LinearOperator):
             2.0 * self.grid.shape_native[1]
         )
 
+    def plan_cache_key_from(self, ratio, interp_kernel):
+        """
+        A hash of the uv-wavelengths, real-space mask, `ratio` and `interp_kernel`, which uniquely identifies a NUFFT
+        plan in the `plan_cache` and names the file it is stored in within `plan_path`.
+        """
+        key = hashlib.sha256()
+        key.update(np.asarray(self.uv_wavelengths, dtype="float").tobytes())
+        key.update(np.asarray(self.real_space_mask, dtype="bool").tobytes())
+        key.update(np.asarray(self.real_space_mask.shape, dtype="int").tobytes())
+        key.update(np.asarray(self.grid.pixel_scales, dtype="float").tobytes())
+        key.update(np.asarray(ratio, dtype="int").tobytes())
+        key.update(np.asarray(interp_kernel, dtype="int").tobytes())
+        return key.hexdigest()
+
     def initialize_plan(self, ratio=2, interp_kernel=(6, 6)):
+        """
+        Initializes the NUFFT plan, which is loaded from the in-memory `plan_cache` or the `plan_path` directory if a
+        plan for the same uv-wavelengths, mask, `ratio` and `interp_kernel` has been computed before.
+
+        The plan is the set of attributes pynufft's `plan` method sets on the transformer, which are shared between
+        transformers using the same plan and must therefore not be modified in-place.
+        """
 
         if not isinstance(ratio, int):
             ratio = int(ratio)
 
+        key = self.plan_cache_key_from(ratio=ratio, interp_kernel=interp_kernel)
+
+        if key in self.plan_cache:
+
+            self.plan_cache.move_to_end(key)
+
+        else:
+
+            plan_file_path = (
+                None
+                if self.plan_path is None
+                else path.join(self.plan_path, f"nufft_plan_{key}.pickle")
+            )
+
+            if plan_file_path is not None and path.exists(plan_file_path):
+
+                with open(plan_file_path, "rb") as f:
+                    plan = pickle.load(f)
+
+            else:
+
+                plan = self.plan_via_pynufft_from(
+                    ratio=ratio, interp_kernel=interp_kernel
+                )
+
+                if plan_file_path is not None:
+
+                    os.makedirs(self.plan_path, exist_ok=True)
+
+                    temporary_file_path = f"{plan_file_path}.{os.getpid()}.tmp"
+
+                    with open(temporary_file_path, "wb") as f:
+                        pickle.dump(plan, f)
+
+                    os.replace(temporary_file_path, plan_file_path)
+
+            self.plan_cache[key] = plan
+
+            while len(self.plan_cache) > self.plan_cache_size:
+                self.plan_cache.popitem(last=False)
+
+        self.__dict__.update(self.plan_cache[key])
+        self.volume = copy.deepcopy(self.volume)
+
+    def plan_via_pynufft_from(self, ratio, interp_kernel):
+        """
+        Computes the NUFFT plan using pynufft and returns it as a dictionary of the attributes its `plan` method sets
+        on the transformer.
+        """
+
+        attributes_before_plan = dict(self.__dict__)
+
         # ... NOTE : The u,v coordinated should be given in the order ...
         visibilities_normalized = np.array(
             [
@@ -181,6 +453,13 @@ class TransformerNUFFT(NUFFT_cpu, pylops.LinearOperator):
             Jd=interp_kernel,
         )
 
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in attributes_before_plan
+            or value is not attributes_before_plan[name]
+        }
+
     def visibilities_from_image(self, image):
         """
         ...
@@ -201,26 +480,70 @@ class TransformerNUFFT(NUFFT_cpu, pylops.LinearOperator):
         )
 
     def transformed_mapping_matrix_from_mapping_matrix(self, mapping_matrix):
-
-        transformed_mapping_matrix = 0 + 0j * np.zeros(
-            (self.uv_wavelengths.shape[0], mapping_matrix.shape[1])
+        """
+        Returns the NUFFT of every column of a mapping matrix, giving the complex transformed mapping matrix of
+        dimensions (total_visibilities, pixels).
+
+        The columns are transformed in batches of `batch_size`. Every batch is scattered into a native cube of shape
+        (ny, nx, batch) in one step and passed through the NUFFT plan's scaling, oversampled FFT and interpolation
+        with a trailing batch dimension, which gives the same result as calling `visibilities_from_image` on every
+        column without a separate NUFFT and `Array2D` per column.
+
+        Parameters
+        -----------
+        mapping_matrix : np.ndarray
+            The 2D mapping matrix describing how every inversion pixel maps to a pixel on the data pixel.
+        """
+        transformed_mapping_matrix = np.zeros(
+            (self.uv_wavelengths.shape[0], mapping_matrix.shape[1]), dtype="complex"
         )
 
-        for source_pixel_1d_index in range(mapping_matrix.shape[1]):
+        for source_pixel_1d_index in range(0, mapping_matrix.shape[1], self.batch_size):
 
-            image_2d = array_2d_util.array_2d_native_from(
-                array_2d_slim=mapping_matrix[:, source_pixel_1d_index],
-                mask_2d=self.grid.mask,
-                sub_size=1,
+            transformed_mapping_matrix[
+                :, source_pixel_1d_index : source_pixel_1d_index + self.batch_size
+            ] = self.forward_batch(
+                mapping_matrix[
+                    :, source_pixel_1d_index : source_pixel_1d_index + self.batch_size
+                ]
             )
 
-            image = array_2d.Array2D(array=image_2d, mask=self.grid.mask)
+        return transformed_mapping_matrix
 
-            visibilities = self.visibilities_from_image(image=image)
+    def forward_batch(self, x):
+        """
+        Forward NUFFT on CPU of a batch of 1D arrays, for example columns of a mapping matrix.
 
-            transformed_mapping_matrix[:, source_pixel_1d_index] = visibilities
+        The NUFFT plan is created for a single image (`batch=1`), therefore the scaling, oversampled FFT and
+        interpolation steps of `forward` are performed here with an additional trailing batch dimension.
 
-        return transformed_mapping_matrix
+        :param x: The input numpy array, with the size of (real_space_pixels, batch)
+        :type: numpy array
+        :return: y: The output numpy array, with the size of (M, batch)
+        :rtype: numpy array with the dtype of numpy.complex
+        """
+
+        warnings.filterwarnings("ignore")
+
+        batch = x.shape[1]
+
+        native_index_for_slim_index = (
+            self.real_space_mask._sub_native_index_for_sub_slim_index.astype("int")
+        )
+
+        x_nd = np.zeros(self.Nd + (batch,), dtype=self.dtype)
+        x_nd[native_index_for_slim_index[:, 0], native_index_for_slim_index[:, 1], :] = x
+        x_nd = x_nd[::-1, :, :]  # flip due to PyNUFFT internal flip
+
+        xx = x_nd * self.sn[:, :, None]
+
+        k = np.zeros(self.Kd + (batch,), dtype=self.dtype)
+        k.reshape(-1, batch)[self.KdCPUorder, :] = xx.reshape(-1, batch)[
+            self.NdCPUorder, :
+        ]
+        k = np.fft.fftn(k, axes=(0, 1))
+
+        return self.sp.dot(k.reshape(-1, batch))
 
     def forward_lop(self, x):
         """
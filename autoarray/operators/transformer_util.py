@@ -1,6 +1,7 @@
 from autoarray import decorator_util
 
 import numpy as np
+from numba import prange
 
 
 @decorator_util.jit()
@@ -14,8 +15,9 @@ def preload_real_transforms(
     The preloaded values are the cosine terms of every (y,x) radian coordinate on the real-space grid multiplied by
     everu `uv_wavelength` value.
 
-    For large numbers of visibilities (> 100000) this array requires large amounts of memory ( > 1 GB) and it is
-    recommended this preloading is not used.
+    For large numbers of visibilities (> 100000) this array requires large amounts of memory ( > 1 GB), therefore
+    the `TransformerDFT` computes it in chunks of visibilities and can store it in single precision or on disk as a
+    memory map.
 
     Parameters
     ----------
@@ -37,7 +39,7 @@ def preload_real_transforms(
         shape=(grid_radians.shape[0], uv_wavelengths.shape[0])
     )
 
-    for image_1d_index in range(grid_radians.shape[0]):
+    for image_1d_index in prange(grid_radians.shape[0]):
         for vis_1d_index in range(uv_wavelengths.shape[0]):
             preloaded_real_transforms[image_1d_index, vis_1d_index] += np.cos(
                 -2.0
@@ -58,7 +60,7 @@ def preload_imag_transforms(grid_radians, uv_wavelengths):
         shape=(grid_radians.shape[0], uv_wavelengths.shape[0])
     )
 
-    for image_1d_index in range(grid_radians.shape[0]):
+    for image_1d_index in prange(grid_radians.shape[0]):
         for vis_1d_index in range(uv_wavelengths.shape[0]):
             preloaded_imag_transforms[image_1d_index, vis_1d_index] += np.sin(
                 -2.0
@@ -72,6 +74,56 @@ def preload_imag_transforms(grid_radians, uv_wavelengths):
     return preloaded_imag_transforms
 
 
+@decorator_util.jit()
+def preload_transforms(grid_radians: np.ndarray, uv_wavelengths: np.ndarray):
+    """
+    Sets up the real and imaginary preloaded values used by the direct fourier transform (`TransformerDFT`), which
+    are the cosine and sine terms of every (y,x) radian coordinate on the real-space grid multiplied by every
+    `uv_wavelength` value (see `preload_real_transforms` and `preload_imag_transforms`).
+
+    The phase of every (y,x) coordinate and `uv_wavelength` is computed once and used for both terms, and the image
+    pixels are looped over in parallel if numba parallelization is enabled.
+
+    Parameters
+    ----------
+    grid_radians : np.ndarray
+        The grid in radians corresponding to real-space mask within which the image that is Fourier transformed is
+        computed.
+    uv_wavelengths : np.ndarray
+        The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is to be Fourier
+        transformed.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        The preloaded values of the cosine and sine terms of the direct Fourier transform.
+    """
+
+    preloaded_real_transforms = np.zeros(
+        shape=(grid_radians.shape[0], uv_wavelengths.shape[0])
+    )
+    preloaded_imag_transforms = np.zeros(
+        shape=(grid_radians.shape[0], uv_wavelengths.shape[0])
+    )
+
+    for image_1d_index in prange(grid_radians.shape[0]):
+        for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+            phase = (
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+
+            preloaded_real_transforms[image_1d_index, vis_1d_index] = np.cos(phase)
+            preloaded_imag_transforms[image_1d_index, vis_1d_index] = np.sin(phase)
+
+    return preloaded_real_transforms, preloaded_imag_transforms
+
+
 @decorator_util.jit()
 def visibilities_via_preload_jit_from(image_1d, preloaded_reals, preloaded_imags):
 
@@ -92,20 +144,23 @@ def visibilities_via_preload_jit_from(image_1d, preloaded_reals, preloaded_imags
 
 @decorator_util.jit()
 def visibilities_jit(image_1d, grid_radians, uv_wavelengths):
+    """
+    Returns the visibilities of an image via the direct Fourier transform, computing the phase of every (y,x)
+    coordinate and `uv_wavelength` once and using it for the real and imaginary terms.
+
+    Every visibility is independent, so they are looped over in parallel if numba parallelization is enabled.
+    """
 
     visibilities = 0 + 0j * np.zeros(shape=(uv_wavelengths.shape[0]))
 
-    for image_1d_index in range(image_1d.shape[0]):
-        for vis_1d_index in range(uv_wavelengths.shape[0]):
-            vis_real = image_1d[image_1d_index] * np.cos(
-                -2.0
-                * np.pi
-                * (
-                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
-                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
-                )
-            )
-            vis_imag = image_1d[image_1d_index] * np.sin(
+    for vis_1d_index in prange(uv_wavelengths.shape[0]):
+
+        vis_real = 0.0
+        vis_imag = 0.0
+
+        for image_1d_index in range(image_1d.shape[0]):
+
+            phase = (
                 -2.0
                 * np.pi
                 * (
@@ -113,20 +168,33 @@ def visibilities_jit(image_1d, grid_radians, uv_wavelengths):
                     + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
                 )
             )
-            visibilities[vis_1d_index] += vis_real + 1j * vis_imag
+
+            vis_real += image_1d[image_1d_index] * np.cos(phase)
+            vis_imag += image_1d[image_1d_index] * np.sin(phase)
+
+        visibilities[vis_1d_index] = vis_real + 1j * vis_imag
 
     return visibilities
 
 
 @decorator_util.jit()
 def image_from_visibilities_jit(n_pixels, grid_radians, uv_wavelengths, visibilities):
+    """
+    Returns the dirty image of visibilities via the inverse direct Fourier transform, computing the phase of every
+    (y,x) coordinate and `uv_wavelength` once and using it for the real and imaginary terms.
+
+    Every image pixel is independent, so they are looped over in parallel if numba parallelization is enabled.
+    """
 
     image_1d = np.zeros(n_pixels)
 
-    for image_1d_index in range(image_1d.shape[0]):
+    for image_1d_index in prange(image_1d.shape[0]):
+
+        value = 0.0
+
         for vis_1d_index in range(uv_wavelengths.shape[0]):
 
-            image_1d[image_1d_index] += visibilities[vis_1d_index, 0] * np.cos(
+            phase = (
                 2.0
                 * np.pi
                 * (
@@ -135,14 +203,10 @@ def image_from_visibilities_jit(n_pixels, grid_radians, uv_wavelengths, visibili
                 )
             )
 
-            image_1d[image_1d_index] -= visibilities[vis_1d_index, 1] * np.sin(
-                2.0
-                * np.pi
-                * (
-                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
-                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
-                )
-            )
+            value += visibilities[vis_1d_index, 0] * np.cos(phase)
+            value -= visibilities[vis_1d_index, 1] * np.sin(phase)
+
+        image_1d[image_1d_index] = value
 
     return image_1d
 
@@ -176,44 +240,191 @@ def transformed_mapping_matrix_via_preload_jit_from(
 
 @decorator_util.jit()
 def transformed_mapping_matrix_jit(mapping_matrix, grid_radians, uv_wavelengths):
+    """
+    Returns the transformed mapping matrix via the direct Fourier transform of every column of the mapping matrix.
+
+    The non-zero entries of every row of the mapping matrix are first gathered in compressed sparse row (CSR) form,
+    such that the transform only loops over the pixelization pixels each image pixel maps to. The phase of every
+    (y,x) coordinate and `uv_wavelength` is computed once and its cosine and sine are used for all of these
+    pixelization pixels, as opposed to recomputing them for every pixelization pixel. Every visibility is
+    independent, so they are looped over in parallel if numba parallelization is enabled.
+    """
+
+    image_pixels = mapping_matrix.shape[0]
+
+    row_offsets = np.zeros(image_pixels + 1, dtype=np.int64)
+
+    for image_1d_index in range(image_pixels):
+        row_offsets[image_1d_index + 1] = row_offsets[image_1d_index]
+        for pixel_1d_index in range(mapping_matrix.shape[1]):
+            if mapping_matrix[image_1d_index, pixel_1d_index] > 0:
+                row_offsets[image_1d_index + 1] += 1
+
+    row_pixel_indexes = np.zeros(row_offsets[image_pixels], dtype=np.int64)
+    row_values = np.zeros(row_offsets[image_pixels])
+
+    for image_1d_index in range(image_pixels):
+        row_index = row_offsets[image_1d_index]
+        for pixel_1d_index in range(mapping_matrix.shape[1]):
+            value = mapping_matrix[image_1d_index, pixel_1d_index]
+            if value > 0:
+                row_pixel_indexes[row_index] = pixel_1d_index
+                row_values[row_index] = value
+                row_index += 1
 
     transfomed_mapping_matrix = 0 + 0j * np.zeros(
         (uv_wavelengths.shape[0], mapping_matrix.shape[1])
     )
 
-    for pixel_1d_index in range(mapping_matrix.shape[1]):
-        for image_1d_index in range(mapping_matrix.shape[0]):
+    for vis_1d_index in prange(uv_wavelengths.shape[0]):
 
-            value = mapping_matrix[image_1d_index, pixel_1d_index]
+        for image_1d_index in range(image_pixels):
 
-            if value > 0:
+            phase = (
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
 
-                for vis_1d_index in range(uv_wavelengths.shape[0]):
-
-                    vis_real = value * np.cos(
-                        -2.0
-                        * np.pi
-                        * (
-                            grid_radians[image_1d_index, 1]
-                            * uv_wavelengths[vis_1d_index, 0]
-                            + grid_radians[image_1d_index, 0]
-                            * uv_wavelengths[vis_1d_index, 1]
-                        )
-                    )
+            cos_phase = np.cos(phase)
+            sin_phase = np.sin(phase)
 
-                    vis_imag = value * np.sin(
-                        -2.0
-                        * np.pi
-                        * (
-                            grid_radians[image_1d_index, 1]
-                            * uv_wavelengths[vis_1d_index, 0]
-                            + grid_radians[image_1d_index, 0]
-                            * uv_wavelengths[vis_1d_index, 1]
-                        )
-                    )
+            for row_index in range(
+                row_offsets[image_1d_index], row_offsets[image_1d_index + 1]
+            ):
 
-                    transfomed_mapping_matrix[vis_1d_index, pixel_1d_index] += (
-                        vis_real + 1j * vis_imag
-                    )
+                value = row_values[row_index]
+
+                transfomed_mapping_matrix[
+                    vis_1d_index, row_pixel_indexes[row_index]
+                ] += (value * cos_phase + 1j * (value * sin_phase))
 
     return transfomed_mapping_matrix
+
+
+def w_tilde_curvature_interferometer_from(
+    noise_map_real: np.ndarray,
+    noise_map_imag: np.ndarray,
+    uv_wavelengths: np.ndarray,
+    grid_radians: np.ndarray,
+    chunk_size: int = 10000,
+) -> np.ndarray:
+    """
+    The matrix w_tilde is a matrix of dimensions [image_pixels, image_pixels] that encodes the NUFFT of every pair of
+    image pixels given the noise map. This can be used to efficiently compute the curvature matrix via the mappings
+    between image and source pixels, in a way that omits having to perform the NUFFT on every individual source pixel.
+    This provides a significant speed up for inversions of interferometer datasets with large number of visibilities.
+
+    For large masks the dimensions of [image_pixels, image_pixels] can exceed many GB's, therefore
+    `Interferometer.w_tilde` allows it to be stored on disk and loaded as a memory map.
+
+    For a noise-map with the same real and imaginary values the entries are:
+
+        w_tilde_ij = sum_k cos(2 pi (x_i - x_j) . u_k) / sigma_k^2
+
+    In general this is the sum of the real and imaginary curvature terms of the direct Fourier transform, which is
+    computed in chunks of `chunk_size` visibilities using matrix multiplications, such that the memory used does not
+    depend on the number of visibilities.
+
+    Parameters
+    ----------
+    noise_map_real : np.ndarray
+        The real noise-map values of the interferometer data.
+    noise_map_imag : np.ndarray
+        The imaginary noise-map values of the interferometer data.
+    uv_wavelengths : np.ndarray
+        The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is to be Fourier
+        transformed.
+    grid_radians : np.ndarray
+        The 1D (y,x) grid of coordinates in radians corresponding to real-space mask within which the image that is
+        Fourier transformed is computed.
+    chunk_size : int
+        The number of visibilities whose Fourier transforms are computed and stored in memory at once.
+
+    Returns
+    -------
+    np.ndarray
+        A matrix that encodes the NUFFT values between the noise map that enables efficient calculation of the
+        curvature matrix.
+    """
+
+    w_tilde = np.zeros((grid_radians.shape[0], grid_radians.shape[0]))
+
+    for vis_1d_index in range(0, uv_wavelengths.shape[0], chunk_size):
+
+        chunk = slice(vis_1d_index, vis_1d_index + chunk_size)
+
+        phases = -2.0 * np.pi * np.outer(grid_radians[:, 1], uv_wavelengths[chunk, 0])
+        phases -= 2.0 * np.pi * np.outer(grid_radians[:, 0], uv_wavelengths[chunk, 1])
+
+        weighted_reals = np.cos(phases) / noise_map_real[chunk]
+        weighted_imags = np.sin(phases) / noise_map_imag[chunk]
+
+        w_tilde += weighted_reals @ weighted_reals.T
+        w_tilde += weighted_imags @ weighted_imags.T
+
+    return w_tilde
+
+
+def w_tilde_data_interferometer_from(
+    visibilities_real: np.ndarray,
+    visibilities_imag: np.ndarray,
+    noise_map_real: np.ndarray,
+    noise_map_imag: np.ndarray,
+    uv_wavelengths: np.ndarray,
+    grid_radians: np.ndarray,
+    chunk_size: int = 10000,
+) -> np.ndarray:
+    """
+    The vector w_tilde_data is the noise-weighted dirty image of the visibilities, which is used with `w_tilde` to
+    compute the data vector of an inversion via the mappings between image and source pixels, without performing the
+    NUFFT on every individual source pixel.
+
+    The visibilities are transformed in chunks of `chunk_size` visibilities using matrix multiplications, such that
+    the memory used does not depend on the number of visibilities.
+
+    Parameters
+    ----------
+    visibilities_real : np.ndarray
+        The real visibility values of the interferometer data.
+    visibilities_imag : np.ndarray
+        The imaginary visibility values of the interferometer data.
+    noise_map_real : np.ndarray
+        The real noise-map values of the interferometer data.
+    noise_map_imag : np.ndarray
+        The imaginary noise-map values of the interferometer data.
+    uv_wavelengths : np.ndarray
+        The wavelengths of the coordinates in the uv-plane for the interferometer dataset that is to be Fourier
+        transformed.
+    grid_radians : np.ndarray
+        The 1D (y,x) grid of coordinates in radians corresponding to real-space mask within which the image that is
+        Fourier transformed is computed.
+    chunk_size : int
+        The number of visibilities whose Fourier transforms are computed and stored in memory at once.
+
+    Returns
+    -------
+    np.ndarray
+        The noise-weighted dirty image, which gives the data vector when multiplied by the mapping matrix.
+    """
+
+    w_tilde_data = np.zeros(grid_radians.shape[0])
+
+    for vis_1d_index in range(0, uv_wavelengths.shape[0], chunk_size):
+
+        chunk = slice(vis_1d_index, vis_1d_index + chunk_size)
+
+        phases = -2.0 * np.pi * np.outer(grid_radians[:, 1], uv_wavelengths[chunk, 0])
+        phases -= 2.0 * np.pi * np.outer(grid_radians[:, 0], uv_wavelengths[chunk, 1])
+
+        w_tilde_data += np.cos(phases) @ (
+            visibilities_real[chunk] / noise_map_real[chunk] ** 2.0
+        )
+        w_tilde_data += np.sin(phases) @ (
+            visibilities_imag[chunk] / noise_map_imag[chunk] ** 2.0
+        )
+
+    return w_tilde_data
@@ -6,6 +6,7 @@ class Preloads:
         blurred_mapping_matrix=None,
         curvature_matrix_sparse_preload=None,
         curvature_matrix_preload_counts=None,
+        curvature_matrix_outer_products=None,
     ):
 
         self.sparse_grids_of_planes = sparse_grids_of_planes
@@ -13,3 +14,4 @@ class Preloads:
         self.blurred_mapping_matrix = blurred_mapping_matrix
         self.curvature_matrix_sparse_preload = curvature_matrix_sparse_preload
         self.curvature_matrix_preload_counts = curvature_matrix_preload_counts
+        self.curvature_matrix_outer_products = curvature_matrix_outer_products
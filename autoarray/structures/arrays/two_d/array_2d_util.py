@@ -1,5 +1,8 @@
+import hashlib
 import inspect
 import os
+import sys
+from collections import OrderedDict
 
 from autoconf import conf
 from autoarray import decorator_util
@@ -10,24 +13,52 @@ from functools import wraps
 
 
 class Memoizer:
-    def __init__(self):
+
+    # The maximum total size in bytes of the results stored by each memoizer, beyond which the least recently used
+    # results are evicted. Can be overwritten for a given memoizer via the `max_bytes` input.
+    max_bytes = 2 ** 28
+
+    def __init__(self, max_bytes=None):
         """
         Class to store the results of a function given a set of inputs.
+
+        Results are keyed on a content hash of the inputs (see `cache_key_from`) and stored in a least recently used
+        (LRU) cache, whose total size is bounded by `max_bytes`.
+
+        Parameters
+        ----------
+        max_bytes : int or None
+            The maximum total size in bytes of the stored results. If `None`, the class attribute `max_bytes` is used.
+        """
+        self.results = OrderedDict()
+        self.result_bytes = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.signature = None
+
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+
+    @property
+    def calls(self) -> int:
         """
-        self.results = {}
-        self.calls = 0
-        self.arg_names = None
+        The number of times the memoized function has been called, which is the number of cache misses.
+        """
+        return self.misses
 
     def __call__(self, func):
         """
         Memoize decorator. Any time a function is called that a memoizer has been attached to its results are stored in
-        the results dictionary or retrieved from the dictionary if the function has aaready been called with those
+        the results dictionary or retrieved from the dictionary if the function has already been called with the same
         arguments.
 
-        Note that the same memoizer persists over all instances of a class. Any state for a given instance that is not
-        given in the representation of that instance will be ignored. That is, it is possible that the memoizer will
-        give incorrect results if instance state does not affect __str__ but does affect the value returned by the
-        memoized method.
+        Array inputs (e.g. a `Mask2D` as the `self` of a memoized method) are keyed on their data buffer, dtype and
+        shape and on the attributes in their `__dict__` (e.g. the `sub_size`, `pixel_scales` and `origin` of a mask),
+        such that any two arrays with the same contents and attributes share the stored result.
+
+        Array results are returned as copies of the stored result, such that a caller which edits the returned array
+        in-place does not change the result returned to subsequent callers.
 
         Parameters
         ----------
@@ -39,26 +70,131 @@ class Memoizer:
         decorated : function
             A function that memoizes results
         """
-        if self.arg_names is not None:
+        if self.signature is not None:
             raise AssertionError("Instantiate a new Memoizer for each function")
-        self.arg_names = inspect.getfullargspec(func).args
+        self.signature = inspect.signature(func)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            key = ", ".join(
-                [
-                    "('{}', {})".format(arg_name, arg)
-                    for arg_name, arg in list(zip(self.arg_names, args))
-                    + [(k, v) for k, v in kwargs.items()]
-                ]
-            )
-            if key not in self.results:
-                self.calls += 1
-            self.results[key] = func(*args, **kwargs)
-            return self.results[key]
+
+            key = self.cache_key_from(*args, **kwargs)
+
+            if key in self.results:
+                self.hits += 1
+                self.results.move_to_end(key)
+                return copy_of_value(value=self.results[key])
+
+            self.misses += 1
+
+            result = func(*args, **kwargs)
+
+            self.add_result(key=key, result=result)
+
+            return copy_of_value(value=result)
 
         return wrapper
 
+    def cache_key_from(self, *args, **kwargs) -> str:
+        """
+        Returns the key of the memoized function's result for a set of inputs, which is a hash of every named
+        argument (including defaults) and its value (see `update_hash_from_value`).
+        """
+        arguments = self.signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+
+        hasher = hashlib.blake2b(digest_size=16)
+
+        for name, value in arguments.arguments.items():
+            hasher.update(name.encode())
+            update_hash_from_value(hasher=hasher, value=value)
+
+        return hasher.hexdigest()
+
+    def add_result(self, key: str, result):
+        """
+        Store the result of the memoized function, evicting the least recently used results until the total size of
+        the stored results is within `max_bytes`. A result larger than `max_bytes` is not stored.
+        """
+        result_bytes = bytes_of_value(value=result)
+
+        if result_bytes > self.max_bytes:
+            return
+
+        self.results[key] = result
+        self.result_bytes[key] = result_bytes
+        self.total_bytes += result_bytes
+
+        while self.total_bytes > self.max_bytes:
+            evicted_key, _ = self.results.popitem(last=False)
+            self.total_bytes -= self.result_bytes.pop(evicted_key)
+
+    def clear(self):
+        """
+        Remove every stored result and reset the hit and miss counters.
+        """
+        self.results.clear()
+        self.result_bytes.clear()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+def update_hash_from_value(hasher, value):
+    """
+    Update a hash with the value of an input of a memoized function.
+
+    NumPy arrays are hashed via their type, dtype, shape and data buffer, followed by every public attribute in their
+    `__dict__` (for example the `sub_size`, `pixel_scales` and `origin` of a `Mask2D` or the `mask` of a `Grid2D`).
+    Private attributes (e.g. cached quantities derived from the array) are omitted. All other values are hashed via
+    their `repr`.
+
+    Parameters
+    ----------
+    hasher
+        The `hashlib` hash object which is updated.
+    value
+        The value of the input that is hashed.
+    """
+    if isinstance(value, np.ndarray):
+
+        hasher.update(
+            "{}{}{}".format(type(value).__name__, value.dtype, value.shape).encode()
+        )
+        hasher.update(np.ascontiguousarray(value).view(np.uint8))
+
+        for name, attribute in sorted(getattr(value, "__dict__", {}).items()):
+            if not name.startswith("_"):
+                hasher.update(name.encode())
+                update_hash_from_value(hasher=hasher, value=attribute)
+
+    else:
+
+        hasher.update(repr(value).encode())
+
+
+def bytes_of_value(value) -> int:
+    """
+    Returns the size in bytes of a result stored by a `Memoizer`, which for NumPy arrays (and tuples or lists of
+    arrays) is their `nbytes`.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(bytes_of_value(value=entry) for entry in value)
+    return sys.getsizeof(value)
+
+
+def copy_of_value(value):
+    """
+    Returns a copy of a result stored by a `Memoizer`, which for NumPy arrays (and tuples or lists of arrays) is a copy
+    of every array, such that the stored result cannot be edited in-place by the caller it is returned to.
+    """
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, (tuple, list)):
+        return type(value)(copy_of_value(value=entry) for entry in value)
+    return value
+
 
 @decorator_util.jit()
 def extracted_array_2d_from(
@@ -364,6 +364,31 @@ class AbstractGrid2D(abstract_structure.AbstractStructure2D):
         """
         return self[self.mask._sub_border_flat_indexes]
 
+    @property
+    def sub_border_kd_tree(self):
+        """
+        The k-d tree of the `sub_border_grid` (see `grid_2d_util.kd_tree_2d_from`), which is used to find the nearest
+        border pixel of every coordinate that is relocated to the border.
+
+        The tree is stored in the mask's index bundle (see `Mask2DIndexes`), such that it is computed once for every
+        grid sharing the mask. It is recomputed if the border grid differs from the one the stored tree was built for.
+        """
+        sub_border_grid = np.asarray(self.sub_border_grid)
+
+        border_grid, kd_tree_indexes, kd_tree_bounds = self.mask.indexes.entry_from(
+            name="sub_border_kd_tree",
+            mask=self.mask,
+            func=lambda: (
+                sub_border_grid,
+                *grid_2d_util.kd_tree_2d_from(grid_2d_slim=sub_border_grid),
+            ),
+        )
+
+        if np.array_equal(border_grid, sub_border_grid):
+            return kd_tree_indexes, kd_tree_bounds
+
+        return grid_2d_util.kd_tree_2d_from(grid_2d_slim=sub_border_grid)
+
     def relocated_grid_from_grid(self, grid):
         """
         Relocate the coordinates of a grid to the border of this grid if they are outside the border, where the
@@ -373,7 +398,7 @@ class AbstractGrid2D(abstract_structure.AbstractStructure2D):
 
         1) Use the mean value of the grid's y and x coordinates to determine the origin of the grid.
         2) Compute the radial distance of every grid coordinate from the origin.
-        3) For every coordinate, find its nearest pixel in the border.
+        3) For every coordinate, find its nearest pixel in the border (via the k-d tree `sub_border_kd_tree`).
         4) Determine if it is outside the border, by comparing its radial distance from the origin to its paired \
            border pixel's radial distance.
         5) If its radial distance is larger, use the ratio of radial distances to move the coordinate to the border \
@@ -391,9 +416,14 @@ class AbstractGrid2D(abstract_structure.AbstractStructure2D):
         if len(self.sub_border_grid) == 0:
             return grid
 
+        kd_tree_indexes, kd_tree_bounds = self.sub_border_kd_tree
+
         return grid_2d.Grid2D(
-            grid=self.relocated_grid_from_grid_jit(
-                grid=grid, border_grid=self.sub_border_grid
+            grid=grid_2d_util.relocated_grid_via_kd_tree_from(
+                grid=grid,
+                border_grid=self.sub_border_grid,
+                kd_tree_indexes=kd_tree_indexes,
+                kd_tree_bounds=kd_tree_bounds,
             ),
             mask=grid.mask,
             sub_size=grid.mask.sub_size,
@@ -416,9 +446,14 @@ class AbstractGrid2D(abstract_structure.AbstractStructure2D):
         if len(self.sub_border_grid) == 0:
             return pixelization_grid
 
+        kd_tree_indexes, kd_tree_bounds = self.sub_border_kd_tree
+
         return grid_2d.Grid2DSparse(
-            grid=self.relocated_grid_from_grid_jit(
-                grid=pixelization_grid, border_grid=self.sub_border_grid
+            grid=grid_2d_util.relocated_grid_via_kd_tree_from(
+                grid=pixelization_grid,
+                border_grid=self.sub_border_grid,
+                kd_tree_indexes=kd_tree_indexes,
+                kd_tree_bounds=kd_tree_bounds,
             ),
             sparse_index_for_slim_index=pixelization_grid.sparse_index_for_slim_index,
         )
@@ -1,5 +1,6 @@
 from autoarray import decorator_util
 import numpy as np
+from numba import prange
 
 from autoarray.mask import mask_2d_util
 from autoarray.geometry import geometry_util
@@ -843,3 +844,290 @@ def grid_2d_of_points_within_radius(
             x_inside.append(grid_2d[i, 1])
 
     return np.asarray(y_inside, x_inside)
+
+
+@decorator_util.jit()
+def kd_tree_2d_from(grid_2d_slim: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    Returns a 2D k-d tree of a slim grid of (y,x) coordinates, which is used to find the nearest coordinate of the
+    grid to an input (y,x) coordinate (see `kd_tree_2d_nearest_index_from`) in O(log(N)) operations, as opposed to the
+    O(N) operations of a brute force search.
+
+    The tree is stored implicitly in two arrays: every range [lo, hi) of `kd_tree_indexes` is a node of the tree,
+    whose median entry `mid = (lo + hi) // 2` is the grid index of the node's splitting coordinate, with the entries
+    [lo, mid) and [mid + 1, hi) forming its two child nodes. Every node is split along the dimension in which its
+    coordinates have the largest spread, and the bounding box [y_min, y_max, x_min, x_max] of its coordinates is
+    stored in `kd_tree_bounds[mid]`.
+
+    Parameters
+    ----------
+    grid_2d_slim : np.ndarray
+        The slim grid of (y,x) coordinates the k-d tree is built for.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        The grid indexes of every node of the k-d tree and the bounding box of every node.
+    """
+    total_coordinates = grid_2d_slim.shape[0]
+
+    kd_tree_indexes = np.arange(total_coordinates)
+    kd_tree_bounds = np.zeros((total_coordinates, 4))
+
+    stack = np.zeros((128, 2), dtype=np.int64)
+    stack[0, 1] = total_coordinates
+    stack_size = 1
+
+    while stack_size > 0:
+
+        stack_size -= 1
+        lo = stack[stack_size, 0]
+        hi = stack[stack_size, 1]
+
+        if hi <= lo:
+            continue
+
+        node_indexes = kd_tree_indexes[lo:hi].copy()
+
+        y_min = np.min(grid_2d_slim[node_indexes, 0])
+        y_max = np.max(grid_2d_slim[node_indexes, 0])
+        x_min = np.min(grid_2d_slim[node_indexes, 1])
+        x_max = np.max(grid_2d_slim[node_indexes, 1])
+
+        split_dim = 0 if (y_max - y_min) >= (x_max - x_min) else 1
+
+        order = np.argsort(grid_2d_slim[node_indexes, split_dim], kind="mergesort")
+        kd_tree_indexes[lo:hi] = node_indexes[order]
+
+        mid = (lo + hi) // 2
+
+        kd_tree_bounds[mid, 0] = y_min
+        kd_tree_bounds[mid, 1] = y_max
+        kd_tree_bounds[mid, 2] = x_min
+        kd_tree_bounds[mid, 3] = x_max
+
+        stack[stack_size, 0] = lo
+        stack[stack_size, 1] = mid
+        stack[stack_size + 1, 0] = mid + 1
+        stack[stack_size + 1, 1] = hi
+        stack_size += 2
+
+    return kd_tree_indexes, kd_tree_bounds
+
+
+@decorator_util.jit()
+def kd_tree_2d_node_distance_from(
+    kd_tree_bounds: np.ndarray,
+    lo: int,
+    hi: int,
+    coordinate_y: float,
+    coordinate_x: float,
+) -> float:
+    """
+    Returns the squared distance of a (y,x) coordinate from the bounding box of the k-d tree node [lo, hi), which is
+    a lower limit on its squared distance from every grid coordinate in the node (and infinity for an empty node).
+    """
+    if hi <= lo:
+        return np.inf
+
+    mid = (lo + hi) // 2
+
+    offset_y = max(
+        kd_tree_bounds[mid, 0] - coordinate_y, coordinate_y - kd_tree_bounds[mid, 1], 0.0
+    )
+    offset_x = max(
+        kd_tree_bounds[mid, 2] - coordinate_x, coordinate_x - kd_tree_bounds[mid, 3], 0.0
+    )
+
+    return offset_y ** 2 + offset_x ** 2
+
+
+@decorator_util.jit()
+def kd_tree_2d_nearest_index_from(
+    grid_2d_slim: np.ndarray,
+    kd_tree_indexes: np.ndarray,
+    kd_tree_bounds: np.ndarray,
+    coordinate_y: float,
+    coordinate_x: float,
+    stack_ranges: np.ndarray,
+    stack_distances: np.ndarray,
+) -> int:
+    """
+    Returns the index of the coordinate of a slim grid which is nearest to an input (y,x) coordinate, using the
+    k-d tree of the grid computed via `kd_tree_2d_from`.
+
+    Nodes are searched nearest first and a node is skipped if its bounding box is further from the coordinate than
+    the nearest grid coordinate found so far. The search is exact and, if several grid coordinates are at the same
+    (nearest) distance, returns the lowest index of these, such that the result is identical to `np.argmin` over the
+    squared distances of every coordinate.
+
+    Parameters
+    ----------
+    grid_2d_slim : np.ndarray
+        The slim grid of (y,x) coordinates the k-d tree is built for.
+    kd_tree_indexes : np.ndarray
+        The grid indexes of every node of the k-d tree.
+    kd_tree_bounds : np.ndarray
+        The bounding box of every node of the k-d tree.
+    coordinate_y : float
+        The y coordinate whose nearest grid coordinate is found.
+    coordinate_x : float
+        The x coordinate whose nearest grid coordinate is found.
+    stack_ranges : np.ndarray
+        An int array of shape [128, 2] used as the stack of the tree nodes which are searched, which is passed in so
+        that it is not reallocated for every search.
+    stack_distances : np.ndarray
+        A float array of shape [128] used as the stack of the squared distances of the input coordinate from the
+        bounding box of every tree node on the stack.
+    """
+    best_distance = np.inf
+    best_index = -1
+
+    stack_ranges[0, 0] = 0
+    stack_ranges[0, 1] = kd_tree_indexes.shape[0]
+    stack_distances[0] = 0.0
+    stack_size = 1
+
+    while stack_size > 0:
+
+        stack_size -= 1
+        lo = stack_ranges[stack_size, 0]
+        hi = stack_ranges[stack_size, 1]
+
+        if hi <= lo or stack_distances[stack_size] > best_distance:
+            continue
+
+        mid = (lo + hi) // 2
+        index = kd_tree_indexes[mid]
+
+        distance = (coordinate_y - grid_2d_slim[index, 0]) ** 2 + (
+            coordinate_x - grid_2d_slim[index, 1]
+        ) ** 2
+
+        if distance < best_distance or (
+            distance == best_distance and index < best_index
+        ):
+            best_distance = distance
+            best_index = index
+
+        distance_lower = kd_tree_2d_node_distance_from(
+            kd_tree_bounds=kd_tree_bounds,
+            lo=lo,
+            hi=mid,
+            coordinate_y=coordinate_y,
+            coordinate_x=coordinate_x,
+        )
+        distance_upper = kd_tree_2d_node_distance_from(
+            kd_tree_bounds=kd_tree_bounds,
+            lo=mid + 1,
+            hi=hi,
+            coordinate_y=coordinate_y,
+            coordinate_x=coordinate_x,
+        )
+
+        if distance_lower <= distance_upper:
+            near_lo, near_hi, near_distance = lo, mid, distance_lower
+            far_lo, far_hi, far_distance = mid + 1, hi, distance_upper
+        else:
+            near_lo, near_hi, near_distance = mid + 1, hi, distance_upper
+            far_lo, far_hi, far_distance = lo, mid, distance_lower
+
+        if far_distance <= best_distance:
+            stack_ranges[stack_size, 0] = far_lo
+            stack_ranges[stack_size, 1] = far_hi
+            stack_distances[stack_size] = far_distance
+            stack_size += 1
+
+        if near_distance <= best_distance:
+            stack_ranges[stack_size, 0] = near_lo
+            stack_ranges[stack_size, 1] = near_hi
+            stack_distances[stack_size] = near_distance
+            stack_size += 1
+
+    return best_index
+
+
+@decorator_util.jit()
+def relocated_grid_via_kd_tree_from(
+    grid: np.ndarray,
+    border_grid: np.ndarray,
+    kd_tree_indexes: np.ndarray,
+    kd_tree_bounds: np.ndarray,
+) -> np.ndarray:
+    """
+    Relocate the coordinates of a grid to its border if they are outside the border, where the border is
+    defined as all pixels at the edge of the grid's mask (see *mask._border_1d_indexes*).
+
+    This gives the same result as `AbstractGrid2D.relocated_grid_from_grid_jit`, but the nearest border pixel of every
+    coordinate is found via a k-d tree of the border grid (see `kd_tree_2d_from`) instead of a brute force search over
+    every border pixel, and the loop over coordinates is parallelized over chunks of 1024 coordinates.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The grid (uniform or irregular) whose pixels are to be relocated to the border edge if outside it.
+    border_grid : np.ndarray
+        The grid of border (y,x) coordinates.
+    kd_tree_indexes : np.ndarray
+        The grid indexes of every node of the k-d tree of the border grid.
+    kd_tree_bounds : np.ndarray
+        The bounding box of every node of the k-d tree of the border grid.
+    """
+
+    grid_relocated = np.zeros(grid.shape)
+    grid_relocated[:, :] = grid[:, :]
+
+    border_origin = np.zeros(2)
+    border_origin[0] = np.mean(border_grid[:, 0])
+    border_origin[1] = np.mean(border_grid[:, 1])
+    border_grid_radii = np.sqrt(
+        np.add(
+            np.square(np.subtract(border_grid[:, 0], border_origin[0])),
+            np.square(np.subtract(border_grid[:, 1], border_origin[1])),
+        )
+    )
+    border_min_radii = np.min(border_grid_radii)
+
+    grid_radii = np.sqrt(
+        np.add(
+            np.square(np.subtract(grid[:, 0], border_origin[0])),
+            np.square(np.subtract(grid[:, 1], border_origin[1])),
+        )
+    )
+
+    chunk_size = 1024
+    total_chunks = (grid.shape[0] + chunk_size - 1) // chunk_size
+
+    for chunk_index in prange(total_chunks):
+
+        stack_ranges = np.zeros((128, 2), dtype=np.int64)
+        stack_distances = np.zeros(128)
+
+        for pixel_index in range(
+            chunk_index * chunk_size, min((chunk_index + 1) * chunk_size, grid.shape[0])
+        ):
+
+            if grid_radii[pixel_index] > border_min_radii:
+
+                closest_pixel_index = kd_tree_2d_nearest_index_from(
+                    grid_2d_slim=border_grid,
+                    kd_tree_indexes=kd_tree_indexes,
+                    kd_tree_bounds=kd_tree_bounds,
+                    coordinate_y=grid[pixel_index, 0],
+                    coordinate_x=grid[pixel_index, 1],
+                    stack_ranges=stack_ranges,
+                    stack_distances=stack_distances,
+                )
+
+                move_factor = (
+                    border_grid_radii[closest_pixel_index] / grid_radii[pixel_index]
+                )
+
+                if move_factor < 1.0:
+
+                    grid_relocated[pixel_index, :] = (
+                        move_factor * (grid[pixel_index, :] - border_origin[:])
+                        + border_origin[:]
+                    )
+
+    return grid_relocated
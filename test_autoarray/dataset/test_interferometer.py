@@ -248,6 +248,180 @@ class TestInterferometer:
 
         assert interferometer_7.noise_map[0] == 10.0 + 20.0j
 
+    def test__w_tilde__same_as_curvature_matrix_of_transformed_identity_mapping(
+        self, visibilities_7, uv_wavelengths_7x2, sub_mask_2d_7x7
+    ):
+
+        noise_map = aa.VisibilitiesNoiseMap.manual_slim(
+            visibilities=[
+                1.0 + 2.0j,
+                2.0 + 1.0j,
+                1.0 + 1.0j,
+                3.0 + 2.0j,
+                1.0 + 3.0j,
+                2.0 + 2.0j,
+                1.0 + 1.0j,
+            ]
+        )
+
+        interferometer = aa.Interferometer(
+            visibilities=visibilities_7,
+            noise_map=noise_map,
+            uv_wavelengths=uv_wavelengths_7x2,
+            real_space_mask=sub_mask_2d_7x7,
+            settings=aa.SettingsInterferometer(
+                transformer_class=transformer.TransformerDFT
+            ),
+        )
+
+        identity_mapping_matrix = np.eye(sub_mask_2d_7x7.pixels_in_mask)
+
+        transformed_mapping_matrix = interferometer.transformer.transformed_mapping_matrix_from_mapping_matrix(
+            mapping_matrix=identity_mapping_matrix
+        )
+
+        curvature_matrix = aa.util.inversion.curvature_matrix_via_mapping_matrix_from(
+            mapping_matrix=transformed_mapping_matrix.real, noise_map=noise_map.real
+        ) + aa.util.inversion.curvature_matrix_via_mapping_matrix_from(
+            mapping_matrix=transformed_mapping_matrix.imag, noise_map=noise_map.imag
+        )
+
+        data_vector = aa.util.inversion.data_vector_via_transformed_mapping_matrix_from(
+            transformed_mapping_matrix=transformed_mapping_matrix,
+            visibilities=visibilities_7,
+            noise_map=noise_map,
+        )
+
+        assert interferometer.w_tilde.curvature_preload == pytest.approx(
+            curvature_matrix, 1.0e-8
+        )
+        assert interferometer.w_tilde.dirty_image == pytest.approx(data_vector, 1.0e-8)
+
+        w_tilde = aa.util.transformer.w_tilde_curvature_interferometer_from(
+            noise_map_real=np.asarray(noise_map.real),
+            noise_map_imag=np.asarray(noise_map.imag),
+            uv_wavelengths=uv_wavelengths_7x2,
+            grid_radians=np.asarray(interferometer.w_tilde_grid_radians),
+            chunk_size=3,
+        )
+
+        assert w_tilde == pytest.approx(curvature_matrix, 1.0e-8)
+
+    def test__w_tilde__cache_path__stored_and_loaded_as_memory_map(
+        self, visibilities_7, visibilities_noise_map_7, uv_wavelengths_7x2, sub_mask_2d_7x7
+    ):
+
+        cache_path = path.join(test_data_dir, "w_tilde_cache")
+
+        if path.exists(cache_path):
+            shutil.rmtree(cache_path)
+
+        interferometer = aa.Interferometer(
+            visibilities=visibilities_7,
+            noise_map=visibilities_noise_map_7,
+            uv_wavelengths=uv_wavelengths_7x2,
+            real_space_mask=sub_mask_2d_7x7,
+            settings=aa.SettingsInterferometer(
+                transformer_class=transformer.TransformerDFT
+            ),
+        )
+
+        interferometer_cached = interferometer.apply_settings(
+            settings=aa.SettingsInterferometer(
+                transformer_class=transformer.TransformerDFT,
+                w_tilde_cache_path=cache_path,
+            )
+        )
+
+        assert isinstance(interferometer.w_tilde.curvature_preload, np.ndarray)
+        assert isinstance(interferometer_cached.w_tilde.curvature_preload, np.memmap)
+        assert path.exists(
+            path.join(
+                cache_path, f"w_tilde_{interferometer_cached.w_tilde_cache_key}.npy"
+            )
+        )
+        assert (
+            interferometer_cached.w_tilde.curvature_preload
+            == interferometer.w_tilde.curvature_preload
+        ).all()
+
+        interferometer_cached = interferometer_cached.modified_visibilities_from_visibilities(
+            visibilities=2.0 * visibilities_7
+        )
+
+        assert isinstance(interferometer_cached.w_tilde.curvature_preload, np.memmap)
+        assert interferometer_cached.w_tilde.dirty_image == pytest.approx(
+            2.0 * interferometer.w_tilde.dirty_image, 1.0e-8
+        )
+
+        shutil.rmtree(cache_path)
+
+    def test__binned_via_uv_grid__model_visibilities_within_smearing_bound(
+        self, sub_mask_2d_7x7
+    ):
+
+        uv_wavelengths = np.random.RandomState(seed=1).uniform(
+            low=-1.0e4, high=1.0e4, size=(200, 2)
+        )
+
+        interferometer = aa.Interferometer(
+            visibilities=aa.Visibilities.ones(shape_slim=(200,)),
+            noise_map=aa.VisibilitiesNoiseMap.ones(shape_slim=(200,)),
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=sub_mask_2d_7x7,
+            settings=aa.SettingsInterferometer(
+                transformer_class=transformer.TransformerDFT
+            ),
+        )
+
+        interferometer_binned = interferometer.binned_via_uv_grid_from(
+            smearing_bound=0.05
+        )
+
+        assert interferometer_binned.visibilities.shape[0] < 200
+        assert interferometer_binned.visibilities == pytest.approx(
+            1.0 + 1.0j * np.ones(interferometer_binned.visibilities.shape[0]), 1.0e-4
+        )
+        assert np.sum(
+            np.abs(interferometer_binned.noise_map.real) ** -2.0
+        ) == pytest.approx(200.0, 1.0e-4)
+
+        uv_cell_size = aa.preprocess.uv_cell_size_from_smearing_bound(
+            smearing_bound=0.05, max_radius_radians=interferometer.max_radius_radians
+        )
+
+        smearing_bound = interferometer.uv_smearing_bound_via_uv_grid_from(
+            uv_cell_size=uv_cell_size
+        )
+
+        assert (smearing_bound <= 0.05).all()
+
+        image = aa.Array2D.manual_mask(
+            array=np.arange(1.0, 10.0), mask=sub_mask_2d_7x7.mask_sub_1
+        )
+
+        model_visibilities = interferometer.transformer.visibilities_from_image(
+            image=image
+        )
+
+        model_visibilities_binned, _, _ = aa.preprocess.visibilities_binned_from(
+            visibilities=model_visibilities,
+            noise_map=interferometer.noise_map,
+            uv_wavelengths=uv_wavelengths,
+            bin_indexes=interferometer.uv_grid_bin_indexes_from(
+                uv_cell_size=uv_cell_size
+            ),
+        )
+
+        model_visibilities_at_bins = interferometer_binned.transformer.visibilities_from_image(
+            image=image
+        )
+
+        error = model_visibilities_binned - model_visibilities_at_bins
+
+        assert (np.abs(error.real) <= smearing_bound * np.sum(image)).all()
+        assert (np.abs(error.imag) <= smearing_bound * np.sum(image)).all()
+
 
 class TestSimulatorInterferometer:
     def test__from_image__setup_with_all_features_off(
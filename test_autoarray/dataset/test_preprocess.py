@@ -609,3 +609,68 @@ def test__data_with_complex_gaussian_noise_added():
     assert data_with_noise == pytest.approx(
         np.array([2.62434 + 0.38824j, 0.47182 - 0.07298j, 1.86540 - 1.30153j]), 1e-3
     )
+
+
+def test__uv_grid_bin_indexes_from():
+
+    uv_wavelengths = np.array([[0.5, 0.5], [1.5, 0.5], [0.2, 0.9], [-0.5, 0.5]])
+
+    bin_indexes = aa.preprocess.uv_grid_bin_indexes_from(
+        uv_wavelengths=uv_wavelengths, uv_cell_size=1.0
+    )
+
+    assert (bin_indexes == np.array([1, 2, 1, 0])).all()
+
+
+def test__visibilities_binned_from():
+
+    visibilities = np.array([1.0 + 2.0j, 3.0 + 4.0j, 5.0 + 6.0j])
+    noise_map = np.array([1.0 + 1.0j, 1.0 + 2.0j, 2.0 + 2.0j])
+    uv_wavelengths = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+
+    visibilities_binned, noise_map_binned, uv_wavelengths_binned = aa.preprocess.visibilities_binned_from(
+        visibilities=visibilities,
+        noise_map=noise_map,
+        uv_wavelengths=uv_wavelengths,
+        bin_indexes=np.array([0, 0, 1]),
+    )
+
+    assert visibilities_binned == pytest.approx(
+        np.array([2.0 + 2.4j, 5.0 + 6.0j]), 1.0e-4
+    )
+    assert noise_map_binned == pytest.approx(
+        np.array([np.sqrt(0.5) + 1j * np.sqrt(0.8), 2.0 + 2.0j]), 1.0e-4
+    )
+    assert uv_wavelengths_binned == pytest.approx(
+        np.array(
+            [
+                [(2.0 * 1.0 + 1.25 * 3.0) / 3.25, (2.0 * 2.0 + 1.25 * 4.0) / 3.25],
+                [5.0, 6.0],
+            ]
+        ),
+        1.0e-4,
+    )
+
+
+def test__uv_smearing_bound_from():
+
+    uv_wavelengths = np.array([[1.0, 2.0], [3.0, 2.0], [5.0, 6.0]])
+
+    smearing_bound = aa.preprocess.uv_smearing_bound_from(
+        uv_wavelengths=uv_wavelengths,
+        uv_wavelengths_binned=np.array([[2.5, 2.0], [5.0, 6.0]]),
+        bin_indexes=np.array([0, 0, 1]),
+        max_radius_radians=0.1,
+    )
+
+    assert smearing_bound == pytest.approx(
+        np.array([2.0 * np.pi * 0.1 * 1.5, 0.0]), 1.0e-4
+    )
+
+    uv_cell_size = aa.preprocess.uv_cell_size_from_smearing_bound(
+        smearing_bound=0.01, max_radius_radians=0.1
+    )
+
+    assert 2.0 * np.pi * 0.1 * np.sqrt(2.0) * uv_cell_size == pytest.approx(
+        0.01, 1.0e-4
+    )
@@ -2,7 +2,9 @@ import autoarray as aa
 
 import numpy as np
 import pytest
+from unittest import mock as unittest_mock
 
+from autoarray.fit import fit_util
 from autoarray.mock import mock
 
 
@@ -154,6 +156,112 @@ class TestFitImaging:
         )
         assert fit.figure_of_merit == fit.log_evidence
 
+    def test__properties_are_cached__computed_once_and_invalidated_on_new_model(
+        self,
+    ):
+
+        mask = aa.Mask2D.manual(
+            mask=[[False, False], [False, False]], sub_size=1, pixel_scales=(1.0, 1.0)
+        )
+
+        data = aa.Array2D.manual_mask(array=[1.0, 2.0, 3.0, 4.0], mask=mask)
+        noise_map = aa.Array2D.manual_mask(array=[2.0, 2.0, 2.0, 2.0], mask=mask)
+
+        imaging = aa.Imaging(image=data, noise_map=noise_map)
+
+        model_image = aa.Array2D.manual_mask(array=[1.0, 2.0, 3.0, 3.0], mask=mask)
+
+        fit = aa.FitImaging(
+            imaging=imaging, model_image=model_image, use_mask_in_fit=False
+        )
+
+        with unittest_mock.patch.object(
+            fit_util, "residual_map_from", wraps=fit_util.residual_map_from
+        ) as residual_map_from, unittest_mock.patch.object(
+            fit_util,
+            "chi_squared_and_noise_normalization_from",
+            wraps=fit_util.chi_squared_and_noise_normalization_from,
+        ) as chi_squared_and_noise_normalization_from:
+
+            for _ in range(3):
+                fit.figure_of_merit
+                fit.log_likelihood
+                fit.chi_squared
+                fit.noise_normalization
+                fit.residual_map
+                fit.normalized_residual_map
+                fit.chi_squared_map
+
+            assert residual_map_from.call_count == 1
+            assert chi_squared_and_noise_normalization_from.call_count == 1
+            assert fit.chi_squared == 0.25
+
+            fit.model_data = aa.Array2D.manual_mask(
+                array=[1.0, 2.0, 3.0, 4.0], mask=mask
+            )
+
+            assert fit.chi_squared == 0.0
+            assert (fit.residual_map.slim == np.array([0.0, 0.0, 0.0, 0.0])).all()
+            assert residual_map_from.call_count == 2
+            assert chi_squared_and_noise_normalization_from.call_count == 2
+
+            fit.invalidate_cache()
+
+            fit.log_likelihood
+
+            assert chi_squared_and_noise_normalization_from.call_count == 3
+
+    def test__scalar_fit__figure_of_merit_identical_and_no_structures_created(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(11, 11), pixel_scales=1.0, radius=4.0, sub_size=1
+        )
+
+        values = np.random.RandomState(seed=1).normal(size=(3, mask.pixels_in_mask))
+
+        data = aa.Array2D.manual_mask(array=values[0], mask=mask)
+        noise_map = aa.Array2D.manual_mask(array=1.0 + values[1] ** 2, mask=mask)
+        model_image = aa.Array2D.manual_mask(array=values[2], mask=mask)
+
+        imaging = aa.Imaging(image=data, noise_map=noise_map)
+
+        inversion = mock.MockFitInversion(
+            regularization_term=2.0,
+            log_det_curvature_reg_matrix_term=3.0,
+            log_det_regularization_matrix_term=4.0,
+        )
+
+        for fit_inversion in [None, inversion]:
+
+            fit = aa.FitImaging(
+                imaging=imaging,
+                model_image=model_image,
+                inversion=fit_inversion,
+                use_mask_in_fit=False,
+            )
+
+            with unittest_mock.patch.object(
+                aa.Array2D,
+                "__array_finalize__",
+                autospec=True,
+                side_effect=aa.Array2D.__array_finalize__,
+            ) as array_finalize:
+
+                fit_scalar = aa.FitImagingScalar(
+                    imaging=imaging,
+                    model_image=model_image,
+                    inversion=fit_inversion,
+                    use_mask_in_fit=False,
+                )
+
+                figure_of_merit = fit_scalar.figure_of_merit
+
+                assert array_finalize.call_count == 0
+
+            assert figure_of_merit == fit.figure_of_merit
+            assert fit_scalar.chi_squared == fit.chi_squared
+            assert fit_scalar.noise_normalization == fit.noise_normalization
+
 
 class TestFitInterferometer:
     def test__visibilities_and_model_are_identical__no_masking__check_values_are_correct(
@@ -365,3 +473,42 @@ class TestFitInterferometer:
         assert (
             fit_interferometer_7.dirty_chi_squared_map == dirty_chi_squared_map
         ).all()
+
+    def test__scalar_fit__figure_of_merit_identical(self):
+
+        real_space_mask = aa.Mask2D.manual(
+            mask=[[False, False], [False, False]], sub_size=1, pixel_scales=(1.0, 1.0)
+        )
+
+        values = np.random.RandomState(seed=1).normal(size=(6, 5))
+
+        data = aa.Visibilities.manual_slim(visibilities=values[0] + 1j * values[1])
+        noise_map = aa.VisibilitiesNoiseMap.manual_slim(
+            visibilities=(1.0 + values[2] ** 2) + 1j * (1.0 + values[3] ** 2)
+        )
+        model_visibilities = aa.Visibilities.manual_slim(
+            visibilities=values[4] + 1j * values[5]
+        )
+
+        interferometer = aa.Interferometer(
+            visibilities=data,
+            noise_map=noise_map,
+            uv_wavelengths=np.ones(shape=(5, 2)),
+            real_space_mask=real_space_mask,
+        )
+
+        fit = aa.FitInterferometer(
+            interferometer=interferometer,
+            model_visibilities=model_visibilities,
+            use_mask_in_fit=False,
+        )
+
+        fit_scalar = aa.FitInterferometerScalar(
+            interferometer=interferometer,
+            model_visibilities=model_visibilities,
+            use_mask_in_fit=False,
+        )
+
+        assert fit_scalar.figure_of_merit == fit.figure_of_merit
+        assert fit_scalar.chi_squared == fit.chi_squared
+        assert fit_scalar.noise_normalization == fit.noise_normalization
@@ -493,6 +493,67 @@ class TestLikelihood:
             -0.5 * (chi_squared + noise_normalization), 1e-4
         )
 
+    def test__chi_squared_and_noise_normalization__single_pass_matches_maps(self):
+
+        data = np.array([[10.0, 10.0], [10.0, 10.0]])
+        mask = np.array([[False, False], [True, False]])
+        noise_map = np.array([[2.0, 1.0], [0.0, 4.0]])
+        model_data = np.array([[11.0, 9.0], [8.0, 10.0]])
+
+        chi_squared, noise_normalization = aa.util.fit.chi_squared_and_noise_normalization_with_mask_from(
+            data=data, mask=mask, model_data=model_data, noise_map=noise_map
+        )
+
+        residual_map = aa.util.fit.residual_map_with_mask_from(
+            data=data, mask=mask, model_data=model_data
+        )
+        chi_squared_map = aa.util.fit.chi_squared_map_with_mask_from(
+            residual_map=residual_map, mask=mask, noise_map=noise_map
+        )
+
+        assert chi_squared == pytest.approx(
+            aa.util.fit.chi_squared_with_mask_from(
+                chi_squared_map=chi_squared_map, mask=mask
+            ),
+            1.0e-12,
+        )
+        assert noise_normalization == pytest.approx(
+            aa.util.fit.noise_normalization_with_mask_from(
+                noise_map=noise_map, mask=mask
+            ),
+            1.0e-12,
+        )
+
+        chi_squared, noise_normalization = aa.util.fit.chi_squared_and_noise_normalization_from(
+            data=data[mask == False],
+            model_data=model_data[mask == False],
+            noise_map=noise_map[mask == False],
+        )
+
+        assert chi_squared == pytest.approx(0.25 + 1.0 + 0.0, 1.0e-12)
+        assert noise_normalization == pytest.approx(
+            np.sum(np.log(2 * np.pi * np.array([2.0, 1.0, 4.0]) ** 2.0)), 1.0e-12
+        )
+
+    def test__chi_squared_and_noise_normalization__complex__single_pass_matches_maps(
+        self,
+    ):
+
+        data = np.array([10.0 + 10.0j, 10.0 + 10.0j])
+        mask = np.array([False, True])
+        noise_map = np.array([2.0 + 1.0j, 2.0 + 0.0j])
+        model_data = np.array([9.0 + 12.0j, 9.0 + 8.0j])
+
+        chi_squared, noise_normalization = aa.util.fit.chi_squared_and_noise_normalization_complex_with_mask_from(
+            data=data, mask=mask, model_data=model_data, noise_map=noise_map
+        )
+
+        assert chi_squared == pytest.approx(4.25, 1.0e-12)
+        assert noise_normalization == pytest.approx(
+            np.log(2 * np.pi * (2.0 ** 2.0)) + np.log(2 * np.pi * (1.0 ** 2.0)),
+            1.0e-12,
+        )
+
 
 class TestInversionEvidence:
     def test__simple_values(self):
@@ -477,6 +477,83 @@ class TestRectangular:
         assert (np.imag(inversion.mapped_reconstructed_visibilities) < 0.0001).all()
         assert (np.imag(inversion.mapped_reconstructed_visibilities) > 0.0).all()
 
+    def test__interferometer_matrices__w_tilde__same_as_transformed_mapping_matrix(
+        self,
+    ):
+
+        real_space_mask = aa.Mask2D.unmasked(
+            shape_native=(7, 7), pixel_scales=0.1, sub_size=2
+        )
+
+        grid = aa.Grid2D.from_mask(mask=real_space_mask)
+
+        pix = aa.pix.Rectangular(shape=(4, 4))
+
+        mapper = pix.mapper_from_grid_and_sparse_grid(
+            grid=grid,
+            sparse_grid=None,
+            settings=aa.SettingsPixelization(use_border=False),
+        )
+
+        reg = aa.reg.Constant(coefficient=1.0)
+
+        visibilities = aa.Visibilities.manual_slim(
+            visibilities=[
+                1.0 + 0.5j,
+                -1.0 + 2.0j,
+                0.5 - 1.0j,
+                2.0 + 0.0j,
+                -0.5 - 0.5j,
+                1.5 + 1.0j,
+                0.0 + 1.0j,
+            ]
+        )
+        noise_map = aa.VisibilitiesNoiseMap.manual_slim(
+            visibilities=[
+                1.0 + 2.0j,
+                2.0 + 1.0j,
+                1.0 + 1.0j,
+                3.0 + 2.0j,
+                1.0 + 3.0j,
+                2.0 + 2.0j,
+                1.0 + 1.0j,
+            ]
+        )
+        uv_wavelengths = aa.fixtures.make_uv_wavelengths_7x2()
+
+        interferometer = aa.Interferometer(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            settings=aa.SettingsInterferometer(transformer_class=aa.TransformerDFT),
+        )
+
+        inversion = aa.Inversion(
+            dataset=interferometer,
+            mapper=mapper,
+            regularization=reg,
+            settings=aa.SettingsInversion(check_solution=False),
+        )
+
+        inversion_w_tilde = aa.Inversion(
+            dataset=interferometer,
+            mapper=mapper,
+            regularization=reg,
+            settings=aa.SettingsInversion(check_solution=False, use_w_tilde=True),
+        )
+
+        assert inversion_w_tilde.transformed_mapping_matrix is None
+        assert inversion_w_tilde.curvature_matrix == pytest.approx(
+            inversion.curvature_matrix, 1.0e-8
+        )
+        assert inversion_w_tilde.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-8
+        )
+        assert inversion_w_tilde.mapped_reconstructed_visibilities == pytest.approx(
+            inversion.mapped_reconstructed_visibilities, 1.0e-8
+        )
+
     def test__interferometer_linear_operator(self):
 
         real_space_mask = aa.Mask2D.unmasked(
@@ -532,6 +609,24 @@ class TestRectangular:
         assert (np.imag(inversion.mapped_reconstructed_visibilities) < 0.0001).all()
         assert (np.imag(inversion.mapped_reconstructed_visibilities) > 0.0).all()
 
+        assert inversion.iterations > 0
+        assert inversion.residual_norms.shape[0] == inversion.iterations + 1
+
+        inversion_warm_start = aa.Inversion(
+            dataset=interferometer,
+            mapper=mapper,
+            regularization=reg,
+            settings=aa.SettingsInversion(
+                use_linear_operators=True, check_solution=False
+            ),
+            initial_reconstruction=inversion.reconstruction,
+        )
+
+        assert inversion_warm_start.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-4
+        )
+        assert inversion_warm_start.iterations < inversion.iterations
+
 
 class TestVoronoiMagnification:
     def test__3x3_simple_grid(self):
@@ -1,5 +1,7 @@
 import autoarray as aa
 import numpy as np
+import pytest
+from scipy import linalg, sparse
 
 
 class TestDataVectorFromData:
@@ -143,6 +145,53 @@ class TestDataVectorFromData:
         assert (data_vector_complex_via_blurred == data_vector_via_transformed).all()
 
 
+    def test__data_vector_via_inverse_variance_map__same_as_via_noise_map(self):
+
+        blurred_mapping_matrix = np.array(
+            [
+                [1.0, 1.0, 0.0, 0.5],
+                [1.0, 0.0, 0.0, 0.25],
+                [0.0, 1.0, 0.6, 0.75],
+                [0.0, 1.0, 1.0, 0.1],
+                [0.0, 0.0, 0.3, 1.0],
+                [0.0, 0.0, 0.5, 0.7],
+            ]
+        )
+
+        image = np.array([4.0, 1.0, 1.0, 16.0, 1.0, 1.0])
+        noise_map = np.array([2.0, 1.0, 10.0, 0.5, 3.0, 7.0])
+
+        inverse_variance_map = aa.util.inversion.inverse_variance_map_from(
+            noise_map=noise_map
+        )
+
+        assert inverse_variance_map == pytest.approx(
+            np.array([0.25, 1.0, 0.01, 4.0, 1.0 / 9.0, 1.0 / 49.0]), 1.0e-8
+        )
+
+        data_vector = aa.util.inversion.data_vector_via_blurred_mapping_matrix_from(
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            image=image,
+            noise_map=noise_map,
+        )
+
+        data_vector_via_inverse_variance = aa.util.inversion.data_vector_via_blurred_mapping_matrix_and_inverse_variance_map_from(
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            image=image,
+            inverse_variance_map=inverse_variance_map,
+        )
+
+        assert data_vector_via_inverse_variance == pytest.approx(data_vector, 1.0e-8)
+
+        data_vector_via_inverse_variance = aa.util.inversion.data_vector_via_blurred_mapping_matrix_and_inverse_variance_map_from(
+            blurred_mapping_matrix=sparse.csr_matrix(blurred_mapping_matrix),
+            image=image,
+            inverse_variance_map=inverse_variance_map,
+        )
+
+        assert data_vector_via_inverse_variance == pytest.approx(data_vector, 1.0e-8)
+
+
 class TestCurvatureMatrixFromBlurred:
     def test__simple_blurred_mapping_matrix(self):
 
@@ -261,6 +310,125 @@ class TestCurvatureMatrixFromBlurred:
 
         assert (curvature_matrix_via_mapping_matrix == curvature_matrix).all()
 
+    def test__curvature_matrix_sparse_preload__via_mapping_matrix_sparse__same_as_dense(
+        self,
+    ):
+
+        blurred_mapping_matrix = np.array(
+            [
+                [1.0, 1.0, 0.0, 0.5],
+                [1.0, 0.0, 0.0, 0.25],
+                [0.0, 1.0, 0.6, -0.75],
+                [0.0, 1.0, 1.0, 0.1],
+                [0.0, 0.0, 0.3, 1.0],
+                [0.0, 0.0, 0.0, 0.0],
+            ]
+        )
+
+        curvature_matrix_sparse_preload, curvature_matrix_preload_counts = aa.util.inversion.curvature_matrix_sparse_preload_via_mapping_matrix_from(
+            mapping_matrix=blurred_mapping_matrix
+        )
+
+        curvature_matrix_sparse_preload_sparse, curvature_matrix_preload_counts_sparse = aa.util.inversion.curvature_matrix_sparse_preload_via_mapping_matrix_sparse_from(
+            mapping_matrix_sparse=sparse.csr_matrix(blurred_mapping_matrix)
+        )
+
+        assert (
+            curvature_matrix_sparse_preload_sparse == curvature_matrix_sparse_preload
+        ).all()
+        assert (
+            curvature_matrix_preload_counts_sparse == curvature_matrix_preload_counts
+        ).all()
+
+    def test__curvature_matrix_via_outer_products_preload(self):
+
+        blurred_mapping_matrix = np.array(
+            [
+                [1.0, 1.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 1.0, 1.0],
+                [0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0],
+            ]
+        )
+
+        noise_map = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 1.0])
+
+        curvature_matrix_outer_products = aa.util.inversion.curvature_matrix_outer_products_preload_from(
+            mapping_matrix=blurred_mapping_matrix
+        )
+
+        assert curvature_matrix_outer_products.shape == (9, 6)
+
+        curvature_matrix = aa.util.inversion.curvature_matrix_via_outer_products_preload_from(
+            curvature_matrix_outer_products=curvature_matrix_outer_products,
+            noise_map=noise_map,
+        )
+
+        assert (
+            curvature_matrix
+            == np.array([[2.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 1.0]])
+        ).all()
+
+        blurred_mapping_matrix = np.array(
+            [
+                [1.0, 1.0, 0.0, 0.5],
+                [1.0, 0.0, 0.0, 0.25],
+                [0.0, 1.0, 0.6, 0.75],
+                [0.0, 1.0, 1.0, 0.1],
+                [0.0, 0.0, 0.3, 1.0],
+                [0.0, 0.0, 0.5, 0.7],
+            ]
+        )
+
+        curvature_matrix_outer_products = aa.util.inversion.curvature_matrix_outer_products_preload_from(
+            mapping_matrix=sparse.csr_matrix(blurred_mapping_matrix)
+        )
+
+        for noise_map in [
+            np.array([2.0, 1.0, 10.0, 0.5, 3.0, 7.0]),
+            np.array([1.0, 3.0, 2.0, 0.1, 3.0, 5.0]),
+        ]:
+
+            curvature_matrix_via_mapping_matrix = aa.util.inversion.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+            )
+
+            curvature_matrix = aa.util.inversion.curvature_matrix_via_outer_products_preload_from(
+                curvature_matrix_outer_products=curvature_matrix_outer_products,
+                noise_map=noise_map,
+            )
+
+            assert curvature_matrix == pytest.approx(
+                curvature_matrix_via_mapping_matrix, 1.0e-8
+            )
+
+    def test__curvature_matrix_via_mapping_matrix_sparse__same_as_dense(self):
+
+        blurred_mapping_matrix = np.array(
+            [
+                [1.0, 1.0, 0.0, 0.5],
+                [1.0, 0.0, 0.0, 0.25],
+                [0.0, 1.0, 0.6, 0.75],
+                [0.0, 1.0, 1.0, 0.1],
+                [0.0, 0.0, 0.3, 1.0],
+                [0.0, 0.0, 0.5, 0.7],
+            ]
+        )
+
+        noise_map = np.array([2.0, 1.0, 10.0, 0.5, 3.0, 7.0])
+
+        curvature_matrix = aa.util.inversion.curvature_matrix_via_mapping_matrix_from(
+            mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+        )
+
+        curvature_matrix_sparse = aa.util.inversion.curvature_matrix_via_mapping_matrix_sparse_from(
+            mapping_matrix_sparse=sparse.csr_matrix(blurred_mapping_matrix),
+            noise_map=noise_map,
+        )
+
+        assert curvature_matrix_sparse == pytest.approx(curvature_matrix, 1.0e-4)
 
 class TestPixelizationResiduals:
     def test__pixelization_perfectly_reconstructed_data__quantities_like_residuals_all_zeros(
@@ -424,6 +592,66 @@ class TestPixelizationChiSquareds:
         assert (pixelization_chi_squareds == np.array([0.0, 4.0, 0.25])).all()
 
 
+    def test__via_csr__same_as_via_list_of_lists(self):
+
+        pixelization_values = np.array([1.0, 2.0, 3.0, 4.0])
+        reconstructed_data_1d = np.array([1.0, 1.5, 2.0, 3.0, 5.0])
+        noise_map_1d = np.array([0.5, 1.0, 2.0, 1.0, 4.0])
+        slim_index_for_sub_slim_index = np.array([0, 0, 1, 1, 2, 3, 3, 4])
+        all_sub_slim_indexes_for_pixelization_index = [[0, 3, 7], [], [1, 2], [4, 5, 6]]
+
+        (
+            sub_slim_indexes_for_pixelization_index,
+            sub_slim_offsets_for_pixelization_index,
+        ) = aa.util.inversion.sub_slim_indexes_for_pixelization_index_csr_from(
+            all_sub_slim_indexes_for_pixelization_index=all_sub_slim_indexes_for_pixelization_index
+        )
+
+        assert (
+            sub_slim_indexes_for_pixelization_index
+            == np.array([0, 3, 7, 1, 2, 4, 5, 6])
+        ).all()
+        assert (sub_slim_offsets_for_pixelization_index == np.array([0, 3, 3, 5, 8])).all()
+
+        for map_from, map_via_csr_from, noise_map_kwargs in [
+            (
+                aa.util.inversion.inversion_residual_map_from,
+                aa.util.inversion.inversion_residual_map_via_csr_from,
+                {},
+            ),
+            (
+                aa.util.inversion.inversion_normalized_residual_map_from,
+                aa.util.inversion.inversion_normalized_residual_map_via_csr_from,
+                {"noise_map_1d": noise_map_1d},
+            ),
+            (
+                aa.util.inversion.inversion_chi_squared_map_from,
+                aa.util.inversion.inversion_chi_squared_map_via_csr_from,
+                {"noise_map_1d": noise_map_1d},
+            ),
+        ]:
+
+            pixelization_map = map_from(
+                pixelization_values=pixelization_values,
+                data=reconstructed_data_1d,
+                slim_index_for_sub_slim_index=slim_index_for_sub_slim_index,
+                all_sub_slim_indexes_for_pixelization_index=all_sub_slim_indexes_for_pixelization_index,
+                **noise_map_kwargs,
+            )
+
+            pixelization_map_via_csr = map_via_csr_from(
+                pixelization_values=pixelization_values,
+                data=reconstructed_data_1d,
+                slim_index_for_sub_slim_index=slim_index_for_sub_slim_index,
+                sub_slim_indexes_for_pixelization_index=sub_slim_indexes_for_pixelization_index,
+                sub_slim_offsets_for_pixelization_index=sub_slim_offsets_for_pixelization_index,
+                **noise_map_kwargs,
+            )
+
+            assert pixelization_map[1] == 0.0
+            assert (pixelization_map_via_csr == pixelization_map).all()
+
+
 class TestPreconditionerMatrix:
     def test__simple_calculations(self):
 
@@ -474,3 +702,141 @@ class TestPreconditionerMatrix:
             preconditioner_matrix
             == np.array([[5.0, 2.0, 3.0], [4.0, 9.0, 6.0], [7.0, 8.0, 13.0]])
         ).all()
+
+    def test__sparse__same_as_dense(self):
+
+        mapping_matrix = np.array(
+            [
+                [1.0, 0.0, 0.0],
+                [0.5, 0.5, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.25, 0.75],
+                [0.0, 0.0, 1.0],
+            ]
+        )
+
+        regularization_matrix = np.array(
+            [[2.0, -1.0, 0.0], [-1.0, 3.0, -1.0], [0.0, -1.0, 2.0]]
+        )
+
+        preconditioner_matrix = aa.util.inversion.preconditioner_matrix_via_mapping_matrix_from(
+            mapping_matrix=mapping_matrix,
+            preconditioner_noise_normalization=2.0,
+            regularization_matrix=regularization_matrix,
+        )
+
+        preconditioner_matrix_sparse = aa.util.inversion.preconditioner_matrix_sparse_via_mapping_matrix_from(
+            mapping_matrix=mapping_matrix,
+            preconditioner_noise_normalization=2.0,
+            regularization_matrix_sparse=sparse.csr_matrix(regularization_matrix),
+        )
+
+        assert preconditioner_matrix_sparse.toarray() == pytest.approx(
+            preconditioner_matrix, 1.0e-8
+        )
+
+
+class TestPreconditionedConjugateGradient:
+    def test__solution_same_as_direct_solve__warm_start_uses_fewer_iterations(
+        self,
+    ):
+
+        np.random.seed(1)
+
+        matrix = np.random.normal(size=(20, 20))
+        curvature_reg_matrix = matrix @ matrix.T + 20.0 * np.eye(20)
+        data_vector = np.random.normal(size=20)
+
+        preconditioner_diagonal = np.diag(curvature_reg_matrix)
+
+        reconstruction, iterations, residual_norms = aa.util.inversion.reconstruction_via_preconditioned_conjugate_gradient_from(
+            curvature_reg_matvec=lambda vector: curvature_reg_matrix @ vector,
+            data_vector=data_vector,
+            preconditioner_solve=lambda vector: vector / preconditioner_diagonal,
+            tolerance=1e-10,
+            maxiter=100,
+        )
+
+        assert reconstruction == pytest.approx(
+            linalg.solve(curvature_reg_matrix, data_vector), 1.0e-8
+        )
+        assert 0 < iterations <= 20
+        assert residual_norms.shape[0] == iterations + 1
+        assert residual_norms[-1] <= 1e-10 * np.linalg.norm(data_vector)
+
+        reconstruction_warm, iterations_warm, residual_norms_warm = aa.util.inversion.reconstruction_via_preconditioned_conjugate_gradient_from(
+            curvature_reg_matvec=lambda vector: curvature_reg_matrix @ vector,
+            data_vector=data_vector,
+            preconditioner_solve=lambda vector: vector / preconditioner_diagonal,
+            initial_reconstruction=reconstruction + 1e-6,
+            tolerance=1e-10,
+            maxiter=100,
+        )
+
+        assert reconstruction_warm == pytest.approx(reconstruction, 1.0e-8)
+        assert iterations_warm < iterations
+
+        reconstruction_exact_preconditioner, iterations, _ = aa.util.inversion.reconstruction_via_preconditioned_conjugate_gradient_from(
+            curvature_reg_matvec=lambda vector: curvature_reg_matrix @ vector,
+            data_vector=data_vector,
+            preconditioner_solve=lambda vector: linalg.solve(
+                curvature_reg_matrix, vector
+            ),
+            tolerance=1e-10,
+            maxiter=100,
+        )
+
+        assert reconstruction_exact_preconditioner == pytest.approx(
+            reconstruction, 1.0e-8
+        )
+        assert iterations == 1
+
+
+class TestLogDeterminantStochasticLanczosQuadrature:
+    def test__estimate_close_to_cholesky_and_reproducible_for_seed(self):
+
+        random_state = np.random.RandomState(seed=1)
+
+        matrix = random_state.normal(size=(40, 40))
+        matrix = 0.02 * (matrix + matrix.T) + np.diag(
+            random_state.uniform(low=1.0, high=10.0, size=40)
+        )
+
+        log_determinant = 2.0 * np.sum(
+            np.log(np.diag(linalg.cho_factor(matrix)[0]))
+        )
+
+        log_determinant_estimate = aa.util.inversion.log_determinant_via_stochastic_lanczos_quadrature_from(
+            matvec=lambda vector: matrix @ vector,
+            pixels=40,
+            total_probes=50,
+            lanczos_steps=20,
+            seed=1,
+        )
+
+        assert log_determinant_estimate == pytest.approx(log_determinant, 1.0e-2)
+
+        assert log_determinant_estimate == aa.util.inversion.log_determinant_via_stochastic_lanczos_quadrature_from(
+            matvec=lambda vector: matrix @ vector,
+            pixels=40,
+            total_probes=50,
+            lanczos_steps=20,
+            seed=1,
+        )
+
+        assert log_determinant_estimate != aa.util.inversion.log_determinant_via_stochastic_lanczos_quadrature_from(
+            matvec=lambda vector: matrix @ vector,
+            pixels=40,
+            total_probes=50,
+            lanczos_steps=20,
+            seed=2,
+        )
+
+    def test__matrix_not_positive_definite__raises_inversion_exception(self):
+
+        matrix = np.array([[1.0, 2.0], [2.0, 1.0]])
+
+        with pytest.raises(aa.exc.InversionException):
+            aa.util.inversion.log_determinant_via_stochastic_lanczos_quadrature_from(
+                matvec=lambda vector: matrix @ vector, pixels=2, total_probes=5
+            )
@@ -1,7 +1,10 @@
+import inspect
+
 import autoarray as aa
 from autoarray.inversion import inversions
 from autoarray import exc
 import numpy as np
+from scipy import sparse
 
 from autoarray.mock import mock
 
@@ -36,6 +39,65 @@ class TestLogDetMatrixCholesky:
                 inversions.log_determinant_of_matrix_cholesky(matrix), 1e-4
             )
 
+    def test__cholesky_factor_of_matrix_not_positive_definite__raises_reconstruction_exception(
+        self,
+    ):
+
+        matrix = np.array([[2.0, 0.0, 0.0], [-1.0, 2.0, -1.0], [0.0, -1.0, 0.0]])
+
+        with pytest.raises(exc.InversionException):
+            inversions.cholesky_factor_of_matrix(matrix=matrix)
+
+
+class TestLogDetSparseMatrixLU:
+    def test__determinant_of_positive_definite_matrix_via_sparse_lu(self):
+
+        matrix = np.array([[2.0, -1.0, 0.0], [-1.0, 2.0, -1.0], [0.0, -1.0, 2.0]])
+
+        log_determinant = np.log(np.linalg.det(matrix))
+
+        assert log_determinant == pytest.approx(
+            inversions.log_determinant_of_sparse_matrix_lu(sparse.csr_matrix(matrix)),
+            1e-4,
+        )
+
+    def test__same_as_cholesky_for_regularization_matrix(self):
+
+        pixel_neighbors = np.array(
+            [
+                [1, 4, -1, -1],
+                [2, 4, 0, -1],
+                [3, 4, 5, 1],
+                [5, 2, -1, -1],
+                [5, 0, 1, 2],
+                [2, 3, 4, -1],
+            ]
+        )
+
+        pixel_neighbors_size = np.array([2, 3, 4, 2, 4, 3])
+
+        regularization_matrix_sparse = aa.util.regularization.constant_regularization_matrix_sparse_from(
+            coefficient=2.0,
+            pixel_neighbors=pixel_neighbors,
+            pixel_neighbors_size=pixel_neighbors_size,
+        )
+
+        assert inversions.log_determinant_of_sparse_matrix_lu(
+            regularization_matrix_sparse
+        ) == pytest.approx(
+            inversions.log_determinant_of_matrix_cholesky(
+                regularization_matrix_sparse.toarray()
+            ),
+            1e-4,
+        )
+
+    def test__matrix_not_positive_definite__raises_reconstruction_exception(self):
+
+        matrix = np.array([[2.0, 0.0, 0.0], [-1.0, 2.0, -1.0], [0.0, -1.0, 0.0]])
+
+        with pytest.raises(exc.InversionException):
+            inversions.log_determinant_of_sparse_matrix_lu(sparse.csr_matrix(matrix))
+
 
 class TestAbstractInversion:
     def test__regularization_term__solution_all_1s__regularization_matrix_simple(self):
@@ -596,6 +658,444 @@ class TestInversionImagingMatrix:
 
         assert (inversion.blurred_mapping_matrix == blurred_mapping_matrix).all()
 
+    def test__preloads__curvature_matrix_outer_products(self):
+
+        masked_imaging_7x7 = aa.fixtures.make_masked_imaging_7x7()
+        rectangular_mapper_7x7_3x3 = aa.fixtures.make_rectangular_mapper_7x7_3x3()
+
+        inversion = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=rectangular_mapper_7x7_3x3,
+            regularization=aa.reg.Constant(coefficient=1.0),
+        )
+
+        assert (
+            inversion.curvature_matrix_outer_products
+            is inversion.curvature_matrix_outer_products
+        )
+
+        noise_map = 2.0 * masked_imaging_7x7.noise_map
+
+        inversion_noise_scaled = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=masked_imaging_7x7.image,
+            noise_map=noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=rectangular_mapper_7x7_3x3,
+            regularization=aa.reg.Constant(coefficient=1.0),
+        )
+
+        inversion_preload = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=masked_imaging_7x7.image,
+            noise_map=noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=rectangular_mapper_7x7_3x3,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            preloads=aa.Preloads(
+                blurred_mapping_matrix=inversion.blurred_mapping_matrix,
+                curvature_matrix_outer_products=inversion.curvature_matrix_outer_products,
+            ),
+        )
+
+        assert inversion_preload.curvature_matrix == pytest.approx(
+            inversion_noise_scaled.curvature_matrix, 1.0e-8
+        )
+        assert inversion_preload.reconstruction == pytest.approx(
+            inversion_noise_scaled.reconstruction, 1.0e-8
+        )
+
+    def test__list_from_regularization_coefficients__same_as_individual_inversions(
+        self,
+    ):
+
+        masked_imaging_7x7 = aa.fixtures.make_masked_imaging_7x7()
+        rectangular_mapper_7x7_3x3 = aa.fixtures.make_rectangular_mapper_7x7_3x3()
+
+        coefficients = [0.1, 1.0, 10.0]
+
+        inversion_list = inversions.InversionImagingMatrix.list_from_data_mapper_and_regularization_coefficients(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=rectangular_mapper_7x7_3x3,
+            coefficients=coefficients,
+            settings=aa.SettingsInversion(check_solution=False),
+        )
+
+        assert len(inversion_list) == 3
+
+        for coefficient, inversion_batch in zip(coefficients, inversion_list):
+
+            inversion = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+                image=masked_imaging_7x7.image,
+                noise_map=masked_imaging_7x7.noise_map,
+                convolver=masked_imaging_7x7.convolver,
+                mapper=rectangular_mapper_7x7_3x3,
+                regularization=aa.reg.Constant(coefficient=coefficient),
+                settings=aa.SettingsInversion(check_solution=False),
+            )
+
+            assert inversion_batch.regularization.coefficient == coefficient
+            assert (
+                inversion_batch.regularization_matrix == inversion.regularization_matrix
+            ).all()
+            assert inversion_batch.reconstruction == pytest.approx(
+                inversion.reconstruction, 1.0e-4
+            )
+            assert inversion_batch.regularization_term == pytest.approx(
+                inversion.regularization_term, 1.0e-4
+            )
+            assert inversion_batch.log_det_curvature_reg_matrix_term == pytest.approx(
+                inversion.log_det_curvature_reg_matrix_term, 1.0e-4
+            )
+            assert inversion_batch.log_det_regularization_matrix_term == pytest.approx(
+                inversion.log_det_regularization_matrix_term, 1.0e-4
+            )
+
+    def test__list_from_coefficients__mapper_with_unmapped_pixels__same_as_individual_inversions(
+        self,
+    ):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(40, 40), pixel_scales=0.1, radius=1.5, sub_size=2
+        )
+
+        mapper = aa.pix.Rectangular(shape=(30, 30)).mapper_from_grid_and_sparse_grid(
+            grid=aa.Grid2D.from_mask(mask=mask),
+            sparse_grid=None,
+            settings=aa.SettingsPixelization(use_border=False),
+        )
+
+        assert (mapper.mapping_matrix.sum(axis=0) == 0.0).any()
+
+        convolver = aa.Convolver(
+            mask=mask,
+            kernel=aa.Kernel2D.from_gaussian(
+                shape_native=(5, 5), pixel_scales=0.1, sigma=0.1, normalize=True
+            ),
+        )
+
+        image = aa.Array2D.manual_mask(
+            array=np.random.RandomState(1).normal(1.0, 0.5, mask.pixels_in_mask),
+            mask=mask.mask_sub_1,
+        )
+        noise_map = aa.Array2D.manual_mask(
+            array=np.full(mask.pixels_in_mask, 0.5), mask=mask.mask_sub_1
+        )
+
+        coefficients = [0.01, 1.0, 100.0]
+
+        inversion_list = inversions.InversionImagingMatrix.list_from_data_mapper_and_regularization_coefficients(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            coefficients=coefficients,
+            settings=aa.SettingsInversion(check_solution=False),
+        )
+
+        for coefficient, inversion_batch in zip(coefficients, inversion_list):
+
+            inversion = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                mapper=mapper,
+                regularization=aa.reg.Constant(coefficient=coefficient),
+                settings=aa.SettingsInversion(check_solution=False),
+            )
+
+            assert inversion_batch.reconstruction == pytest.approx(
+                inversion.reconstruction, 1.0e-4
+            )
+            assert inversion_batch.regularization_term == pytest.approx(
+                inversion.regularization_term, 1.0e-4
+            )
+            assert inversion_batch.log_det_curvature_reg_matrix_term == pytest.approx(
+                inversion.log_det_curvature_reg_matrix_term, 1.0e-4
+            )
+            assert inversion_batch.log_det_regularization_matrix_term == pytest.approx(
+                inversion.log_det_regularization_matrix_term, 1.0e-4
+            )
+
+    def test__curvature_reg_matrix_cholesky__reused_for_log_det_and_errors(self):
+
+        masked_imaging_7x7 = aa.fixtures.make_masked_imaging_7x7()
+
+        inversion = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=aa.fixtures.make_rectangular_mapper_7x7_3x3(),
+            regularization=aa.reg.Constant(coefficient=1.0),
+        )
+
+        data_vector = aa.util.inversion.data_vector_via_blurred_mapping_matrix_from(
+            blurred_mapping_matrix=inversion.blurred_mapping_matrix,
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+        )
+
+        assert inversion.reconstruction == pytest.approx(
+            np.linalg.solve(inversion.curvature_reg_matrix, data_vector), 1.0e-4
+        )
+        assert inversion.log_det_curvature_reg_matrix_term == pytest.approx(
+            inversions.log_determinant_of_matrix_cholesky(
+                inversion.curvature_reg_matrix
+            ),
+            1.0e-4,
+        )
+        assert inversion.errors_with_covariance == pytest.approx(
+            np.linalg.inv(inversion.curvature_reg_matrix), 1.0e-4
+        )
+
+        inversion.curvature_reg_matrix = 2.0 * np.eye(9)
+
+        assert inversion.log_det_curvature_reg_matrix_term == pytest.approx(
+            9.0 * np.log(2.0), 1.0e-4
+        )
+        assert inversion.errors == pytest.approx(0.5 * np.ones(9), 1.0e-4)
+
+    def test__sparse_mapping_matrix_below_fill_fraction__same_as_dense(self):
+
+        masked_imaging_7x7 = aa.fixtures.make_masked_imaging_7x7()
+
+        mapper = aa.fixtures.make_rectangular_mapper_7x7_3x3()
+
+        inversion_dense = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=mapper,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            settings=aa.SettingsInversion(sparse_fill_fraction_threshold=0.0),
+        )
+
+        inversion_sparse = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=masked_imaging_7x7.image,
+            noise_map=masked_imaging_7x7.noise_map,
+            convolver=masked_imaging_7x7.convolver,
+            mapper=mapper,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            settings=aa.SettingsInversion(sparse_fill_fraction_threshold=1.1),
+        )
+
+        assert isinstance(inversion_dense.blurred_mapping_matrix, np.ndarray)
+        assert sparse.issparse(inversion_sparse.blurred_mapping_matrix)
+
+        assert inversion_sparse.blurred_mapping_matrix.toarray() == pytest.approx(
+            inversion_dense.blurred_mapping_matrix, 1.0e-4
+        )
+        assert inversion_sparse.curvature_matrix == pytest.approx(
+            inversion_dense.curvature_matrix, 1.0e-4
+        )
+        assert inversion_sparse.reconstruction == pytest.approx(
+            inversion_dense.reconstruction, 1.0e-4
+        )
+        assert inversion_sparse.mapped_reconstructed_image == pytest.approx(
+            inversion_dense.mapped_reconstructed_image, 1.0e-4
+        )
+
+    def test__sparse_mapping_matrix__curvature_matrix_sparse_preload_and_counts_same_as_dense(
+        self,
+    ):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(40, 40), pixel_scales=0.1, radius=1.5, sub_size=2
+        )
+
+        mapper = aa.pix.Rectangular(shape=(30, 30)).mapper_from_grid_and_sparse_grid(
+            grid=aa.Grid2D.from_mask(mask=mask),
+            sparse_grid=None,
+            settings=aa.SettingsPixelization(use_border=False),
+        )
+
+        convolver = aa.Convolver(
+            mask=mask,
+            kernel=aa.Kernel2D.from_gaussian(
+                shape_native=(5, 5), pixel_scales=0.1, sigma=0.1, normalize=True
+            ),
+        )
+
+        image = aa.Array2D.manual_mask(
+            array=np.random.RandomState(1).normal(1.0, 0.5, mask.pixels_in_mask),
+            mask=mask.mask_sub_1,
+        )
+        noise_map = aa.Array2D.manual_mask(
+            array=np.full(mask.pixels_in_mask, 0.5), mask=mask.mask_sub_1
+        )
+
+        inversion_sparse = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            settings=aa.SettingsInversion(check_solution=False),
+        )
+
+        inversion_dense = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            settings=aa.SettingsInversion(
+                check_solution=False, sparse_fill_fraction_threshold=0.0
+            ),
+        )
+
+        assert sparse.issparse(inversion_sparse.blurred_mapping_matrix)
+
+        assert (
+            inversion_sparse.curvature_matrix_sparse_preload
+            == inversion_dense.curvature_matrix_sparse_preload
+        ).all()
+        assert (
+            inversion_sparse.curvature_matrix_preload_counts
+            == inversion_dense.curvature_matrix_preload_counts
+        ).all()
+
+    def test__sparse_mapping_matrix__all_properties_same_as_dense(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(40, 40), pixel_scales=0.1, radius=1.5, sub_size=2
+        )
+
+        mapper = aa.pix.Rectangular(shape=(30, 30)).mapper_from_grid_and_sparse_grid(
+            grid=aa.Grid2D.from_mask(mask=mask),
+            sparse_grid=None,
+            settings=aa.SettingsPixelization(use_border=False),
+        )
+
+        convolver = aa.Convolver(
+            mask=mask,
+            kernel=aa.Kernel2D.from_gaussian(
+                shape_native=(5, 5), pixel_scales=0.1, sigma=0.1, normalize=True
+            ),
+        )
+
+        image = aa.Array2D.manual_mask(
+            array=np.random.RandomState(1).normal(1.0, 0.5, mask.pixels_in_mask),
+            mask=mask.mask_sub_1,
+        )
+        noise_map = aa.Array2D.manual_mask(
+            array=np.full(mask.pixels_in_mask, 0.5), mask=mask.mask_sub_1
+        )
+
+        inversion_sparse = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            settings=aa.SettingsInversion(check_solution=False),
+        )
+
+        inversion_dense = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            settings=aa.SettingsInversion(
+                check_solution=False, sparse_fill_fraction_threshold=0.0
+            ),
+        )
+
+        assert sparse.issparse(inversion_sparse.blurred_mapping_matrix)
+        assert not sparse.issparse(inversion_dense.blurred_mapping_matrix)
+
+        def values_from(value):
+
+            if sparse.issparse(value):
+                return value
+            if isinstance(value, tuple):
+                return value[0]
+            return np.asarray(value)
+
+        property_names = [
+            name
+            for name, _ in inspect.getmembers(
+                inversions.InversionImagingMatrix,
+                lambda member: isinstance(member, property),
+            )
+            if not name.startswith("_")
+        ]
+
+        assert "curvature_matrix_sparse_preload" in property_names
+
+        for name in property_names + [
+            "blurred_mapping_matrix",
+            "curvature_matrix",
+            "reconstruction",
+        ]:
+
+            value_sparse = values_from(getattr(inversion_sparse, name))
+            value_dense = values_from(getattr(inversion_dense, name))
+
+            if sparse.issparse(value_sparse) or sparse.issparse(value_dense):
+                assert abs(
+                    sparse.csr_matrix(value_sparse) - sparse.csr_matrix(value_dense)
+                ).max() == pytest.approx(0.0, abs=1.0e-8), name
+            else:
+                assert value_sparse == pytest.approx(value_dense, 1.0e-4), name
+
+    def test__sparse_mapping_matrix__convolver_use_fft__frames_not_computed(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(40, 40), pixel_scales=0.1, radius=1.5, sub_size=2
+        )
+
+        mapper = aa.pix.Rectangular(shape=(30, 30)).mapper_from_grid_and_sparse_grid(
+            grid=aa.Grid2D.from_mask(mask=mask),
+            sparse_grid=None,
+            settings=aa.SettingsPixelization(use_border=False),
+        )
+
+        kernel = aa.Kernel2D.from_gaussian(
+            shape_native=(5, 5), pixel_scales=0.1, sigma=0.1, normalize=True
+        )
+
+        image = aa.Array2D.manual_mask(
+            array=np.random.RandomState(1).normal(1.0, 0.5, mask.pixels_in_mask),
+            mask=mask.mask_sub_1,
+        )
+        noise_map = aa.Array2D.manual_mask(
+            array=np.full(mask.pixels_in_mask, 0.5), mask=mask.mask_sub_1
+        )
+
+        convolver_fft = aa.Convolver(mask=mask, kernel=kernel, use_fft=True)
+
+        inversion_fft = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver_fft,
+            mapper=mapper,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            settings=aa.SettingsInversion(check_solution=False),
+        )
+
+        assert sparse.issparse(inversion_fft.blurred_mapping_matrix)
+
+        assert convolver_fft._image_frames is None
+        assert convolver_fft._blurring_frames is None
+        assert convolver_fft._convolution_matrix_sparse is None
+
+        inversion = inversions.InversionImagingMatrix.from_data_mapper_and_regularization(
+            image=image,
+            noise_map=noise_map,
+            convolver=aa.Convolver(mask=mask, kernel=kernel, use_fft=False),
+            mapper=mapper,
+            regularization=aa.reg.Constant(coefficient=1.0),
+            settings=aa.SettingsInversion(check_solution=False),
+        )
+
+        assert inversion_fft.reconstruction == pytest.approx(
+            inversion.reconstruction, 1.0e-4
+        )
+
 
 from autoconf import conf
 from os import path
@@ -273,6 +273,54 @@ class TestMappingMatrix:
         ).all()
 
 
+    def test__sparse_mapping_matrix__same_as_dense_mapping_matrix(self):
+
+        pixelization_1d_index_for_sub_mask_1d_index = np.array(
+            [0, 0, 0, 1, 2, 2, 2, 2, 5, 4, 3, 3]
+        )
+        slim_index_for_sub_slim_index = np.array([0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2])
+
+        mapping_matrix = aa.util.mapper.mapping_matrix_from(
+            pixelization_index_for_sub_slim_index=pixelization_1d_index_for_sub_mask_1d_index,
+            pixels=6,
+            total_mask_pixels=3,
+            slim_index_for_sub_slim_index=slim_index_for_sub_slim_index,
+            sub_fraction=0.25,
+        )
+
+        mapping_matrix_sparse = aa.util.mapper.mapping_matrix_sparse_from(
+            pixelization_index_for_sub_slim_index=pixelization_1d_index_for_sub_mask_1d_index,
+            pixels=6,
+            total_mask_pixels=3,
+            slim_index_for_sub_slim_index=slim_index_for_sub_slim_index,
+            sub_fraction=0.25,
+        )
+
+        assert mapping_matrix_sparse.nnz == 6
+        assert (mapping_matrix_sparse.toarray() == mapping_matrix).all()
+
+
+class TestSubSlimIndexesForPixelizationIndex:
+    def test__csr_offsets_and_indexes__sorted_by_pixel(self):
+
+        pixelization_index_for_sub_slim_index = np.array([2, 0, 2, 3, 0, 2])
+
+        (
+            sub_slim_indexes_for_pixelization_index,
+            sub_slim_offsets_for_pixelization_index,
+        ) = aa.util.mapper.sub_slim_indexes_for_pixelization_index_from(
+            pixelization_index_for_sub_slim_index=pixelization_index_for_sub_slim_index,
+            pixels=5,
+        )
+
+        assert (
+            sub_slim_indexes_for_pixelization_index == np.array([1, 4, 0, 2, 5, 3])
+        ).all()
+        assert (
+            sub_slim_offsets_for_pixelization_index == np.array([0, 2, 2, 5, 6, 6])
+        ).all()
+
+
 class TestPixelSignals:
     def test__x3_image_pixels_signals_1s__pixel_scale_1__pixel_signals_all_1s(self):
 
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from unittest import mock as unittest_mock
 
 import autoarray as aa
 
@@ -681,6 +682,19 @@ class TestRectangularMapper:
 
         assert (pixel_signals == pixel_signals_util).all()
 
+    def test__mapping_matrix_sparse__same_as_mapping_matrix(self, sub_grid_2d_7x7):
+
+        pixelization_grid = aa.Grid2DRectangular.overlay_grid(
+            shape_native=(3, 3), grid=sub_grid_2d_7x7
+        )
+
+        mapper = aa.Mapper(
+            source_grid_slim=sub_grid_2d_7x7, source_pixelization_grid=pixelization_grid
+        )
+
+        assert (mapper.mapping_matrix_sparse.toarray() == mapper.mapping_matrix).all()
+        assert mapper.mapping_matrix_fill_fraction == pytest.approx(4.0 / 9.0, 1.0e-4)
+
     def test__image_from_source__different_types_of_lists_input(self, sub_grid_2d_7x7):
 
         rectangular_pixelization_grid = aa.Grid2DRectangular.overlay_grid(
@@ -704,6 +718,57 @@ class TestRectangularMapper:
         assert full_indexes == [[0, 1, 2, 3], [16, 17, 18, 19]]
 
 
+    def test__pixelization_index_for_sub_slim_index__computed_once_and_stored(
+        self, sub_grid_2d_7x7
+    ):
+
+        pixelization_grid = aa.Grid2DRectangular.overlay_grid(
+            grid=sub_grid_2d_7x7, shape_native=(3, 3)
+        )
+
+        mapper = aa.Mapper(
+            source_grid_slim=sub_grid_2d_7x7,
+            source_pixelization_grid=pixelization_grid,
+            hyper_data=np.ones(sub_grid_2d_7x7.mask.pixels_in_mask),
+        )
+
+        with unittest_mock.patch.object(
+            aa.util.grid_2d,
+            "grid_pixel_indexes_2d_slim_from",
+            wraps=aa.util.grid_2d.grid_pixel_indexes_2d_slim_from,
+        ) as grid_pixel_indexes_2d_slim_from:
+
+            mapper.mapping_matrix
+            mapper.pixel_signals_from_signal_scale(signal_scale=2.0)
+            mapper.all_sub_slim_indexes_for_pixelization_index
+
+            assert grid_pixel_indexes_2d_slim_from.call_count == 1
+
+        all_sub_slim_indexes_for_pixelization_index = [[] for _ in range(mapper.pixels)]
+
+        for sub_slim_index, pix_index in enumerate(
+            mapper.pixelization_index_for_sub_slim_index
+        ):
+            all_sub_slim_indexes_for_pixelization_index[pix_index].append(
+                sub_slim_index
+            )
+
+        assert (
+            mapper.all_sub_slim_indexes_for_pixelization_index
+            == all_sub_slim_indexes_for_pixelization_index
+        )
+        assert (
+            mapper.sub_slim_offsets_for_pixelization_index
+            == np.cumsum(
+                [0]
+                + [
+                    len(sub_slim_indexes)
+                    for sub_slim_indexes in all_sub_slim_indexes_for_pixelization_index
+                ]
+            )
+        ).all()
+
+
 class TestVoronoiMapper:
     def test__grid_to_pixel_pixels_via_nearest_neighbour__case1__correct_pairs(self):
         pixel_centers = np.array([[1.0, 1.0], [-1.0, 1.0], [-1.0, -1.0], [1.0, -1.0]])
@@ -804,6 +869,63 @@ class TestVoronoiMapper:
             mapper.pixelization_index_for_sub_slim_index == sub_to_pix_nearest_neighbour
         ).all()
 
+    def test__sub_to_pix_via_kd_tree_engine__matches_graph_engine(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(20, 20), pixel_scales=0.2, radius=1.8, sub_size=2
+        )
+
+        grid = aa.Grid2D.from_mask(mask=mask)
+
+        pixelization = aa.pix.VoronoiMagnification(shape=(8, 8))
+
+        sparse_grid = pixelization.sparse_grid_from_grid(grid=grid)
+
+        mapper_graph = pixelization.mapper_from_grid_and_sparse_grid(
+            grid=grid,
+            sparse_grid=sparse_grid,
+            settings=aa.SettingsPixelization(use_border=False),
+        )
+
+        mapper_kd_tree = pixelization.mapper_from_grid_and_sparse_grid(
+            grid=grid,
+            sparse_grid=sparse_grid,
+            settings=aa.SettingsPixelization(
+                use_border=False, voronoi_nearest_pixel_engine="kd_tree"
+            ),
+        )
+
+        assert mapper_kd_tree.nearest_pixel_engine == "kd_tree"
+
+        pixelization_index_for_sub_slim_index = (
+            mapper_kd_tree.pixelization_index_for_sub_slim_index
+        )
+
+        separations = np.sum(
+            (grid[:, None, :] - np.asarray(sparse_grid)[None, :, :]) ** 2, axis=2
+        )
+
+        assert (
+            separations[
+                np.arange(grid.shape[0]), pixelization_index_for_sub_slim_index
+            ]
+            == np.min(separations, axis=1)
+        ).all()
+        assert (
+            separations[
+                np.arange(grid.shape[0]),
+                mapper_graph.pixelization_index_for_sub_slim_index,
+            ]
+            == np.min(separations, axis=1)
+        ).all()
+
+        with pytest.raises(aa.exc.PixelizationException):
+            aa.Mapper(
+                source_grid_slim=grid,
+                source_pixelization_grid=mapper_graph.source_pixelization_grid,
+                nearest_pixel_engine="walk",
+            )
+
     def test__pixel_scales___for_voronoi_mapper(self, grid_2d_7x7, image_7x7):
         pixelization_grid = aa.Grid2D.manual_slim(
             [[0.1, 0.1], [1.1, 0.1], [2.1, 0.1], [0.1, 1.1], [1.1, 1.1], [2.1, 1.1]],
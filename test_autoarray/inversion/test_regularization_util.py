@@ -528,3 +528,66 @@ class TestRegularizationWeightedMatrix:
         assert regularization_matrix == pytest.approx(
             test_regularization_matrix, 1.0e-4
         )
+
+
+class TestRegularizationMatrixSparse:
+    def test__constant__same_as_dense_regularization_matrix(self):
+
+        pixel_neighbors = np.array(
+            [
+                [1, 4, -1, -1],
+                [2, 4, 0, -1],
+                [3, 4, 5, 1],
+                [5, 2, -1, -1],
+                [5, 0, 1, 2],
+                [2, 3, 4, -1],
+            ]
+        )
+
+        pixel_neighbors_size = np.array([2, 3, 4, 2, 4, 3])
+
+        regularization_matrix = aa.util.regularization.constant_regularization_matrix_from(
+            coefficient=2.0,
+            pixel_neighbors=pixel_neighbors,
+            pixel_neighbors_size=pixel_neighbors_size,
+        )
+
+        regularization_matrix_sparse = aa.util.regularization.constant_regularization_matrix_sparse_from(
+            coefficient=2.0,
+            pixel_neighbors=pixel_neighbors,
+            pixel_neighbors_size=pixel_neighbors_size,
+        )
+
+        assert (regularization_matrix_sparse.toarray() == regularization_matrix).all()
+
+    def test__weighted__same_as_dense_regularization_matrix(self):
+
+        pixel_neighbors = np.array(
+            [
+                [1, 4, -1, -1],
+                [2, 4, 0, -1],
+                [3, 4, 5, 1],
+                [5, 2, -1, -1],
+                [5, 0, 1, 2],
+                [2, 3, 4, -1],
+            ]
+        )
+
+        pixel_neighbors_size = np.array([2, 3, 4, 2, 4, 3])
+        regularization_weight_list = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+        regularization_matrix = aa.util.regularization.weighted_regularization_matrix_from(
+            regularization_weight_list=regularization_weight_list,
+            pixel_neighbors=pixel_neighbors,
+            pixel_neighbors_size=pixel_neighbors_size,
+        )
+
+        regularization_matrix_sparse = aa.util.regularization.weighted_regularization_matrix_sparse_from(
+            regularization_weight_list=regularization_weight_list,
+            pixel_neighbors=pixel_neighbors,
+            pixel_neighbors_size=pixel_neighbors_size,
+        )
+
+        assert regularization_matrix_sparse.toarray() == pytest.approx(
+            regularization_matrix, 1.0e-10
+        )
@@ -1,8 +1,10 @@
 import os
 from os import path
 import numpy as np
+import pickle
 import pytest
 import shutil
+from unittest import mock
 
 import autoarray as aa
 from autoarray import exc
@@ -885,6 +887,71 @@ class TestRegions:
         )
 
 
+class TestIndexes:
+    def test__indexes_computed_once_and_shared_by_views(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(9, 9), pixel_scales=1.0, radius=3.0, sub_size=2
+        )
+
+        with mock.patch.object(
+            aa.util.mask_2d,
+            "edge_1d_indexes_from",
+            wraps=aa.util.mask_2d.edge_1d_indexes_from,
+        ) as edge_1d_indexes_from:
+
+            edge_1d_indexes = mask._edge_1d_indexes
+
+            mask._edge_1d_indexes
+            mask.edge_mask
+            mask.view(aa.Mask2D)._edge_1d_indexes
+            mask[:]._edge_2d_indexes
+
+            assert edge_1d_indexes_from.call_count == 1
+
+            inverted_mask = np.invert(mask)
+
+            assert inverted_mask.indexes is not mask.indexes
+
+            inverted_mask._edge_1d_indexes
+
+            assert edge_1d_indexes_from.call_count == 2
+
+        assert (
+            edge_1d_indexes == aa.util.mask_2d.edge_1d_indexes_from(mask_2d=mask)
+        ).all()
+
+    def test__indexes_reset_for_new_sub_size_and_pickled_with_mask(self):
+
+        mask = aa.Mask2D.circular(
+            shape_native=(9, 9), pixel_scales=1.0, radius=3.0, sub_size=2
+        )
+
+        slim_index_for_sub_slim_index = mask._slim_index_for_sub_slim_index
+
+        assert slim_index_for_sub_slim_index.shape[0] == 4 * mask.pixels_in_mask
+
+        mask_sub_1 = mask.view(aa.Mask2D)
+        mask_sub_1.sub_size = 1
+
+        assert mask_sub_1._slim_index_for_sub_slim_index.shape[0] == (
+            mask.pixels_in_mask
+        )
+
+        mask = pickle.loads(pickle.dumps(mask))
+
+        assert len(mask.indexes.entries) == 2
+
+        with mock.patch.object(
+            aa.util.mask_2d,
+            "slim_index_for_sub_slim_index_via_mask_2d_from",
+        ) as slim_index_for_sub_slim_index_via_mask_2d_from:
+
+            mask._slim_index_for_sub_slim_index
+
+            assert slim_index_for_sub_slim_index_via_mask_2d_from.call_count == 0
+
+
 class TestZoom:
     def test__odd_sized_false_mask__centre_is_0_0__pixels_from_centre_are_0_0(self):
 
@@ -1,5 +1,8 @@
+from os import path
+
 import numpy as np
 import pytest
+from scipy import sparse
 
 import autoarray as aa
 from autoarray import exc
@@ -1043,6 +1046,70 @@ def test__convolve_mapping_matrix__asymetric_convolver__matrix_blurred_correctly
     )
 
 
+def test__convolve_mapping_matrix_sparse__same_as_dense_convolution():
+
+    mask = aa.Mask2D.circular(
+        shape_native=(20, 20), pixel_scales=(1.0, 1.0), sub_size=1, radius=6.0
+    )
+
+    kernel = aa.Kernel2D.manual_native(
+        array=np.arange(25).reshape(5, 5), pixel_scales=1.0
+    )
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel)
+
+    mapping = np.zeros((mask.pixels_in_mask, 4))
+    mapping[::3, 0] = 1.0
+    mapping[1::5, 1] = 0.5
+    mapping[2::7, 2] = 0.25
+    mapping[10, 3] = 1.0
+
+    blurred_mapping = convolver.convolve_mapping_matrix(mapping)
+
+    blurred_mapping_sparse = convolver.convolve_mapping_matrix_sparse(
+        sparse.csr_matrix(mapping)
+    )
+
+    assert sparse.isspmatrix_csr(blurred_mapping_sparse)
+    assert blurred_mapping_sparse.toarray() == pytest.approx(blurred_mapping, 1.0e-4)
+
+
+def test__convolve_mapping_matrix_parallel__same_as_serial_convolution():
+
+    mask = aa.Mask2D.circular(
+        shape_native=(20, 20), pixel_scales=(1.0, 1.0), sub_size=1, radius=6.0
+    )
+
+    kernel = aa.Kernel2D.manual_native(
+        array=np.arange(25).reshape(5, 5), pixel_scales=1.0
+    )
+
+    mapping = np.zeros((mask.pixels_in_mask, 4))
+    mapping[::3, 0] = 1.0
+    mapping[1::5, 1] = 0.5
+    mapping[2::7, 2] = 0.25
+    mapping[10, 3] = 1.0
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel)
+
+    blurred_mapping = convolver.convolve_mapping_matrix(mapping)
+    blurred_mapping_parallel = convolver.convolve_mapping_matrix(
+        mapping, parallel=True
+    )
+
+    assert (blurred_mapping_parallel == blurred_mapping).all()
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel, parallel=True)
+
+    assert (convolver.convolve_mapping_matrix(mapping) == blurred_mapping).all()
+
+
+def test__parallel_jit_functions__compiled_with_numba_parallel():
+
+    assert aa.Convolver.convolve_parallel_jit.targetoptions["parallel"]
+    assert aa.Convolver.convolve_matrix_parallel_jit.targetoptions["parallel"]
+
+
 def test__convolution__cross_mask_with_blurring_entries__returns_array():
 
     cross_mask = aa.Mask2D.manual(
@@ -1120,3 +1187,207 @@ def test__compare_to_full_2d_convolution():
     )
 
     assert blurred_masked_image_via_scipy == pytest.approx(blurred_masked_im_1, 1e-4)
+
+
+def test__convolve_image_parallel__same_as_serial_convolution():
+
+    mask = aa.Mask2D.circular(
+        shape_native=(30, 30), pixel_scales=(1.0, 1.0), sub_size=1, radius=4.0
+    )
+    kernel = aa.Kernel2D.manual_native(
+        array=np.arange(49).reshape(7, 7), pixel_scales=1.0
+    )
+    image = aa.Array2D.manual_native(
+        array=np.arange(900).reshape(30, 30), pixel_scales=1.0
+    )
+
+    masked_image = aa.Array2D.manual_mask(array=image.native, mask=mask)
+
+    blurring_mask = mask.blurring_mask_from_kernel_shape(
+        kernel_shape_native=kernel.shape_native
+    )
+
+    blurring_image = aa.Array2D.manual_mask(array=image.native, mask=blurring_mask)
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel)
+
+    blurred_image = convolver.convolve_image(
+        image=masked_image, blurring_image=blurring_image
+    )
+    blurred_image_parallel = convolver.convolve_image(
+        image=masked_image, blurring_image=blurring_image, parallel=True
+    )
+
+    assert (blurred_image_parallel == blurred_image).all()
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel, parallel=True)
+
+    blurred_image_parallel = convolver.convolve_image(
+        image=masked_image, blurring_image=blurring_image
+    )
+
+    assert (blurred_image_parallel == blurred_image).all()
+
+
+def test__use_fft__chosen_by_kernel_size():
+
+    mask = aa.Mask2D.circular(
+        shape_native=(30, 30), pixel_scales=(1.0, 1.0), sub_size=1, radius=4.0
+    )
+
+    convolver = aa.Convolver(
+        mask=mask, kernel=aa.Kernel2D.ones(shape_native=(3, 3), pixel_scales=1.0)
+    )
+
+    assert convolver.use_fft is False
+
+    convolver = aa.Convolver(
+        mask=mask, kernel=aa.Kernel2D.ones(shape_native=(21, 21), pixel_scales=1.0)
+    )
+
+    assert convolver.use_fft is True
+    assert convolver._image_frames is None
+
+
+def test__convolve_image_and_mapping_matrix_fft__same_as_frame_convolution():
+
+    mask = aa.Mask2D.circular(
+        shape_native=(30, 30), pixel_scales=(1.0, 1.0), sub_size=1, radius=4.0
+    )
+    kernel = aa.Kernel2D.manual_native(
+        array=np.arange(49).reshape(7, 7), pixel_scales=1.0
+    )
+    image = aa.Array2D.manual_native(
+        array=np.arange(900).reshape(30, 30), pixel_scales=1.0
+    )
+
+    masked_image = aa.Array2D.manual_mask(array=image.native, mask=mask)
+
+    blurring_mask = mask.blurring_mask_from_kernel_shape(
+        kernel_shape_native=kernel.shape_native
+    )
+
+    blurring_image = aa.Array2D.manual_mask(array=image.native, mask=blurring_mask)
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel, use_fft=False)
+    convolver_fft = aa.Convolver(mask=mask, kernel=kernel, use_fft=True)
+
+    blurred_image = convolver.convolve_image(
+        image=masked_image, blurring_image=blurring_image
+    )
+    blurred_image_fft = convolver_fft.convolve_image(
+        image=masked_image, blurring_image=blurring_image
+    )
+
+    assert blurred_image_fft == pytest.approx(blurred_image, 1.0e-8)
+
+    mapping = np.zeros((mask.pixels_in_mask, 4))
+    mapping[::3, 0] = 1.0
+    mapping[1::5, 1] = 0.5
+    mapping[2::7, 2] = 0.25
+    mapping[10, 3] = 1.0
+
+    blurred_mapping = convolver.convolve_mapping_matrix(mapping)
+    blurred_mapping_fft = convolver_fft.convolve_mapping_matrix(mapping)
+
+    assert blurred_mapping_fft == pytest.approx(blurred_mapping, abs=1.0e-8)
+
+
+def test__convolve_mapping_matrix_sparse_fft__same_as_frame_convolution__frames_not_computed():
+
+    mask = aa.Mask2D.circular(
+        shape_native=(30, 30), pixel_scales=(1.0, 1.0), sub_size=1, radius=4.0
+    )
+    kernel = aa.Kernel2D.manual_native(
+        array=np.arange(1, 50).reshape(7, 7), pixel_scales=1.0
+    )
+
+    mapping = np.zeros((mask.pixels_in_mask, 4))
+    mapping[::3, 0] = 1.0
+    mapping[1::5, 1] = 0.5
+    mapping[2::7, 2] = 0.25
+    mapping[10, 3] = 1.0
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel, use_fft=False)
+
+    blurred_mapping = convolver.convolve_mapping_matrix(mapping)
+
+    convolver_fft = aa.Convolver(mask=mask, kernel=kernel, use_fft=True)
+    convolver_fft.fft_batch_size = 3
+
+    blurred_mapping_sparse = convolver_fft.convolve_mapping_matrix_sparse(
+        sparse.csr_matrix(mapping)
+    )
+
+    assert sparse.isspmatrix_csr(blurred_mapping_sparse)
+    assert blurred_mapping_sparse.toarray() == pytest.approx(
+        blurred_mapping, abs=1.0e-8
+    )
+    assert blurred_mapping_sparse.nnz == np.count_nonzero(blurred_mapping)
+
+    assert convolver_fft._image_frames is None
+    assert convolver_fft._blurring_frames is None
+    assert convolver_fft._convolution_matrix_sparse is None
+
+
+def test__cache_path__frames_stored_and_loaded_from_cache(tmp_path):
+
+    cache_path = path.join(str(tmp_path), "convolver")
+
+    mask = aa.Mask2D.circular(
+        shape_native=(30, 30), pixel_scales=(1.0, 1.0), sub_size=1, radius=4.0
+    )
+    kernel = aa.Kernel2D.manual_native(
+        array=np.arange(49).reshape(7, 7), pixel_scales=1.0
+    )
+
+    convolver = aa.Convolver(mask=mask, kernel=kernel)
+
+    convolver_cache = aa.Convolver(mask=mask, kernel=kernel, cache_path=cache_path)
+
+    assert path.exists(
+        path.join(cache_path, convolver.cache_key, "image_frame_1d_indexes.npy")
+    )
+
+    convolver_cache = aa.Convolver(mask=mask, kernel=kernel, cache_path=cache_path)
+
+    assert isinstance(convolver_cache.image_frame_1d_indexes, np.memmap)
+    assert (
+        convolver_cache.image_frame_1d_indexes == convolver.image_frame_1d_indexes
+    ).all()
+    assert (
+        convolver_cache.image_frame_1d_kernels == convolver.image_frame_1d_kernels
+    ).all()
+    assert (
+        convolver_cache.blurring_frame_1d_lengths
+        == convolver.blurring_frame_1d_lengths
+    ).all()
+
+    image = aa.Array2D.manual_native(
+        array=np.arange(900).reshape(30, 30), pixel_scales=1.0
+    )
+
+    masked_image = aa.Array2D.manual_mask(array=image.native, mask=mask)
+
+    blurring_mask = mask.blurring_mask_from_kernel_shape(
+        kernel_shape_native=kernel.shape_native
+    )
+
+    blurring_image = aa.Array2D.manual_mask(array=image.native, mask=blurring_mask)
+
+    assert (
+        convolver_cache.convolve_image(
+            image=masked_image, blurring_image=blurring_image
+        )
+        == convolver.convolve_image(image=masked_image, blurring_image=blurring_image)
+    ).all()
+
+    mask_sub_2 = aa.Mask2D.circular(
+        shape_native=(30, 30), pixel_scales=(1.0, 1.0), sub_size=2, radius=4.0
+    )
+
+    convolver_sub_2 = aa.Convolver(
+        mask=mask_sub_2, kernel=kernel, cache_path=cache_path
+    )
+
+    assert convolver_sub_2.cache_key != convolver.cache_key
@@ -1,3 +1,5 @@
+from os import path
+
 import autoarray as aa
 
 import numpy as np
@@ -325,6 +327,152 @@ class TestVisiblitiesMappingMatrix:
         assert (transformed_mapping_matrix_preload == transformed_mapping_matrix).all()
 
 
+class TestPreloadChunks:
+    def test__preload_transforms__same_as_real_and_imag_preloads(self):
+
+        uv_wavelengths = np.array([[0.2, 1.0], [0.5, 1.1], [0.8, 1.2]])
+        grid_radians = np.array([[0.1, 0.2], [0.3, 0.4], [-0.2, 0.5]])
+
+        preloaded_reals, preloaded_imags = aa.util.transformer.preload_transforms(
+            grid_radians=grid_radians, uv_wavelengths=uv_wavelengths
+        )
+
+        assert (
+            preloaded_reals
+            == aa.util.transformer.preload_real_transforms(
+                grid_radians=grid_radians, uv_wavelengths=uv_wavelengths
+            )
+        ).all()
+        assert (
+            preloaded_imags
+            == aa.util.transformer.preload_imag_transforms(
+                grid_radians=grid_radians, uv_wavelengths=uv_wavelengths
+            )
+        ).all()
+
+    def test__chunked_preload__same_as_single_chunk(self):
+
+        uv_wavelengths = np.array(
+            [[0.2, 1.0], [0.5, 1.1], [0.8, 1.2], [0.1, -0.4], [-0.6, 0.3]]
+        )
+        grid_radians = aa.Grid2D.manual_native(
+            grid=[[[0.1, 0.2], [0.3, 0.4], [-0.2, 0.5]]], pixel_scales=1.0
+        )
+        real_space_mask = MockRealSpaceMask(grid=grid_radians)
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=real_space_mask
+        )
+
+        transformer_chunked = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            preload_chunk_bytes=2 * 3 * 8 * 2,
+        )
+
+        assert transformer.preload_chunk_size > 5
+        assert transformer_chunked.preload_chunk_size == 2
+        assert len(transformer_chunked.preload_chunks) == 3
+        assert (
+            transformer_chunked.preload_real_transforms
+            == transformer.preload_real_transforms
+        ).all()
+        assert (
+            transformer_chunked.preload_imag_transforms
+            == transformer.preload_imag_transforms
+        ).all()
+
+        image = aa.Array2D.manual_native([[2.0, 6.0, -1.0]], pixel_scales=1.0)
+
+        assert (
+            transformer_chunked.visibilities_from_image(image=image)
+            == transformer.visibilities_from_image(image=image)
+        ).all()
+
+        mapping_matrix = np.array([[3.0, 5.0], [1.0, 2.0], [0.0, 1.0]])
+
+        assert (
+            transformer_chunked.transformed_mapping_matrix_from_mapping_matrix(
+                mapping_matrix=mapping_matrix
+            )
+            == transformer.transformed_mapping_matrix_from_mapping_matrix(
+                mapping_matrix=mapping_matrix
+            )
+        ).all()
+
+    def test__preload_dtype_float32__close_to_float64(self):
+
+        uv_wavelengths = np.array([[0.2, 1.0], [0.5, 1.1], [0.8, 1.2]])
+        grid_radians = aa.Grid2D.manual_native(
+            grid=[[[0.1, 0.2], [0.3, 0.4]]], pixel_scales=1.0
+        )
+        real_space_mask = MockRealSpaceMask(grid=grid_radians)
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=real_space_mask
+        )
+
+        transformer_float32 = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            preload_dtype="float32",
+        )
+
+        assert transformer_float32.preload_real_transforms.dtype == np.float32
+        assert transformer_float32.preload_imag_transforms.dtype == np.float32
+
+        image = aa.Array2D.manual_native([[2.0, 6.0]], pixel_scales=1.0)
+
+        assert transformer_float32.visibilities_from_image(
+            image=image
+        ) == pytest.approx(transformer.visibilities_from_image(image=image), 1.0e-6)
+
+    def test__preload_path__stored_and_loaded_as_memory_map(self, tmp_path):
+
+        preload_path = path.join(str(tmp_path), "dft_cache")
+
+        uv_wavelengths = np.array([[0.2, 1.0], [0.5, 1.1], [0.8, 1.2]])
+        grid_radians = aa.Grid2D.manual_native(
+            grid=[[[0.1, 0.2], [0.3, 0.4]]], pixel_scales=1.0
+        )
+        real_space_mask = MockRealSpaceMask(grid=grid_radians)
+
+        transformer = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=real_space_mask
+        )
+
+        transformer_memmap = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            preload_path=preload_path,
+            preload_chunk_bytes=1,
+        )
+
+        assert isinstance(transformer_memmap.preload_real_transforms, np.memmap)
+        assert path.exists(
+            path.join(
+                preload_path, f"dft_real_{transformer_memmap.preload_cache_key}.npy"
+            )
+        )
+        assert (
+            transformer_memmap.preload_real_transforms
+            == transformer.preload_real_transforms
+        ).all()
+
+        transformer_memmap = aa.TransformerDFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            preload_path=preload_path,
+        )
+
+        image = aa.Array2D.manual_native([[2.0, 6.0]], pixel_scales=1.0)
+
+        assert (
+            transformer_memmap.visibilities_from_image(image=image)
+            == transformer.visibilities_from_image(image=image)
+        ).all()
+
+
 class TestTransformerNUFFT:
     def test__visibilities_from_image__same_as_direct__include_numerics(self):
 
@@ -400,3 +548,89 @@ class TestTransformerNUFFT:
         assert transformed_mapping_matrix_nufft[0, 0] == pytest.approx(
             25.02317 + 0.0j, 1.0e-4
         )
+
+    def test__transformed_mapping_matrix__same_as_visibilities_of_each_column(self):
+
+        uv_wavelengths = np.array([[0.2, 1.0], [0.5, 1.1], [0.8, 1.2]])
+
+        real_space_mask = aa.Mask2D.circular(
+            shape_native=(7, 7), pixel_scales=0.005, radius=0.015
+        )
+
+        mapping_matrix = np.zeros(shape=(real_space_mask.pixels_in_mask, 3))
+        mapping_matrix[::2, 0] = 1.0
+        mapping_matrix[1::3, 1] = 0.5
+        mapping_matrix[4, 2] = 1.0
+
+        transformer_nufft = aa.TransformerNUFFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=real_space_mask
+        )
+        transformer_nufft.batch_size = 2
+
+        transformed_mapping_matrix = transformer_nufft.transformed_mapping_matrix_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        )
+
+        for source_pixel_1d_index in range(mapping_matrix.shape[1]):
+
+            image = aa.Array2D.manual_mask(
+                array=mapping_matrix[:, source_pixel_1d_index],
+                mask=real_space_mask.mask_sub_1,
+            )
+
+            visibilities = transformer_nufft.visibilities_from_image(image=image)
+
+            assert transformed_mapping_matrix[
+                :, source_pixel_1d_index
+            ] == pytest.approx(visibilities, 1.0e-8)
+
+    def test__plan_cache__identical_transformers_reuse_plan(self, tmp_path):
+
+        plan_path = path.join(str(tmp_path), "nufft_plans")
+
+        aa.TransformerNUFFT.plan_cache.clear()
+
+        uv_wavelengths = np.array([[0.2, 1.0], [0.5, 1.1], [0.8, 1.2]])
+
+        real_space_mask = aa.Mask2D.unmasked(shape_native=(5, 5), pixel_scales=0.005)
+
+        image = aa.Array2D.ones(shape_native=(5, 5), pixel_scales=0.005)
+
+        transformer = aa.TransformerNUFFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            plan_path=plan_path,
+        )
+
+        key = transformer.plan_cache_key_from(ratio=2, interp_kernel=(6, 6))
+
+        assert list(aa.TransformerNUFFT.plan_cache.keys()) == [key]
+        assert path.exists(path.join(plan_path, f"nufft_plan_{key}.pickle"))
+
+        transformer_cached = aa.TransformerNUFFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=real_space_mask
+        )
+
+        assert transformer_cached.sp is transformer.sp
+        assert transformer_cached.volume is not transformer.volume
+
+        aa.TransformerNUFFT.plan_cache.clear()
+
+        transformer_from_file = aa.TransformerNUFFT(
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            plan_path=plan_path,
+        )
+
+        assert transformer_from_file.sp is not transformer.sp
+        assert (
+            transformer_from_file.visibilities_from_image(image=image.native)
+            == transformer.visibilities_from_image(image=image.native)
+        ).all()
+
+        transformer_new_uv = aa.TransformerNUFFT(
+            uv_wavelengths=2.0 * uv_wavelengths, real_space_mask=real_space_mask
+        )
+
+        assert transformer_new_uv.sp is not transformer.sp
+        assert len(aa.TransformerNUFFT.plan_cache) == 2
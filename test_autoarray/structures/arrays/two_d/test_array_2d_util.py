@@ -1,3 +1,4 @@
+import autoarray as aa
 from autoarray import util
 
 import os
@@ -25,11 +26,10 @@ class TestMemoizer:
         func(2)
         func(1)
 
-        assert memoizer.results == {
-            "('arg', 1)": "result for 1",
-            "('arg', 2)": "result for 2",
-        }
+        assert list(memoizer.results.values()) == ["result for 2", "result for 1"]
         assert memoizer.calls == 2
+        assert memoizer.hits == 1
+        assert memoizer.misses == 2
 
     def test_multiple_arguments(self, memoizer):
         @memoizer
@@ -40,10 +40,7 @@ class TestMemoizer:
         func(2, 1)
         func(1, 2)
 
-        assert memoizer.results == {
-            "('arg1', 1), ('arg2', 2)": 2,
-            "('arg1', 2), ('arg2', 1)": 2,
-        }
+        assert list(memoizer.results.values()) == [2, 2]
         assert memoizer.calls == 2
 
     def test_key_word_arguments(self, memoizer):
@@ -56,11 +53,7 @@ class TestMemoizer:
         func(arg1=1)
         func(arg1=1, arg2=1)
 
-        assert memoizer.results == {
-            "('arg1', 1)": 0,
-            "('arg2', 1)": 0,
-            "('arg1', 1), ('arg2', 1)": 1,
-        }
+        assert list(memoizer.results.values()) == [0, 0, 1]
         assert memoizer.calls == 3
 
     def test_key_word_for_positional(self, memoizer):
@@ -89,6 +82,104 @@ class TestMemoizer:
         assert one.method() == 1
         assert two.method() == 2
 
+    def test_arrays__keyed_on_content_not_truncated_repr(self, memoizer):
+        @memoizer
+        def func(array):
+            return np.sum(array)
+
+        array_0 = np.zeros(shape=(100, 100))
+        array_1 = np.zeros(shape=(100, 100))
+        array_1[50, 50] = 1.0
+
+        assert repr(array_0) == repr(array_1)
+
+        assert func(array_0) == 0.0
+        assert func(array_1) == 1.0
+        assert func(np.zeros(shape=(100, 100))) == 0.0
+
+        assert memoizer.misses == 2
+        assert memoizer.hits == 1
+
+    def test_masks__keyed_on_sub_size_pixel_scales_and_origin(self, memoizer):
+        @memoizer
+        def func(mask):
+            return mask.sub_size
+
+        mask = aa.Mask2D.unmasked(shape_native=(3, 3), pixel_scales=1.0, sub_size=1)
+
+        assert func(mask) == 1
+        assert (
+            func(
+                aa.Mask2D.unmasked(shape_native=(3, 3), pixel_scales=1.0, sub_size=2)
+            )
+            == 2
+        )
+        func(aa.Mask2D.unmasked(shape_native=(3, 3), pixel_scales=2.0, sub_size=1))
+        func(
+            aa.Mask2D.unmasked(
+                shape_native=(3, 3), pixel_scales=1.0, sub_size=1, origin=(1.0, 1.0)
+            )
+        )
+        func(aa.Mask2D.unmasked(shape_native=(3, 3), pixel_scales=1.0, sub_size=1))
+
+        assert memoizer.misses == 4
+        assert memoizer.hits == 1
+
+    def test_least_recently_used_results_evicted_beyond_max_bytes(self):
+
+        memoizer = util.array_2d.Memoizer(max_bytes=2 * 80)
+
+        @memoizer
+        def func(value):
+            return np.full(shape=(10,), fill_value=value)
+
+        func(1.0)
+        func(2.0)
+        func(1.0)
+        func(3.0)
+
+        assert memoizer.total_bytes == 160
+        assert [result[0] for result in memoizer.results.values()] == [1.0, 3.0]
+
+        func(1.0)
+        func(2.0)
+
+        assert memoizer.hits == 2
+        assert memoizer.misses == 4
+
+        memoizer.clear()
+
+        assert memoizer.results == {}
+        assert memoizer.hits == 0
+        assert memoizer.total_bytes == 0
+
+    def test_array_results__edited_in_place_by_caller__stored_result_unchanged(
+        self, memoizer
+    ):
+        @memoizer
+        def func(value):
+            return (
+                np.full(shape=(3,), fill_value=value),
+                np.full(shape=(2,), fill_value=value),
+            )
+
+        first, second = func(1.0)
+
+        first[0] = 5.0
+        second[:] = 5.0
+
+        first, second = func(1.0)
+
+        assert memoizer.hits == 1
+        assert (first == np.ones(3)).all()
+        assert (second == np.ones(2)).all()
+
+        first[:] = 6.0
+
+        first, second = func(1.0)
+
+        assert (first == np.ones(3)).all()
+
 
 class TestResize:
     def test__trim__from_7x7_to_3x3(self):
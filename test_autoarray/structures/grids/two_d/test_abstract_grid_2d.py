@@ -605,3 +605,36 @@ class TestBorder:
         )
         assert (relocated_grid.mask == mask).all()
         assert relocated_grid.sub_size == 2
+
+    def test__relocations_via_kd_tree__same_as_brute_force_and_kd_tree_stored_on_mask(
+        self,
+    ):
+
+        mask = aa.Mask2D.circular_annular(
+            shape_native=(40, 40),
+            pixel_scales=(0.1, 0.1),
+            inner_radius=0.4,
+            outer_radius=1.5,
+            sub_size=2,
+        )
+
+        grid = aa.Grid2D.from_mask(mask=mask)
+
+        grid_to_relocate = aa.Grid2D(
+            grid=np.random.RandomState(seed=1).normal(
+                scale=2.0, size=(mask.pixels_in_mask * 4, 2)
+            ),
+            mask=mask,
+        )
+
+        relocated_grid = grid.relocated_grid_from_grid(grid=grid_to_relocate)
+
+        relocated_grid_via_brute_force = grid.relocated_grid_from_grid_jit(
+            grid=grid_to_relocate, border_grid=grid.sub_border_grid
+        )
+
+        assert (relocated_grid == relocated_grid_via_brute_force).all()
+
+        kd_tree_indexes, kd_tree_bounds = grid.sub_border_kd_tree
+
+        assert aa.Grid2D.from_mask(mask=mask).sub_border_kd_tree[0] is kd_tree_indexes
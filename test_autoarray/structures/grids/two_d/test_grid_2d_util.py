@@ -2140,3 +2140,48 @@ class TestGridUpscaled2d:
         assert grid_upscaled_2d[6] == pytest.approx(np.array([0.333, 0.333]), 1.0e-2)
         assert grid_upscaled_2d[7] == pytest.approx(np.array([0.333, 1.0]), 1.0e-2)
         assert grid_upscaled_2d[8] == pytest.approx(np.array([0.333, 1.666]), 1.0e-2)
+
+
+class TestKDTree:
+    def test__nearest_index__same_as_brute_force_argmin_including_ties(self):
+
+        grid_2d_slim = np.array(
+            [[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [-1.0, 0.0], [0.0, -1.0]]
+        )
+
+        grid_2d_slim = np.concatenate(
+            (grid_2d_slim, np.random.RandomState(seed=1).normal(size=(200, 2)))
+        )
+
+        kd_tree_indexes, kd_tree_bounds = aa.util.grid_2d.kd_tree_2d_from(
+            grid_2d_slim=grid_2d_slim
+        )
+
+        assert (np.sort(kd_tree_indexes) == np.arange(grid_2d_slim.shape[0])).all()
+
+        coordinates = np.concatenate(
+            (
+                np.array([[0.5, 0.5], [0.5, 0.0], [0.0, -0.5], [10.0, -10.0]]),
+                np.random.RandomState(seed=2).normal(scale=3.0, size=(500, 2)),
+            )
+        )
+
+        stack_ranges = np.zeros((128, 2), dtype="int")
+        stack_distances = np.zeros(128)
+
+        for coordinate in coordinates:
+
+            nearest_index = aa.util.grid_2d.kd_tree_2d_nearest_index_from(
+                grid_2d_slim=grid_2d_slim,
+                kd_tree_indexes=kd_tree_indexes,
+                kd_tree_bounds=kd_tree_bounds,
+                coordinate_y=coordinate[0],
+                coordinate_x=coordinate[1],
+                stack_ranges=stack_ranges,
+                stack_distances=stack_distances,
+            )
+
+            assert nearest_index == np.argmin(
+                np.square(coordinate[0] - grid_2d_slim[:, 0])
+                + np.square(coordinate[1] - grid_2d_slim[:, 1])
+            )